@@ -1,10 +1,5 @@
-from .display import TyphosDeviceDisplay
-from .func import TyphosMethodButton
-from .panel import TyphosCompositeSignalPanel, TyphosSignalPanel
-from .plugins import register_signal
-from .positioner import TyphosPositionerWidget
-from .suite import TyphosSuite
-from .utils import load_suite, patch_connect_slots, use_stylesheet
+import importlib
+
 from .version import __version__  # noqa: F401
 
 __all__ = [
@@ -19,11 +14,37 @@ __all__ = [
     "TyphosMethodButton",
 ]
 
+# The submodule of each public name.  These are imported on first access
+# (PEP 562), such that ``import typhos`` - and scripts using only, e.g.,
+# ``typhos.utils`` or the ``sig://`` plugin - do not pay for the whole GUI.
+_lazy_attributes = {
+    "use_stylesheet": "utils",
+    "register_signal": "plugins",
+    "load_suite": "utils",
+    "TyphosCompositeSignalPanel": "panel",
+    "TyphosDeviceDisplay": "display",
+    "TyphosSuite": "suite",
+    "TyphosSignalPanel": "panel",
+    "TyphosPositionerWidget": "positioner",
+    "TyphosMethodButton": "func",
+}
+
+
+def __getattr__(name):
+    module_name = _lazy_attributes.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+        globals()[name] = value
+        return value
+
+    # Submodules, such that ``typhos.display`` works following ``import typhos``
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as ex:
+        if ex.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# **NOTE** We patch QtCore.QMetaObject.connectSlotsByName to catch SystemError
-# exceptions.
-# We know this is not a good practice to do on import.  If you have a better
-# solution, do let us know.
-patch_connect_slots()
 
-del patch_connect_slots
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -67,7 +67,7 @@ KIND_FILTERS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalInfo:
     address: str
     channel: PyDMChannel
@@ -25,6 +25,30 @@ def get_qapp():
     return qapp
 
 
+def create_window(suite: TyphosSuite, initial_size: Optional[QSize] = None) -> QMainWindow:
+    """
+    Creates a main window for the suite, without showing it.
+
+    Parameters
+    ----------
+    suite : TyphosSuite
+        The suite to place in the window.
+    initial_size : QSize, optional
+        If provided, the initial size for the full suite window.
+
+    Returns
+    -------
+    window : QMainWindow
+    """
+    window = QMainWindow()
+    window.setCentralWidget(suite)
+    window.setWindowTitle(suite.windowTitle())
+    window.setUnifiedTitleAndToolBarOnMac(True)
+    if initial_size is not None:
+        window.resize(initial_size)
+    return window
+
+
 def launch_suite(suite: TyphosSuite, initial_size: Optional[QSize] = None) -> QMainWindow:
     """
     Creates a main window and execs the application.
@@ -46,12 +70,7 @@ def launch_suite(suite: TyphosSuite, initial_size: Optional[QSize] = None) -> QM
         after the application is done running. This is primarily
         useful for unit tests.
     """
-    window = QMainWindow()
-    window.setCentralWidget(suite)
-    window.setWindowTitle(suite.windowTitle())
-    window.setUnifiedTitleAndToolBarOnMac(True)
-    if initial_size is not None:
-        window.resize(initial_size)
+    window = create_window(suite, initial_size=initial_size)
     logger.info("Launching application ...")
     QTimer.singleShot(0, window.show)
     get_qapp().exec_()
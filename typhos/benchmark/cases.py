@@ -26,9 +26,25 @@ if typing.TYPE_CHECKING:
 
 
 # Define matrix of testing parameters
-Shape = namedtuple("Shape", ["num_signals", "subdevice_layers", "subdevice_spread"])
+# mix: keyword arguments for the signal composition, see make_test_device_class
+Shape = namedtuple("Shape", ["num_signals", "subdevice_layers", "subdevice_spread", "mix"], defaults=[None])
+# A mix of signals like that of production devices
+PRODUCTION_MIX = dict(
+    kinds={"hinted": 1, "normal": 3, "config": 4, "omitted": 2},
+    dtypes={"float": 8, "int": 3, "enum": 4, "string": 2, "waveform": 2, "image": 1},
+    read_only_ratio=0.4,
+    lazy_ratio=0.2,
+    variety_ratio=0.25,
+)
 # total_signals == num_signals * (subdevice_spread ** subdevice_layers)
-SHAPES = dict(flat=Shape(100, 1, 1), deep=Shape(100, 25, 1), wide=Shape(1, 1, 100), cube=Shape(4, 2, 5))
+SHAPES = dict(
+    flat=Shape(100, 1, 1),
+    deep=Shape(100, 25, 1),
+    wide=Shape(1, 1, 100),
+    cube=Shape(4, 2, 5),
+    mixed=Shape(100, 1, 1, PRODUCTION_MIX),
+    mixedcube=Shape(20, 2, 3, PRODUCTION_MIX),
+)
 
 Test = namedtuple("Test", ["signal_class", "include_prefix", "start_ioc"])
 TESTS = dict(
@@ -104,6 +120,7 @@ def make_tests():
                 num_signals=shape.num_signals,
                 subdevice_layers=shape.subdevice_layers,
                 subdevice_spread=shape.subdevice_spread,
+                **(shape.mix or {}),
             )
             classes[cls_name] = cls
 
@@ -5,18 +5,136 @@ These are meant to be used for targetted benchmarking and typically are
 "extreme" in both size and in composition in order to make specific
 loading issues more obvious.
 
-Note that this currently only supports devices with uniform signals.
-In the future it can be expanded to have Kind information, different
-data types to test different widget types, etc.
+By default, devices have uniform signals.  Distributions of kinds, data
+types, read-only and lazy signals, and "variety" metadata may be given to
+exercise the different widget paths hit by production devices.  The data
+type of each EPICS signal is recorded on its component for
+:mod:`typhos.benchmark.ioc` to serve.
 """
 
+from __future__ import annotations
+
+import copy
+import random
+from typing import Dict, List, Optional
+
+import numpy as np
 from ophyd.device import Component as Cpt
 from ophyd.device import create_device_from_components as create_device
-from ophyd.signal import Signal
+from ophyd.signal import EpicsSignalBase, EpicsSignalRO, Signal, SignalRO
+from ophyd.sim import EnumSignal
+
+#: Supported signal data types
+DTYPES = ("float", "int", "enum", "string", "waveform", "image")
+ENUM_STRINGS = ("Out", "In", "Unknown")
+WAVEFORM_LENGTH = 100
+IMAGE_SHAPE = (32, 32)
+
+#: Variety metadata given to signals of each data type, in the expanded form
+#: that ``pcdsdevices.variety.set_metadata`` stores on components
+VARIETY_METADATA = {
+    "float": {
+        "variety": "scalar-tweakable",
+        "delta": {"value": 0.5, "range": [-1, 1], "source": "value"},
+        "range": {"value": [-10, 10], "source": "value"},
+    },
+    "int": {"variety": "scalar"},
+    "enum": {"variety": "enum"},
+    "string": {"variety": "text"},
+    "waveform": {"variety": "array-timeseries"},
+    "image": {"variety": "array-image", "shape": IMAGE_SHAPE},
+}
+
+_SOFT_VALUES = {
+    "float": 0.0,
+    "int": 0,
+    "enum": 0,
+    "string": "text",
+    "waveform": np.zeros(WAVEFORM_LENGTH),
+    "image": np.zeros(IMAGE_SHAPE),
+}
+
+
+def get_signal_dtype(cpt: Cpt) -> Optional[str]:
+    """Get the data type of a generated signal component, one of :data:`DTYPES`."""
+    return getattr(cpt, "_benchmark_dtype", None)
+
+
+def _spread(weights: Optional[Dict[object, float]], count: int, rng: random.Random) -> List[object]:
+    """
+    Assign ``count`` items to the keys of ``weights`` in proportion.
+
+    The counts are rounded by largest remainder, such that the proportions
+    hold even for few items, and the order is shuffled.
+    """
+    if not weights:
+        return [None] * count
+
+    total = sum(weights.values())
+    exact = {key: count * weight / total for key, weight in weights.items()}
+    counts = {key: int(value) for key, value in exact.items()}
+    by_remainder = sorted(exact, key=lambda key: exact[key] - counts[key], reverse=True)
+    for key in by_remainder[: count - sum(counts.values())]:
+        counts[key] += 1
+
+    items = [key for key, num in counts.items() for _ in range(num)]
+    rng.shuffle(items)
+    return items
+
+
+def _make_signal_component(
+    signal_class: type,
+    suffix: Optional[str],
+    kind: Optional[str],
+    dtype: Optional[str],
+    read_only: bool,
+    lazy: bool,
+    variety: bool,
+) -> Cpt:
+    """Make a single signal component of the given composition."""
+    is_epics = issubclass(signal_class, EpicsSignalBase)
+    kwargs = {}
+    if kind is not None:
+        kwargs["kind"] = kind
+    if lazy:
+        kwargs["lazy"] = True
+
+    if is_epics:
+        if read_only:
+            signal_class = EpicsSignalRO
+        if dtype == "string":
+            kwargs["string"] = True
+    elif dtype == "enum":
+        # Soft enums are always writable
+        signal_class = EnumSignal
+        kwargs["enum_strings"] = ENUM_STRINGS
+    elif read_only:
+        signal_class = SignalRO
+
+    if dtype is not None and not is_epics:
+        kwargs["value"] = _SOFT_VALUES[dtype]
+
+    args = (suffix,) if suffix is not None else ()
+    cpt = Cpt(signal_class, *args, **kwargs)
+    cpt._benchmark_dtype = dtype
+    if variety and dtype is not None:
+        cpt._variety_metadata = copy.deepcopy(VARIETY_METADATA[dtype])
+    return cpt
 
 
 def make_test_device_class(
-    name="TestClass", signal_class=Signal, include_prefix=False, num_signals=10, subdevice_layers=0, subdevice_spread=0
+    name="TestClass",
+    signal_class=Signal,
+    include_prefix=False,
+    num_signals=10,
+    subdevice_layers=0,
+    subdevice_spread=0,
+    kinds=None,
+    dtypes=None,
+    read_only_ratio=0.0,
+    lazy_ratio=0.0,
+    variety_ratio=0.0,
+    seed=0,
 ):
     """
     Creates a test :class:`ophyd.Device` subclass.
@@ -57,14 +175,45 @@ def make_test_device_class(
         The number of subdevices to include in each layer.
         Has no effect if subdevice_layers is 0.
         Defaults to 0
+
+    kinds : dict, optional
+        The relative weights of the signal kinds, e.g.
+        ``{"hinted": 1, "normal": 3, "config": 4, "omitted": 2}``.
+        Defaults to the ophyd default kind for all signals.
+
+    dtypes : dict, optional
+        The relative weights of the signal data types, of :data:`DTYPES`.
+        EPICS images are served as flat waveforms, and so are only shown as
+        images with variety metadata.  Defaults to untyped signals.
+
+    read_only_ratio : float, optional
+        The fraction of read-only signals.  Soft enums are always writable.
+        Defaults to 0.
+
+    lazy_ratio : float, optional
+        The fraction of lazy components.  Defaults to 0.
+
+    variety_ratio : float, optional
+        The fraction of typed signals with the :data:`VARIETY_METADATA` of
+        their data type.  Defaults to 0.
+
+    seed : int, optional
+        The seed for the order in which the distributions are assigned to
+        signals, such that the same arguments give the same class.
     """
+    rng = random.Random(seed)
+    compositions = zip(
+        _spread(kinds, num_signals, rng),
+        _spread(dtypes, num_signals, rng),
+        _spread({True: read_only_ratio, False: 1.0 - read_only_ratio}, num_signals, rng),
+        _spread({True: lazy_ratio, False: 1.0 - lazy_ratio}, num_signals, rng),
+        _spread({True: variety_ratio, False: 1.0 - variety_ratio}, num_signals, rng),
+        strict=True,
+    )
     signals = {}
-    for nsig in range(num_signals):
-        if include_prefix:
-            sig_cpt = Cpt(signal_class, f"SIGPV{nsig}")
-        else:
-            sig_cpt = Cpt(signal_class)
-        signals[f"signum{nsig}"] = sig_cpt
+    for nsig, (kind, dtype, read_only, lazy, variety) in enumerate(compositions):
+        suffix = f"SIGPV{nsig}" if include_prefix else None
+        signals[f"signum{nsig}"] = _make_signal_component(signal_class, suffix, kind, dtype, read_only, lazy, variety)
 
     SignalHolder = create_device("SignalHolder", **signals)
 
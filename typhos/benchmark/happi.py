@@ -0,0 +1,132 @@
+"""
+happi item lookup benchmarks.
+
+These compare looking up items in a large happi JSON database, as a new
+``typhos`` process would, with a fresh :class:`happi.Client` per launch and
+with the typhos happi item cache.  The database is made by scaling the test
+suite's ``happi.json`` up to the requested number of entries.  They may be
+run on their own with the following:
+
+```
+python -m typhos.benchmark.happi [num_entries]
+```
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from happi import Client
+
+from .. import utils
+from ..cache import _GlobalHappiItemCache
+
+TEST_DATABASE = utils.MODULE_PATH / "tests" / "happi.json"
+
+
+def make_database(path: pathlib.Path, count: int = 10_000) -> List[str]:
+    """
+    Write a happi JSON database of ``count`` entries to ``path``.
+
+    Entries are copies of those in the test database with unique names.
+
+    Returns
+    -------
+    names : list of str
+        The names of all items in the database.
+    """
+    with open(TEST_DATABASE) as fp:
+        templates = list(json.load(fp).values())
+
+    database = {}
+    for idx in range(count):
+        entry = dict(templates[idx % len(templates)])
+        entry["name"] = f"{entry['name']}_{idx}"
+        entry["_id"] = f"{entry['_id']}_{idx}"
+        database[entry["_id"]] = entry
+
+    with open(path, "w") as fp:
+        json.dump(database, fp, indent=4)
+    return [entry["name"] for entry in database.values()]
+
+
+def measure_launch_time(
+    path: pathlib.Path,
+    names: List[str],
+    cache_dir: Optional[pathlib.Path] = None,
+    count: int = 5,
+) -> float:
+    """
+    Measure the average time in seconds to look up ``names`` in a new client.
+
+    Each launch uses a new client and, if ``cache_dir`` is given, a new item
+    cache reading from that directory, as a new process would.
+    """
+    elapsed = 0.0
+    for _ in range(count):
+        t0 = time.perf_counter()
+        client = Client(path=str(path))
+        if cache_dir is None:
+            for name in names:
+                client.find_item(name=name)
+        else:
+            cache = _GlobalHappiItemCache(cache_dir=cache_dir)
+            for name in names:
+                cache.find_item(client, name)
+            # As a launch would at exit
+            cache.flush()
+        elapsed += time.perf_counter() - t0
+    return elapsed / count
+
+
+def happi_lookup_report(entries: int = 10_000, lookups: int = 3, count: int = 5) -> Dict[str, float]:
+    """
+    Report the launch lookup time with and without the happi item cache.
+
+    The on-disk cache is populated by a single launch prior to measuring, as
+    it would be by the first launch after the database is modified.
+
+    Parameters
+    ----------
+    entries : int, optional
+        The number of entries in the database.
+
+    lookups : int, optional
+        The number of items looked up per launch.
+
+    count : int, optional
+        The number of launches per method.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{"uncached": seconds, "cached": seconds}``.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        path = tmpdir / "happi.json"
+        names = make_database(path, entries)[-lookups:]
+        cache_dir = tmpdir / "cache"
+        measure_launch_time(path, names, cache_dir=cache_dir, count=1)
+        return {
+            "uncached": measure_launch_time(path, names, count=count),
+            "cached": measure_launch_time(path, names, cache_dir=cache_dir, count=count),
+        }
+
+
+def print_report(report: Dict[str, float]) -> None:
+    """Print a report from :func:`happi_lookup_report`."""
+    print(f"{'uncached (ms)':>14} {'cached (ms)':>12} {'speedup':>8}")
+    print(
+        f"{report['uncached'] * 1e3:>14.2f} {report['cached'] * 1e3:>12.2f} "
+        f"{report['uncached'] / report['cached']:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    print_report(happi_lookup_report(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
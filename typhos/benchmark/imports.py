@@ -0,0 +1,166 @@
+"""
+Import time benchmarks.
+
+These import typhos modules in fresh interpreters with ``python -X
+importtime`` and report the total time along with the slowest of the modules
+imported along the way.  They may be run on their own with the following:
+
+```
+python -m typhos.benchmark.imports [module ...]
+```
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+DEFAULT_MODULES = [
+    "typhos",
+    "typhos.utils",
+    "typhos.plugins.core",
+    "typhos.display",
+    "typhos.suite",
+    "typhos.cli",
+]
+
+
+class ImportRecord(NamedTuple):
+    """A single line of ``-X importtime`` output, with times in seconds."""
+
+    name: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse the output of ``python -X importtime``.
+
+    Lines are of the form ``import time: self [us] | cumulative | name``,
+    with the nesting depth of the import given by the indentation of the
+    name.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            self_time = int(self_us) * 1e-6
+            cumulative_time = int(cumulative_us) * 1e-6
+        except ValueError:
+            # The header line
+            continue
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped.rstrip(), self_time, cumulative_time, depth))
+    return records
+
+
+def measure_import(module: str, count: int = 3) -> List[ImportRecord]:
+    """
+    Import ``module`` in ``count`` fresh interpreters.
+
+    Returns
+    -------
+    records : list of ImportRecord
+        The records of the fastest import.
+    """
+    best = None
+    for _ in range(count):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        records = parse_importtime(result.stderr)
+        total = get_total_time(records, module)
+        if best is None or total < get_total_time(best, module):
+            best = records
+    return best
+
+
+def _get_parent_names(module: str) -> set:
+    """Get the names of ``module`` and its parent packages."""
+    parts = module.split(".")
+    return {".".join(parts[: idx + 1]) for idx in range(len(parts))}
+
+
+def get_total_time(records: List[ImportRecord], module: str) -> float:
+    """Get the total time taken to import ``module``, including its parents."""
+    # Parent packages are imported first, at the top level
+    names = _get_parent_names(module)
+    return sum(record.cumulative_time for record in records if record.depth == 0 and record.name in names)
+
+
+def get_imported_records(records: List[ImportRecord], module: str) -> List[ImportRecord]:
+    """
+    Get the records of ``module``, its parents, and everything they import.
+
+    This leaves out modules imported during interpreter startup.
+    """
+    names = _get_parent_names(module)
+    imported = []
+    pending = []
+    for record in records:
+        # Nested imports are listed prior to the module importing them
+        pending.append(record)
+        if record.depth == 0:
+            if record.name in names:
+                imported.extend(pending)
+            pending = []
+    return imported
+
+
+def import_time_report(
+    modules: Optional[List[str]] = None,
+    count: int = 3,
+    top: int = 10,
+) -> Dict[str, Dict[str, object]]:
+    """
+    Report the time to import each of ``modules`` in a fresh interpreter.
+
+    Parameters
+    ----------
+    modules : list of str, optional
+        The modules to import.  Defaults to :data:`DEFAULT_MODULES`.
+
+    count : int, optional
+        The number of imports of each module, of which the fastest is kept.
+
+    top : int, optional
+        The number of slowest modules to include, by their own import time.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{module: {"total": seconds, "modules": [name, ...],
+        "slowest": [ImportRecord, ...]}}``.
+    """
+    report = {}
+    for module in modules or DEFAULT_MODULES:
+        records = get_imported_records(measure_import(module, count=count), module)
+        report[module] = {
+            "total": get_total_time(records, module),
+            "modules": [record.name for record in records],
+            "slowest": sorted(records, key=lambda record: record.self_time, reverse=True)[:top],
+        }
+    return report
+
+
+def print_report(report: Dict[str, Dict[str, object]]) -> None:
+    """Print a report from :func:`import_time_report`."""
+    for module, result in report.items():
+        print(f"import {module}: {result['total'] * 1e3:.1f} ms ({len(result['modules'])} modules)")
+        print(f"    {'self [us]':>10} | {'cumulative':>10} | imported package")
+        for record in result["slowest"]:
+            print(f"    {record.self_time * 1e6:>10.0f} | {record.cumulative_time * 1e6:>10.0f} | {record.name}")
+        print()
+
+
+if __name__ == "__main__":
+    print_report(import_time_report(sys.argv[1:] or None))
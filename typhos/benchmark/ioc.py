@@ -5,10 +5,14 @@ It's used internally by the typhos test suite, but it may also be run
 on its own.To run it outside of the test suite, use the following:
 
 ```
-python -m typhos.benchmark.ioc "PV:PREFIX" (benchmark_name)
+python -m typhos.benchmark.ioc "PV:PREFIX" (benchmark_name) [--rate HZ]
 ```
 
-Where benchmark_name is one of the supported tests:
+With ``--rate``, every PV is updated at the given rate, each update carrying
+the time it was sent as its timestamp.
+
+Where benchmark_name is one of the supported tests, below.  PVs are served with
+the data type of their signal, if given to the device generator.
 * cube_connect
 * cube_noconnect
 * cube_soft
@@ -18,6 +22,12 @@ Where benchmark_name is one of the supported tests:
 * flat_connect
 * flat_noconnect
 * flat_soft
+* mixed_connect
+* mixed_noconnect
+* mixed_soft
+* mixedcube_connect
+* mixedcube_noconnect
+* mixedcube_soft
 * wide_connect
 * wide_noconnect
 * wide_soft
@@ -25,17 +35,26 @@ Where benchmark_name is one of the supported tests:
 
 from __future__ import annotations
 
+import argparse
+import itertools
 import logging
 import sys
-from typing import Generator
+import time
+from typing import Generator, Optional, Tuple
 
+import numpy as np
 import ophyd
+from caproto import ChannelType
 from caproto.server import PVGroup, pvproperty, run
 
 from .cases import make_tests
+from .device import ENUM_STRINGS, IMAGE_SHAPE, WAVEFORM_LENGTH, get_signal_dtype
 
 logger = logging.getLogger(__name__)
 
+# Counts the rounds of updates in the --rate mode
+UPDATE_COUNTER_SUFFIX = "BENCHMARK:UPDATES"
+
 
 def yield_all_suffixes(device_class: ophyd.Device) -> Generator[str, None, None]:
     """
@@ -44,10 +63,44 @@ def yield_all_suffixes(device_class: ophyd.Device) -> Generator[str, None, None]
     Assumes only basic :class:`ophyd.Component` instances in the class
     definition.
     """
+    for suffix, _ in yield_all_components(device_class):
+        yield suffix
+
+
+def yield_all_components(device_class: ophyd.Device) -> Generator[Tuple[str, ophyd.Component], None, None]:
+    """
+    Iterates through all EPICS signal components defined by device_class.
+
+    Yields the full pvname suffix and the component of each, with the same
+    assumptions as :func:`yield_all_suffixes`.
+    """
     for walk in device_class.walk_components():
         if issubclass(walk.item.cls, ophyd.signal.EpicsSignalBase):
-            suffix = get_suffix(walk)
-            yield suffix
+            yield get_suffix(walk), walk.item
+
+
+def get_pvproperty_kwargs(cpt: ophyd.Component) -> dict:
+    """
+    Get the keyword arguments for a pvproperty serving cpt.
+
+    These give the PV the data type of the signal, if any was given to
+    :func:`typhos.benchmark.device.make_test_device_class`.
+    """
+    dtype = get_signal_dtype(cpt)
+    if dtype == "float":
+        return dict(value=0.0)
+    if dtype == "int":
+        return dict(value=0)
+    if dtype == "enum":
+        return dict(value=ENUM_STRINGS[0], dtype=ChannelType.ENUM, enum_strings=ENUM_STRINGS)
+    if dtype == "string":
+        return dict(value="text", dtype=ChannelType.STRING)
+    if dtype == "waveform":
+        return dict(value=[0.0] * WAVEFORM_LENGTH)
+    if dtype == "image":
+        # Flattened, as served by areaDetector
+        return dict(value=[0] * (IMAGE_SHAPE[0] * IMAGE_SHAPE[1]))
+    return {}
 
 
 def get_suffix(walk: ophyd.device.ComponentWalk) -> str:
@@ -67,14 +120,55 @@ def get_suffix(walk: ophyd.device.ComponentWalk) -> str:
 
 def print_usage() -> None:
     """Print usage of the test IOC."""
-    print(f"Usage: {sys.argv[0]} PV:PREFIX test_name")
+    print(f"Usage: {sys.argv[0]} PV:PREFIX test_name [--rate HZ]")
     print("Where test_name is one of the following:")
     classes, _, _ = make_tests()
     for cls in sorted(classes):
         print(f"* {cls}")
 
 
-def run_caproto_ioc(prefix: str, test_name: str) -> None:
+def get_update_value(data, count: int, timestamp: float):
+    """
+    Get the value of update number ``count`` for the PV ``data``.
+
+    Floating point values are the timestamp itself, and others are derived
+    from the count, such that every update changes the value.
+    """
+    value = data.value
+    if getattr(data, "enum_strings", None):
+        return data.enum_strings[count % len(data.enum_strings)]
+    if isinstance(value, str):
+        return str(count)
+    if isinstance(value, (list, tuple, np.ndarray)):
+        if len(value) and isinstance(value[0], float):
+            return [timestamp] * len(value)
+        return [count % 256] * len(value)
+    if isinstance(value, float):
+        return timestamp
+    return count
+
+
+def make_update_loop(rate: float):
+    """
+    Make a startup hook updating all PVs of the IOC at ``rate`` Hz.
+
+    Each round of updates is counted by the PV the hook is attached to.
+    """
+
+    async def update_loop(group, instance, async_lib):
+        period = 1.0 / rate
+        pvs = [data for data in group.pvdb.values() if data is not instance]
+        for count in itertools.count(1):
+            timestamp = time.time()
+            for data in pvs:
+                await data.write(get_update_value(data, count, timestamp), timestamp=timestamp)
+            await instance.write(count, timestamp=timestamp)
+            await async_lib.library.sleep(max(period - (time.time() - timestamp), 0.0))
+
+    return update_loop
+
+
+def run_caproto_ioc(prefix: str, test_name: str, rate: Optional[float] = None) -> None:
     """
     Runs a dummy caproto IOC.
 
@@ -83,6 +177,9 @@ def run_caproto_ioc(prefix: str, test_name: str) -> None:
 
     Assumes only basic :class:`ophyd.Component` instances in the class
     definition.
+
+    If ``rate`` is given, all PVs are updated at that rate in Hz, with a
+    count of the updates served as :data:`UPDATE_COUNTER_SUFFIX`.
     """
     classes, _, _ = make_tests()
     try:
@@ -93,8 +190,11 @@ def run_caproto_ioc(prefix: str, test_name: str) -> None:
         sys.exit(1)
 
     pvprops = {}
-    for suffix in yield_all_suffixes(device_class):
-        pvprops[suffix] = pvproperty()
+    for suffix, cpt in yield_all_components(device_class):
+        pvprops[suffix] = pvproperty(**get_pvproperty_kwargs(cpt))
+
+    if rate:
+        pvprops[UPDATE_COUNTER_SUFFIX] = pvproperty(value=0, startup=make_update_loop(rate), read_only=True)
 
     print(
         f"Running caproto IOC for test: {test_name} with prefix {prefix!r} Total PVs: {len(pvprops)}",
@@ -112,4 +212,10 @@ if __name__ == "__main__":
     if len(sys.argv) < 3:
         print_usage()
         sys.exit(1)
-    run_caproto_ioc(prefix=sys.argv[1], test_name=sys.argv[2])
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("prefix")
+    parser.add_argument("test_name")
+    parser.add_argument("--rate", type=float)
+    # The caproto example runner adds verbosity flags
+    args, _ = parser.parse_known_args()
+    run_caproto_ioc(prefix=args.prefix, test_name=args.test_name, rate=args.rate)
@@ -0,0 +1,340 @@
+"""
+Memory growth benchmarks for repeatedly opened and closed widgets.
+
+These create and destroy a :class:`TyphosDeviceDisplay`,
+:class:`TyphosSuite` or :class:`TyphosPositionerWidget` for a benchmark
+device over a number of cycles.  After each cycle, the following are
+recorded:
+
+* ``rss``: the resident set size of the process, in bytes.
+* ``traced``: the memory traced by :mod:`tracemalloc`, in bytes.
+* ``qobjects``: the number of live Python-wrapped QObjects.
+* ``widgets``: the number of live QWidgets.
+* ``gc_objects``: the number of objects tracked by :mod:`gc`.
+
+Growth per cycle is the slope of a line fit to each, following a number of
+warm-up cycles to fill caches.  The signals of closed devices which remain
+alive are attributed to the typhos structures holding them.  They may be run
+on their own with the following, exiting with an error if growth exceeds
+:data:`DEFAULT_THRESHOLDS`:
+
+```
+python -m typhos.benchmark.leaks [display|suite|positioner ...]
+```
+"""
+
+from __future__ import annotations
+
+import functools
+import gc
+import statistics
+import sys
+import tracemalloc
+import weakref
+from typing import Dict, List, Optional
+
+import ophyd
+from ophyd.sim import SynAxis
+from pydm.data_plugins import plugin_for_address
+from qtpy import QtCore, QtWidgets
+
+from .. import utils
+from ..cache import get_global_describe_cache, get_global_widget_type_cache
+from ..display import TyphosDeviceDisplay
+from ..plugins.core import signal_registry
+from ..positioner import TyphosPositionerWidget
+from ..suite import TyphosSuite
+from .cases import TESTS, benchmark_classes
+from .utils import caproto_context, random_prefix, unique_device_name
+
+WIDGET_KINDS = ("display", "suite", "positioner")
+MEASURES = ("rss", "traced", "qobjects", "widgets", "gc_objects")
+
+#: Growth per cycle beyond which :func:`find_leaks` reports a leak
+DEFAULT_THRESHOLDS = {
+    "rss": 1024 * 1024,
+    "traced": 256 * 1024,
+    "qobjects": 1.0,
+    "widgets": 1.0,
+    "gc_objects": 100.0,
+}
+
+
+@functools.lru_cache
+def _get_positioner_class(test_name: str) -> type:
+    """Get the benchmark device class with a simulated positioner added."""
+    cls = benchmark_classes[test_name]
+    return type(f"{cls.__name__}Positioner", (SynAxis, cls), {})
+
+
+def _make_device(test_name: str, prefix: str, kind: str) -> ophyd.Device:
+    """Instantiate the benchmark device, as a positioner if required."""
+    cls = _get_positioner_class(test_name) if kind == "positioner" else benchmark_classes[test_name]
+    return cls(prefix=prefix, name=unique_device_name("leak_benchmark"))
+
+
+def _open_widget(kind: str, device: ophyd.Device) -> QtWidgets.QWidget:
+    """Create and show a widget of the given kind for ``device``."""
+    if kind == "display":
+        widget = TyphosDeviceDisplay.from_device(
+            device,
+            display_type="detailed_screen",
+            threaded_template_search=False,
+        )
+    elif kind == "suite":
+        widget = TyphosSuite.from_device(device)
+    elif kind == "positioner":
+        widget = TyphosPositionerWidget()
+        widget.readback_attribute = "readback"
+        widget.setpoint_attribute = "setpoint"
+        widget.add_device(device)
+    else:
+        raise ValueError(f"Unknown widget kind {kind!r}, expected one of {WIDGET_KINDS}")
+    widget.show()
+    return widget
+
+
+def _close_widget(widget: QtWidgets.QWidget) -> None:
+    """Close and delete ``widget``, along with whatever it deletes later."""
+    app = QtWidgets.QApplication.instance()
+    widget.close()
+    widget.deleteLater()
+    # Deleted widgets in turn delete their data plugin connections
+    for _ in range(3):
+        app.processEvents()
+        app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    gc.collect()
+
+
+def take_measurements() -> Dict[str, int]:
+    """Measure each of :data:`MEASURES` for this process."""
+    measurements = {
+        "rss": utils.get_process_rss() or 0,
+        "traced": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+    }
+    objects = gc.get_objects()
+    # isinstance() would leave behind entries in the caches of ABCs
+    measurements["qobjects"] = sum(QtCore.QObject in type(obj).__mro__ for obj in objects)
+    measurements["widgets"] = len(QtWidgets.QApplication.allWidgets())
+    measurements["gc_objects"] = len(objects)
+    return measurements
+
+
+def get_reference_holders() -> Dict[str, List[object]]:
+    """
+    Get the objects held by each of the typhos structures which keep
+    references to signals.
+    """
+    describe_cache = get_global_describe_cache()
+    status = describe_cache.connect_thread.status
+    connections = plugin_for_address("sig://").connections.values()
+    return {
+        "describe_cache": list(describe_cache.cache),
+        "describe_in_process": list(describe_cache._in_process),
+        "widget_type_cache": list(get_global_widget_type_cache().cache),
+        "connection_monitor": list(status.objects) if status is not None else [],
+        "signal_registry": list(signal_registry.values()),
+        "sig_connections": [connection.signal for connection in connections],
+    }
+
+
+def find_reference_holders(objects: List[object]) -> Dict[str, int]:
+    """
+    Count how many of ``objects`` each of the typhos structures holds.
+
+    Objects not held by any of them are counted as ``"other"``.
+    """
+    ids = {id(obj) for obj in objects}
+    held = set()
+    holders = {}
+    for name, held_objects in get_reference_holders().items():
+        held_ids = ids.intersection(id(obj) for obj in held_objects)
+        holders[name] = len(held_ids)
+        held |= held_ids
+    holders["other"] = len(ids - held)
+    return holders
+
+
+def growth_per_cycle(samples: List[float]) -> float:
+    """The slope of the least-squares line fit to per-cycle ``samples``."""
+    if len(samples) < 2:
+        return 0.0
+    return statistics.linear_regression(range(len(samples)), samples).slope
+
+
+def measure_cycles(
+    kind: str = "display",
+    test_name: str = "mixed_soft",
+    cycles: int = 20,
+    warmup: int = 3,
+    top: int = 10,
+) -> Dict[str, object]:
+    """
+    Open and close a widget for a new benchmark device ``cycles`` times.
+
+    Parameters
+    ----------
+    kind : str, optional
+        The widget to open, one of :data:`WIDGET_KINDS`.
+
+    test_name : str, optional
+        The benchmark device class, one of
+        ``typhos.benchmark.cases.benchmark_classes``.  Cases which connect
+        are served by a caproto IOC.
+
+    cycles : int, optional
+        The number of measured cycles.
+
+    warmup : int, optional
+        The number of cycles prior to measurement, which fill caches.
+
+    top : int, optional
+        The number of source lines with the most growth in traced memory to
+        include.
+
+    Returns
+    -------
+    result : dict
+        With the form ``{"samples": {measure: [value, ...]}, "growth":
+        {measure: per_cycle}, "alive": count, "holders": {structure: count},
+        "top_allocations": [(line, bytes), ...]}``, where ``alive`` counts
+        the signals of closed devices still alive after the last cycle.
+    """
+    test = TESTS[test_name.rsplit("_", 1)[1]]
+    prefix = random_prefix()
+    if test.start_ioc:
+        from .ioc import yield_all_suffixes
+
+        pv_to_check = prefix + next(yield_all_suffixes(benchmark_classes[test_name]))
+        context = caproto_context(benchmark_classes[test_name], prefix, test_name, pv_to_check=pv_to_check)
+    else:
+        context = utils.nullcontext()
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    samples = {measure: [] for measure in MEASURES}
+    closed_signals = []
+    first_snapshot = None
+    try:
+        with context:
+            for cycle in range(warmup + cycles):
+                device = _make_device(test_name, prefix, kind)
+                widget = _open_widget(kind, device)
+                _close_widget(widget)
+                del widget
+                if cycle >= warmup:
+                    closed_signals.extend(weakref.ref(sig) for sig in utils.get_all_signals_from_device(device))
+                # Soft signals hold no resources, and are freed along with
+                # the last widget using them
+                if test.include_prefix:
+                    device.destroy()
+                del device
+                gc.collect()
+
+                if cycle < warmup:
+                    continue
+                if first_snapshot is None:
+                    first_snapshot = tracemalloc.take_snapshot()
+                for measure, value in take_measurements().items():
+                    samples[measure].append(value)
+
+        last_snapshot = tracemalloc.take_snapshot()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    alive = [sig for sig in (ref() for ref in closed_signals) if sig is not None]
+    top_allocations = []
+    if first_snapshot is not None:
+        for stat in last_snapshot.compare_to(first_snapshot, "lineno")[:top]:
+            frame = stat.traceback[0]
+            top_allocations.append((f"{frame.filename}:{frame.lineno}", stat.size_diff))
+
+    return {
+        "samples": samples,
+        "growth": {measure: growth_per_cycle(values) for measure, values in samples.items()},
+        "alive": len(alive),
+        "holders": find_reference_holders(alive),
+        "top_allocations": top_allocations,
+    }
+
+
+def leak_report(
+    kinds: Optional[List[str]] = None,
+    test_name: str = "mixed_soft",
+    cycles: int = 20,
+    warmup: int = 3,
+) -> Dict[str, Dict[str, object]]:
+    """
+    Report the memory growth per cycle of opening and closing each widget.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{kind: result}``, see :func:`measure_cycles`.
+    """
+    return {
+        kind: measure_cycles(kind, test_name=test_name, cycles=cycles, warmup=warmup) for kind in kinds or WIDGET_KINDS
+    }
+
+
+def find_leaks(
+    report: Dict[str, Dict[str, object]],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Find the growth per cycle exceeding ``thresholds``.
+
+    Parameters
+    ----------
+    report : dict
+        A report from :func:`leak_report`.
+
+    thresholds : dict, optional
+        The allowed growth per cycle of each measure.  Defaults to
+        :data:`DEFAULT_THRESHOLDS`.
+
+    Returns
+    -------
+    leaks : dict
+        With the form ``{kind: {measure: per_cycle}}``, for kinds with any
+        measure over its threshold.
+    """
+    thresholds = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+    leaks = {}
+    for kind, result in report.items():
+        exceeded = {measure: growth for measure, growth in result["growth"].items() if growth > thresholds[measure]}
+        if exceeded:
+            leaks[kind] = exceeded
+    return leaks
+
+
+def print_report(report: Dict[str, Dict[str, object]], thresholds: Optional[Dict[str, float]] = None) -> None:
+    """Print a report from :func:`leak_report`, marking leaks."""
+    leaks = find_leaks(report, thresholds)
+    print(f"{'widget':<12}" + "".join(f"{measure + '/cycle':>18}" for measure in MEASURES))
+    for kind, result in report.items():
+        row = []
+        for measure in MEASURES:
+            flag = "!" if measure in leaks.get(kind, {}) else " "
+            row.append(f"{result['growth'][measure]:>17.1f}{flag}")
+        print(f"{kind:<12}" + "".join(row))
+
+    for kind, result in report.items():
+        print()
+        print(f"{kind}: {result['alive']} signals of closed devices alive")
+        for holder, count in result["holders"].items():
+            if count:
+                print(f"    {holder:<20} {count:>8}")
+        print(f"{kind}: largest growth in traced memory")
+        for line, size_diff in result["top_allocations"]:
+            print(f"    {size_diff:>+10} B  {line}")
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    report = leak_report(sys.argv[1:] or None)
+    print_report(report)
+    sys.exit(1 if find_leaks(report) else 0)
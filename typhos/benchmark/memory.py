@@ -0,0 +1,129 @@
+"""
+Memory benchmarks for typhos bookkeeping structures.
+
+These measure how many bytes typhos keeps around per signal, independently
+of the widgets created for those signals. They may be run on their own with
+the following:
+
+```
+python -m typhos.benchmark.memory [num_signals]
+```
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from ophyd.signal import Signal
+
+from ..alarm import AlarmLevel, SignalInfo
+from ..panel import SignalRow
+
+
+@dataclasses.dataclass
+class _UnslottedSignalInfo:
+    """The pre-slots layout of :class:`typhos.alarm.SignalInfo`, for reference."""
+
+    address: str
+    channel: Any
+    signal_name: str
+    connected: bool
+    severity: int
+
+
+def measure_bytes_per_item(factory: Callable[[int], Any], count: int = 10_000) -> float:
+    """
+    Measure the average number of bytes allocated per call of ``factory``.
+
+    Parameters
+    ----------
+    factory : callable
+        Called with the item index, returning a new item.
+
+    count : int, optional
+        The number of items to create.
+
+    Returns
+    -------
+    bytes_per_item : float
+    """
+    items = [None] * count
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for idx in range(count):
+            items[idx] = factory(idx)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def signal_bookkeeping_report(count: int = 10_000) -> Dict[str, Dict[str, float]]:
+    """
+    Report bytes per signal of the panel and alarm bookkeeping records.
+
+    "before" is the previous dictionary-based layout, "after" the current
+    slotted record. Referenced objects (signals, channels) are shared between
+    all records so that only the records themselves are measured.
+
+    Parameters
+    ----------
+    count : int, optional
+        The number of records to create for each measurement.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{structure: {"before": bytes, "after": bytes}}``.
+    """
+    signal = Signal(name="memory_benchmark")
+    channel = object()
+
+    def panel_dict(idx):
+        return dict(
+            row=idx,
+            signal=signal,
+            component=None,
+            widget_info=None,
+            create_signal=None,
+            visible=True,
+        )
+
+    def panel_row(idx):
+        return SignalRow(row=idx, signal=signal)
+
+    def alarm_info(idx, cls=SignalInfo):
+        return cls(
+            address="sig://memory_benchmark",
+            channel=channel,
+            signal_name="memory_benchmark",
+            connected=False,
+            severity=AlarmLevel.INVALID,
+        )
+
+    return {
+        "panel_row": {
+            "before": measure_bytes_per_item(panel_dict, count),
+            "after": measure_bytes_per_item(panel_row, count),
+        },
+        "alarm_info": {
+            "before": measure_bytes_per_item(lambda idx: alarm_info(idx, cls=_UnslottedSignalInfo), count),
+            "after": measure_bytes_per_item(alarm_info, count),
+        },
+    }
+
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+    """Print a report from :func:`signal_bookkeeping_report`."""
+    print(f"{'structure':<12} {'before (B)':>12} {'after (B)':>12}")
+    for name, result in report.items():
+        print(f"{name:<12} {result['before']:>12.1f} {result['after']:>12.1f}")
+
+
+if __name__ == "__main__":
+    print_report(signal_bookkeeping_report(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
@@ -0,0 +1,341 @@
+"""
+Wall-clock phase timing benchmarks.
+
+These open a suite for each of the benchmark cases of
+:mod:`typhos.benchmark.cases` (``SHAPES`` x ``TESTS``) and record the time
+from the start of the case until each of the following phases is reached:
+
+* ``device``: the device has been instantiated.
+* ``suite``: :meth:`TyphosSuite.from_device` has returned.
+* ``templates``: all device displays in the suite have loaded a template.
+* ``paint``: the suite has been painted for the first time.
+* ``widgets``: the widgets of all signal rows have been determined.
+* ``values``: all channel widgets are connected and show a value.
+
+Phases not reached within the timeout are recorded as ``None``.  Reports are
+saved as JSON, and two reports may be compared to flag statistically
+significant regressions.  They may be run on their own with the following:
+
+```
+python -m typhos.benchmark.phases report.json [test_name ...]
+```
+
+And compared with ``typhos --benchmark-compare old.json new.json``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import itertools
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from qtpy import QtCore, QtWidgets
+
+from .. import __version__ as typhos_version
+from .. import utils
+from ..display import TyphosDeviceDisplay
+from ..suite import TyphosSuite
+from .cases import TESTS, benchmark_classes
+from .utils import caproto_context, random_prefix, unique_device_name
+
+PHASES = ("device", "suite", "templates", "paint", "widgets", "values")
+
+# Permutation tests enumerate up to this many splits, and sample otherwise
+_MAX_PERMUTATIONS = 20000
+
+
+class _PaintFilter(QtCore.QObject):
+    """Record the time of the first paint event of the watched widget."""
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.painted_at: Optional[float] = None
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if self.painted_at is None and event.type() == QtCore.QEvent.Paint:
+            self.painted_at = time.perf_counter()
+        return False
+
+
+def _templates_loaded(suite: TyphosSuite) -> bool:
+    """Whether all device displays of ``suite`` have loaded a template."""
+    displays = suite.findChildren(TyphosDeviceDisplay)
+    return bool(displays) and all(display.display_widget is not None for display in displays)
+
+
+def measure_phases(test_name: str = "flat_soft", timeout: float = 10.0) -> Dict[str, Optional[float]]:
+    """
+    Measure the time in seconds to reach each of :data:`PHASES`.
+
+    Parameters
+    ----------
+    test_name : str, optional
+        The benchmark case, one of ``typhos.benchmark.cases.benchmark_classes``.
+        Cases which connect are served by a fresh caproto IOC.
+
+    timeout : float, optional
+        The time to wait for all phases to be reached.
+
+    Returns
+    -------
+    timings : dict
+        With the form ``{phase: seconds}``, each measured from the start of
+        the case, or ``None`` if not reached within ``timeout``.
+    """
+    app = QtWidgets.QApplication.instance()
+    cls = benchmark_classes[test_name]
+    test = TESTS[test_name.rsplit("_", 1)[1]]
+    # A fresh prefix for each measurement, as channels are shared per process
+    prefix = random_prefix()
+    if test.start_ioc:
+        from .ioc import yield_all_suffixes
+
+        pv_to_check = prefix + next(yield_all_suffixes(cls))
+        context = caproto_context(cls, prefix, test_name, pv_to_check=pv_to_check)
+    else:
+        context = utils.nullcontext()
+
+    timings = dict.fromkeys(PHASES)
+    with context:
+        t0 = time.perf_counter()
+        device = cls(prefix, name=unique_device_name("phase_benchmark"))
+        timings["device"] = time.perf_counter() - t0
+        suite = TyphosSuite.from_device(device)
+        timings["suite"] = time.perf_counter() - t0
+        paint_filter = _PaintFilter()
+        suite.installEventFilter(paint_filter)
+        checks = {
+            "templates": lambda: _templates_loaded(suite),
+            "paint": lambda: paint_filter.painted_at is not None,
+            "widgets": lambda: utils.widgets_loaded(suite, values=False),
+            "values": lambda: utils.widgets_loaded(suite, values=True),
+        }
+        try:
+            suite.show()
+            while checks and time.perf_counter() - t0 < timeout:
+                app.processEvents()
+                now = time.perf_counter() - t0
+                for phase, check in list(checks.items()):
+                    if check():
+                        timings[phase] = now
+                        del checks[phase]
+                time.sleep(0.001)
+            if paint_filter.painted_at is not None:
+                timings["paint"] = paint_filter.painted_at - t0
+        finally:
+            suite.removeEventFilter(paint_filter)
+            suite.close()
+            suite.deleteLater()
+            app.processEvents()
+            # Soft signals hold no resources, and sig:// connections may still
+            # be subscribed to them
+            if test.include_prefix:
+                device.destroy()
+    return timings
+
+
+def phase_report(
+    test_names: Optional[List[str]] = None,
+    count: int = 5,
+    timeout: float = 10.0,
+) -> Dict[str, object]:
+    """
+    Record the phase timings of each benchmark case ``count`` times.
+
+    Parameters
+    ----------
+    test_names : list of str, optional
+        The benchmark cases.  Defaults to all of ``SHAPES`` x ``TESTS``.
+
+    count : int, optional
+        The number of timed measurements of each case, following one untimed
+        measurement to warm up caches.
+
+    timeout : float, optional
+        The time to wait for all phases of each measurement.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{"cases": {test_name: {phase: [seconds, ...]}},
+        ...}`` along with the typhos version and platform, suitable for
+        :func:`save_report`.
+    """
+    cases = {}
+    for test_name in test_names or list(benchmark_classes):
+        if test_name not in benchmark_classes:
+            raise ValueError(
+                f"{test_name} is not a valid benchmark. The full list of valid benchmarks is {list(benchmark_classes)}"
+            )
+        measure_phases(test_name, timeout=timeout)
+        samples = {phase: [] for phase in PHASES}
+        for _ in range(count):
+            for phase, elapsed in measure_phases(test_name, timeout=timeout).items():
+                samples[phase].append(elapsed)
+        cases[test_name] = samples
+
+    return {
+        "typhos": str(typhos_version),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "count": count,
+        "timeout": timeout,
+        "cases": cases,
+    }
+
+
+def save_report(report: Dict[str, object], filename: str) -> None:
+    """Save a report from :func:`phase_report` as JSON."""
+    with open(filename, "w") as fp:
+        json.dump(report, fp, indent=2)
+
+
+def load_report(filename: str) -> Dict[str, object]:
+    """Load a report saved by :func:`save_report`."""
+    with open(filename) as fp:
+        return json.load(fp)
+
+
+def print_report(report: Dict[str, object]) -> None:
+    """Print the median phase timings of a report from :func:`phase_report`."""
+    print(f"{'case':<16}" + "".join(f"{phase + ' (ms)':>16}" for phase in PHASES))
+    for test_name, samples in report["cases"].items():
+        row = []
+        for phase in PHASES:
+            reached = [elapsed for elapsed in samples.get(phase, []) if elapsed is not None]
+            row.append(f"{statistics.median(reached) * 1e3:>16.1f}" if reached else f"{'-':>16}")
+        print(f"{test_name:<16}" + "".join(row))
+
+
+class PhaseComparison(NamedTuple):
+    """The comparison of one phase of one case between two reports."""
+
+    case: str
+    phase: str
+    #: Mean of the old samples, in seconds
+    old: float
+    #: Mean of the new samples, in seconds, or ``inf`` if no longer reached
+    new: float
+    #: Relative change of the mean
+    change: float
+    #: One-sided p-value of the new samples being slower
+    p_value: float
+    regression: bool
+
+
+def permutation_p_value(old: List[float], new: List[float]) -> float:
+    """
+    The one-sided p-value of ``new`` having a larger mean than ``old``.
+
+    This is a permutation test: the fraction of all splits of the pooled
+    samples in which the difference of means is at least that observed.
+    It makes no assumption on the distribution of timings, which are
+    typically skewed, and needs no dependencies.  Beyond
+    ``_MAX_PERMUTATIONS`` splits, a fixed-seed random sample of them is used.
+    """
+    pooled = list(old) + list(new)
+    num_new = len(new)
+    pooled_sum = sum(pooled)
+    observed = statistics.fmean(new) - statistics.fmean(old)
+    # Allow for floating point error in the sums of identical splits
+    tolerance = 1e-12 * max(abs(pooled_sum), 1.0)
+
+    total = math.comb(len(pooled), num_new)
+    if total <= _MAX_PERMUTATIONS:
+        splits = itertools.combinations(range(len(pooled)), num_new)
+    else:
+        rng = random.Random(0)
+        splits = (rng.sample(range(len(pooled)), num_new) for _ in range(_MAX_PERMUTATIONS))
+        total = _MAX_PERMUTATIONS
+
+    extreme = 0
+    for indices in splits:
+        new_sum = sum(pooled[idx] for idx in indices)
+        difference = new_sum / num_new - (pooled_sum - new_sum) / len(old)
+        if difference >= observed - tolerance:
+            extreme += 1
+    return extreme / total
+
+
+def compare_reports(
+    old: Dict[str, object],
+    new: Dict[str, object],
+    alpha: float = 0.05,
+    threshold: float = 0.05,
+) -> List[PhaseComparison]:
+    """
+    Compare the phase timings of two reports from :func:`phase_report`.
+
+    A phase is flagged as a regression if it is slower by more than
+    ``threshold`` with a p-value of at most ``alpha``, or if it was reached
+    in ``old`` but never in ``new``.  Only cases in both reports are
+    compared.
+
+    Parameters
+    ----------
+    old : dict
+        The baseline report.
+
+    new : dict
+        The report to check for regressions.
+
+    alpha : float, optional
+        The significance level.  Note that with ``count`` measurements in
+        each report the smallest possible p-value is ``1 / comb(2 * count,
+        count)``, e.g. 0.05 for 3 measurements.
+
+    threshold : float, optional
+        The smallest relative slowdown of the mean to flag.
+
+    Returns
+    -------
+    comparisons : list of PhaseComparison
+    """
+    comparisons = []
+    for test_name, old_samples in old["cases"].items():
+        new_samples = new["cases"].get(test_name)
+        if new_samples is None:
+            continue
+        for phase in PHASES:
+            old_reached = [elapsed for elapsed in old_samples.get(phase, []) if elapsed is not None]
+            new_reached = [elapsed for elapsed in new_samples.get(phase, []) if elapsed is not None]
+            if not old_reached:
+                continue
+            old_mean = statistics.fmean(old_reached)
+            if not new_reached:
+                comparisons.append(PhaseComparison(test_name, phase, old_mean, math.inf, math.inf, 0.0, True))
+                continue
+            new_mean = statistics.fmean(new_reached)
+            change = new_mean / old_mean - 1.0 if old_mean > 0 else 0.0
+            p_value = permutation_p_value(old_reached, new_reached)
+            regression = change > threshold and p_value <= alpha
+            comparisons.append(PhaseComparison(test_name, phase, old_mean, new_mean, change, p_value, regression))
+    return comparisons
+
+
+def print_comparison(comparisons: List[PhaseComparison]) -> None:
+    """Print the comparisons from :func:`compare_reports`."""
+    print(f"{'case':<16} {'phase':<10} {'old (ms)':>10} {'new (ms)':>10} {'change':>8} {'p':>7}")
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison.regression else ""
+        print(
+            f"{comparison.case:<16} {comparison.phase:<10} {comparison.old * 1e3:>10.1f} "
+            f"{comparison.new * 1e3:>10.1f} {comparison.change:>+8.1%} {comparison.p_value:>7.3f}{flag}"
+        )
+    regressions = sum(comparison.regression for comparison in comparisons)
+    print(f"{regressions} regression(s) in {len(comparisons)} phase(s) compared")
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    report = phase_report(sys.argv[2:] or None)
+    save_report(report, sys.argv[1])
+    print_report(report)
@@ -0,0 +1,118 @@
+"""
+Device pre-connection benchmarks.
+
+These time from instantiating a device served by a caproto IOC to all of the
+values in its detailed display being shown, with and without first starting
+its connections in the background by way of
+:func:`typhos.utils.preconnect_device`.  They may be run on their own with the
+following:
+
+```
+python -m typhos.benchmark.preconnect [test_name]
+```
+
+Where ``test_name`` is one of the ``*_connect`` tests of
+:mod:`typhos.benchmark.ioc`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Dict
+
+from qtpy import QtWidgets
+
+from .. import utils
+from ..display import TyphosDeviceDisplay
+from ..utils import preconnect_device
+from .cases import benchmark_classes
+from .utils import caproto_context, random_prefix, unique_device_name
+
+
+def values_shown(display: QtWidgets.QWidget) -> bool:
+    """Whether all of the channel widgets of ``display`` show a value."""
+    return utils.widgets_loaded(display, values=True)
+
+
+def measure_time_to_values(
+    test_name: str = "flat_connect",
+    preconnect: bool = False,
+    timeout: float = 30.0,
+) -> float:
+    """
+    Measure the time in seconds until all values of a device display are shown.
+
+    Parameters
+    ----------
+    test_name : str, optional
+        The benchmark device class, served by a fresh caproto IOC.
+
+    preconnect : bool, optional
+        Start connecting the device with :func:`typhos.utils.preconnect_device`
+        prior to creating its display.
+
+    timeout : float, optional
+        The time to wait for all values to be shown.
+    """
+    from .ioc import yield_all_suffixes
+
+    app = QtWidgets.QApplication.instance()
+    cls = benchmark_classes[test_name]
+    # A fresh prefix for each measurement, as channels are shared per process
+    prefix = random_prefix()
+    pv_to_check = prefix + next(yield_all_suffixes(cls))
+    with caproto_context(cls, prefix, test_name, pv_to_check=pv_to_check):
+        t0 = time.perf_counter()
+        device = cls(prefix, name=unique_device_name("preconnect_benchmark"))
+        if preconnect:
+            preconnect_device(device, timeout=timeout)
+        display = TyphosDeviceDisplay.from_device(
+            device,
+            display_type="detailed_screen",
+            threaded_template_search=False,
+        )
+        try:
+            display.show()
+            while not values_shown(display):
+                if time.perf_counter() - t0 > timeout:
+                    raise TimeoutError(f"Values of {test_name} not shown within {timeout} s")
+                app.processEvents()
+                time.sleep(0.001)
+            elapsed = time.perf_counter() - t0
+        finally:
+            display.close()
+            display.deleteLater()
+            app.processEvents()
+            device.destroy()
+    return elapsed
+
+
+def preconnect_report(test_name: str = "flat_connect", count: int = 3) -> Dict[str, float]:
+    """
+    Report the average time until all values are shown, with and without
+    pre-connection.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{"direct": seconds, "preconnect": seconds}``.
+    """
+    # Warm up caches (templates, widget types) prior to timing
+    measure_time_to_values(test_name, preconnect=True)
+    report = {"direct": 0.0, "preconnect": 0.0}
+    for _ in range(count):
+        for mode in report:
+            report[mode] += measure_time_to_values(test_name, preconnect=mode == "preconnect") / count
+    return report
+
+
+def print_report(report: Dict[str, float]) -> None:
+    """Print a report from :func:`preconnect_report`."""
+    print(f"{'direct (ms)':>12} {'preconnect (ms)':>16}")
+    print(f"{report['direct'] * 1e3:>12.1f} {report['preconnect'] * 1e3:>16.1f}")
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    print_report(preconnect_report(sys.argv[1] if len(sys.argv) > 1 else "flat_connect"))
@@ -0,0 +1,272 @@
+"""
+Statistical sampling profiler over the Python stacks of all threads.
+
+Unlike :mod:`typhos.benchmark.profile`, this needs no preselected functions
+and does not slow them down: a background thread periodically records the
+stack of every other thread, including time spent in pydm, ophyd and Qt
+slots.  Results are saved as either:
+
+* ``*.json``: a `speedscope <https://www.speedscope.app>`_ file, with one
+  profile per thread.
+* anything else: collapsed stacks, one ``thread;frame;frame count`` line per
+  unique stack, as taken by ``flamegraph.pl`` and most flame graph tools.
+
+The sampler may be run for a whole session with ``typhos --profile-sampler
+FILENAME``.  A suite or server session started with ``typhos
+--profile-signal`` can also be profiled without restarting it by sending it
+``SIGUSR2`` once to start sampling and again to stop and save the results,
+see :func:`install_signal_handler`.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default time between samples, in seconds
+DEFAULT_INTERVAL = 0.01
+
+# A frame is identified by its function name, filename and first line
+Frame = Tuple[str, str, int]
+
+
+class StackSampler:
+    """
+    Periodically sample the Python stacks of all threads.
+
+    Parameters
+    ----------
+    interval : float, optional
+        The time between samples, in seconds.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        #: Sample counts of each stack, keyed by thread name and frames from
+        #: the outermost
+        self.samples: collections.Counter[Tuple[str, Tuple[Frame, ...]]] = collections.Counter()
+        #: Total time spent sampling, in seconds
+        self.duration = 0.0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampler is running."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start sampling, adding to any samples taken so far."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="typhos-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.duration += time.perf_counter() - self._started_at
+
+    def toggle(self) -> bool:
+        """Start or stop sampling, returning whether it is now running."""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+        return self.running
+
+    def clear(self) -> None:
+        """Discard all samples taken so far."""
+        with self._lock:
+            self.samples.clear()
+            self.duration = 0.0
+
+    def _run(self) -> None:
+        ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            self.sample(ignore=(ident,))
+
+    def sample(self, ignore: Tuple[int, ...] = ()) -> None:
+        """Record the current stack of each thread not in ``ignore``."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident in ignore:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stacks.append((names.get(ident, str(ident)), tuple(reversed(stack))))
+        with self._lock:
+            self.samples.update(stacks)
+
+    def get_samples(self) -> Dict[Tuple[str, Tuple[Frame, ...]], int]:
+        """A copy of the samples taken so far, safe to use while running."""
+        with self._lock:
+            return dict(self.samples)
+
+    def to_collapsed(self) -> List[str]:
+        """The samples as collapsed stacks, one line per unique stack."""
+        lines = []
+        for (thread_name, stack), count in sorted(self.get_samples().items()):
+            frames = [thread_name] + [_format_frame(frame) for frame in stack]
+            lines.append(f"{';'.join(frames)} {count}")
+        return lines
+
+    def to_speedscope(self, name: str = "typhos") -> Dict[str, object]:
+        """The samples in the speedscope file format."""
+        frames: List[Frame] = []
+        frame_indices: Dict[Frame, int] = {}
+        profiles: Dict[str, Dict[str, object]] = {}
+        for (thread_name, stack), count in sorted(self.get_samples().items()):
+            indices = []
+            for frame in stack:
+                if frame not in frame_indices:
+                    frame_indices[frame] = len(frames)
+                    frames.append(frame)
+                indices.append(frame_indices[frame])
+            profile = profiles.setdefault(
+                thread_name,
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0.0,
+                    "endValue": 0.0,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            profile["samples"].append(indices)
+            profile["weights"].append(count * self.interval)
+            profile["endValue"] += count * self.interval
+
+        from .. import __version__ as typhos_version
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": f"typhos {typhos_version}",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": func, "file": filename, "line": line} for func, filename, line in frames],
+            },
+            "profiles": list(profiles.values()),
+        }
+
+    def save(self, filename: str) -> None:
+        """
+        Save the samples to ``filename``, as speedscope JSON if it ends in
+        ``.json`` or as collapsed stacks otherwise.
+        """
+        with open(filename, "w") as fd:
+            if str(filename).endswith(".json"):
+                json.dump(self.to_speedscope(name=os.path.basename(filename)), fd)
+            else:
+                fd.writelines(f"{line}\n" for line in self.to_collapsed())
+
+
+def _format_frame(frame: Frame) -> str:
+    func, filename, line = frame
+    return f"{func} ({filename}:{line})"
+
+
+# Global sampler instance
+sampler = None
+
+
+def get_sampler() -> StackSampler:
+    """Returns the global sampler instance, creating it if necessary."""
+    global sampler
+    if sampler is None:
+        sampler = StackSampler()
+    return sampler
+
+
+def get_default_filename() -> str:
+    """The file to save samples to on a signal, unique to this process."""
+    return os.path.join(tempfile.gettempdir(), f"typhos-profile-{os.getpid()}.json")
+
+
+@contextmanager
+def sampler_context(filename: str):
+    """Context manager for sampling the cli typhos application."""
+    sampler = get_sampler()
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        # Stopped and saved in the meantime by way of the signal handler
+        if sampler.running:
+            sampler.stop()
+            save_results(filename)
+
+
+def save_results(filename: str) -> None:
+    """Saves the global sampler results to filename."""
+    get_sampler().save(filename)
+    logger.info("Saved sampling profile to %s", filename)
+
+
+def install_signal_handler(filename: Optional[str] = None, signum: Optional[int] = None) -> bool:
+    """
+    Start and stop the global sampler on a signal, ``SIGUSR2`` by default.
+
+    The first signal discards any previous samples and starts sampling, and
+    the next stops sampling and saves the results to ``filename``.  Note
+    that Python only handles signals while running Python code, so a Qt
+    application should wake up periodically for this to be responsive.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Where to save the results.  Defaults to
+        :func:`get_default_filename`.
+    signum : int, optional
+        The signal to handle.
+
+    Returns
+    -------
+    installed : bool
+        False if the signal is not available on this platform, or this is
+        not called from the main thread.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGUSR2", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+    filename = filename or get_default_filename()
+
+    def toggle_sampler(signum, frame):
+        sampler = get_sampler()
+        if sampler.running:
+            sampler.stop()
+            save_results(filename)
+        else:
+            sampler.clear()
+            sampler.start()
+            logger.info("Started sampling profiler, signal %d again to stop and save to %s", signum, filename)
+
+    signal.signal(signum, toggle_sampler)
+    return True
@@ -0,0 +1,259 @@
+"""
+High-rate update stress benchmarks.
+
+These open the detailed display of a benchmark device served by a caproto
+IOC which updates every PV at a given rate, and then measure how the Qt
+event loop copes over a period of time:
+
+* ``ioc_rate``: the rate at which the IOC managed to update all PVs, which
+  falls short of the requested rate once the IOC itself is saturated.
+* ``updates``: the number of value updates received by the display.
+* ``value_latency``: the time from each update being sent by the IOC until
+  it is delivered in the event loop, by way of its timestamp.
+* ``loop_latency``: the lateness of a heartbeat timer.
+* ``dropped_frames``: the number of 60 Hz frames during which the event
+  loop was blocked, as gaps between heartbeats.
+* ``cpu_per_update``: the process CPU time per update received.
+
+They may be run on their own with the following:
+
+```
+python -m typhos.benchmark.stress [test_name ...]
+```
+
+Where ``test_name`` is one of the ``*_connect`` tests of
+:mod:`typhos.benchmark.ioc`.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+import epics
+from pydm.data_plugins import plugin_for_address
+from qtpy import QtCore, QtWidgets
+
+from .. import utils
+from ..display import TyphosDeviceDisplay
+from .cases import TESTS, benchmark_classes
+from .ioc import UPDATE_COUNTER_SUFFIX
+from .utils import caproto_context, random_prefix, unique_device_name
+
+DEFAULT_RATES = (1.0, 10.0, 50.0)
+FRAME_PERIOD = 1.0 / 60.0
+
+
+class _UpdateMonitor(QtCore.QObject):
+    """Record the delivery of timestamped value updates in the event loop."""
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.latencies: List[float] = []
+
+    @QtCore.Slot(float)
+    def timestamp_received(self, timestamp: float):
+        self.latencies.append(time.time() - timestamp)
+
+
+class _Heartbeat(QtCore.QObject):
+    """A timer recording the gaps between its ticks."""
+
+    def __init__(self, interval: float, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.interval = interval
+        self.gaps: List[float] = []
+        self._last_tick = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.setInterval(max(int(interval * 1e3), 1))
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._last_tick = time.perf_counter()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    @QtCore.Slot()
+    def _tick(self):
+        now = time.perf_counter()
+        self.gaps.append(now - self._last_tick)
+        self._last_tick = now
+
+
+def _percentile_95(values: List[float]) -> float:
+    """The 95th percentile of ``values``."""
+    if len(values) < 2:
+        return values[0] if values else math.nan
+    return statistics.quantiles(values, n=20)[-1]
+
+
+def count_dropped_frames(gaps: List[float], frame_period: float = FRAME_PERIOD) -> int:
+    """Count the frames missed during gaps in the event loop longer than a frame."""
+    return sum(max(math.ceil(gap / frame_period) - 1, 0) for gap in gaps)
+
+
+def measure_update_load(
+    test_name: str = "flat_connect",
+    rate: float = 10.0,
+    duration: float = 5.0,
+    heartbeat: float = 0.005,
+    timeout: float = 30.0,
+) -> Dict[str, float]:
+    """
+    Measure the event loop under PV updates at ``rate`` Hz.
+
+    Parameters
+    ----------
+    test_name : str, optional
+        The benchmark device class, one of the ``*_connect`` tests, served by
+        a fresh caproto IOC.
+
+    rate : float, optional
+        The rate at which the IOC updates every PV, in Hz.
+
+    duration : float, optional
+        The time to measure for, once all values are shown.
+
+    heartbeat : float, optional
+        The interval of the heartbeat timer, in seconds.
+
+    timeout : float, optional
+        The time to wait for all values to be shown.
+
+    Returns
+    -------
+    result : dict
+        Each of the measures of this module, with latencies given as their
+        mean, 95th percentile and maximum in seconds, e.g.
+        ``value_latency_p95``.
+    """
+    if not TESTS[test_name.rsplit("_", 1)[1]].start_ioc:
+        raise ValueError(f"{test_name} is not served by an IOC, use one of the *_connect tests")
+
+    cls = benchmark_classes[test_name]
+    prefix = random_prefix()
+    with caproto_context(cls, prefix, test_name, pv_to_check=prefix + UPDATE_COUNTER_SUFFIX, rate=rate):
+        device = cls(prefix, name=unique_device_name("stress_benchmark"))
+        display = TyphosDeviceDisplay.from_device(
+            device,
+            display_type="detailed_screen",
+            threaded_template_search=False,
+        )
+        monitor = _UpdateMonitor()
+        pulse = _Heartbeat(heartbeat)
+        try:
+            display.show()
+            if not utils.wait_for_widgets_loaded(display, timeout=timeout):
+                raise TimeoutError(f"Values of {test_name} not shown within {timeout} s")
+
+            connections = [
+                connection
+                for connection in plugin_for_address("ca://").connections.values()
+                if connection.address.startswith(prefix)
+            ]
+            for connection in connections:
+                connection.timestamp_signal.connect(monitor.timestamp_received, QtCore.Qt.QueuedConnection)
+
+            loop = QtCore.QEventLoop()
+            QtCore.QTimer.singleShot(int(duration * 1e3), loop.quit)
+            rounds_start = epics.caget(prefix + UPDATE_COUNTER_SUFFIX, timeout=timeout)
+            cpu_start = time.process_time()
+            start = time.perf_counter()
+            pulse.start()
+            loop.exec_()
+            pulse.stop()
+            elapsed = time.perf_counter() - start
+            cpu_time = time.process_time() - cpu_start
+            rounds = epics.caget(prefix + UPDATE_COUNTER_SUFFIX, timeout=timeout) - rounds_start
+
+            for connection in connections:
+                connection.timestamp_signal.disconnect(monitor.timestamp_received)
+        finally:
+            app = QtWidgets.QApplication.instance()
+            display.close()
+            display.deleteLater()
+            # Widgets unsubscribe from their signals as they are deleted
+            app.processEvents()
+            app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+            device.destroy()
+
+    updates = len(monitor.latencies)
+    loop_latencies = [max(gap - heartbeat, 0.0) for gap in pulse.gaps]
+    return {
+        "rate": rate,
+        "pvs": len(connections),
+        "ioc_rate": rounds / elapsed,
+        "updates": updates,
+        "update_rate": updates / elapsed,
+        "value_latency_mean": statistics.fmean(monitor.latencies) if updates else math.nan,
+        "value_latency_p95": _percentile_95(monitor.latencies),
+        "value_latency_max": max(monitor.latencies, default=math.nan),
+        "loop_latency_mean": statistics.fmean(loop_latencies) if loop_latencies else math.nan,
+        "loop_latency_p95": _percentile_95(loop_latencies),
+        "loop_latency_max": max(loop_latencies, default=math.nan),
+        "dropped_frames": count_dropped_frames(pulse.gaps),
+        "cpu_fraction": cpu_time / elapsed,
+        "cpu_per_update": cpu_time / updates if updates else math.nan,
+    }
+
+
+def stress_report(
+    test_names: Optional[List[str]] = None,
+    rates: Optional[List[float]] = None,
+    duration: float = 5.0,
+) -> Dict[str, Dict[float, Dict[str, float]]]:
+    """
+    Report the event loop load of each test at each update rate.
+
+    Parameters
+    ----------
+    test_names : list of str, optional
+        The ``*_connect`` tests.  Defaults to ``flat_connect`` and
+        ``mixed_connect``.
+
+    rates : list of float, optional
+        The update rates, in Hz.  Defaults to :data:`DEFAULT_RATES`.
+
+    duration : float, optional
+        The time to measure each for.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{test_name: {rate: result}}``, see
+        :func:`measure_update_load`.
+    """
+    return {
+        test_name: {
+            rate: measure_update_load(test_name, rate=rate, duration=duration) for rate in rates or DEFAULT_RATES
+        }
+        for test_name in test_names or ["flat_connect", "mixed_connect"]
+    }
+
+
+def print_report(report: Dict[str, Dict[float, Dict[str, float]]]) -> None:
+    """Print a report from :func:`stress_report`."""
+    print(
+        f"{'test':<16} {'rate (Hz)':>9} {'IOC (Hz)':>9} {'PVs':>5} {'updates/s':>10} {'value p95 (ms)':>15} "
+        f"{'loop p95 (ms)':>14} {'loop max (ms)':>14} {'dropped':>8} {'CPU':>6} {'CPU/update (us)':>16}"
+    )
+    for test_name, results in report.items():
+        for rate, result in results.items():
+            print(
+                f"{test_name:<16} {rate:>9.1f} {result['ioc_rate']:>9.1f} {result['pvs']:>5} "
+                f"{result['update_rate']:>10.0f} "
+                f"{result['value_latency_p95'] * 1e3:>15.1f} {result['loop_latency_p95'] * 1e3:>14.1f} "
+                f"{result['loop_latency_max'] * 1e3:>14.1f} {result['dropped_frames']:>8} "
+                f"{result['cpu_fraction']:>6.0%} {result['cpu_per_update'] * 1e6:>16.0f}"
+            )
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    print_report(stress_report(sys.argv[1:] or None))
@@ -0,0 +1,129 @@
+"""
+Stylesheet polish benchmarks.
+
+These time the creation and first display of a nested composite device
+display with a tiny and a big application stylesheet, with stylesheet
+reloads applied immediately or batched by way of
+:class:`typhos.utils.StylesheetReloadScheduler`. They may be run on their
+own with the following:
+
+```
+python -m typhos.benchmark.stylesheet [num_repeats]
+```
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Dict
+
+from ophyd.signal import Signal
+from qtpy import QtWidgets
+
+from .. import utils
+from ..display import TyphosDeviceDisplay
+from .device import make_test_device_class
+from .utils import unique_device_name
+
+STYLESHEETS = {
+    "tiny": utils.MODULE_PATH / "tests" / "utils" / "tiny_stylesheet.qss",
+    "big": utils.MODULE_PATH / "tests" / "utils" / "big_stylesheet.qss",
+}
+
+
+def measure_display_time(
+    stylesheet: str,
+    batched: bool,
+    count: int = 3,
+    subdevice_layers: int = 2,
+    subdevice_spread: int = 4,
+) -> float:
+    """
+    Measure the average time in seconds to create and show a nested display.
+
+    Parameters
+    ----------
+    stylesheet : str
+        The application stylesheet to use.
+
+    batched : bool
+        Batch stylesheet reloads, or apply them immediately.
+
+    count : int, optional
+        The number of displays to create.
+
+    subdevice_layers : int, optional
+        The depth of the test device.
+
+    subdevice_spread : int, optional
+        The number of sub-devices per layer of the test device.
+    """
+    app = QtWidgets.QApplication.instance()
+    scheduler = utils.get_stylesheet_reload_scheduler()
+    scheduler.flush()
+    previous_sheet = app.styleSheet()
+    previous_enabled = scheduler.enabled
+    app.setStyleSheet(stylesheet)
+    scheduler.enabled = batched
+
+    cls = make_test_device_class(
+        name="StylesheetBenchmark",
+        signal_class=Signal,
+        num_signals=4,
+        subdevice_layers=subdevice_layers,
+        subdevice_spread=subdevice_spread,
+    )
+    elapsed = 0.0
+    try:
+        for _ in range(count):
+            device = cls(name=unique_device_name("stylesheet_benchmark"))
+            t0 = time.perf_counter()
+            display = TyphosDeviceDisplay.from_device(
+                device,
+                display_type="detailed_screen",
+                threaded_template_search=False,
+            )
+            display.show()
+            app.processEvents()
+            elapsed += time.perf_counter() - t0
+            display.close()
+            display.deleteLater()
+            app.processEvents()
+    finally:
+        scheduler.enabled = previous_enabled
+        app.setStyleSheet(previous_sheet)
+    return elapsed / count
+
+
+def stylesheet_report(count: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Report display time with immediate and batched stylesheet reloads.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{stylesheet: {"immediate": seconds, "batched": seconds}}``.
+    """
+    report = {}
+    for name, filename in STYLESHEETS.items():
+        stylesheet = filename.read_text()
+        # Warm up caches (templates, stylesheet parsing) prior to timing
+        measure_display_time(stylesheet, batched=True, count=1)
+        report[name] = {
+            "immediate": measure_display_time(stylesheet, batched=False, count=count),
+            "batched": measure_display_time(stylesheet, batched=True, count=count),
+        }
+    return report
+
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+    """Print a report from :func:`stylesheet_report`."""
+    print(f"{'stylesheet':<12} {'immediate (ms)':>15} {'batched (ms)':>13}")
+    for name, result in report.items():
+        print(f"{name:<12} {result['immediate'] * 1e3:>15.1f} {result['batched'] * 1e3:>13.1f}")
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    print_report(stylesheet_report(int(sys.argv[1]) if len(sys.argv) > 1 else 3))
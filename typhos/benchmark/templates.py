@@ -0,0 +1,111 @@
+"""
+Template loading benchmarks.
+
+These compare loading a ``.ui`` template through
+``pydm.Display.load_ui_from_file``, which parses the file and substitutes
+macros every time, against :func:`typhos.utils.load_ui_file`, which uses the
+compiled template cache. They may be run on their own with the following:
+
+```
+python -m typhos.benchmark.templates [num_loads]
+```
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable, Dict, Optional
+
+import pydm
+from qtpy import QtWidgets
+
+from .. import utils
+from ..cache import get_global_template_cache
+
+DEFAULT_TEMPLATES = [
+    utils.ui_core_dir / "embedded_screen.ui",
+    utils.ui_core_dir / "detailed_screen.ui",
+    utils.ui_core_dir / "engineering_screen.ui",
+]
+
+
+def _load_with_pydm(filename: str, macros: Dict[str, str]) -> QtWidgets.QWidget:
+    display = pydm.Display(macros=macros)
+    display.load_ui_from_file(filename, macros)
+    return display
+
+
+def _load_with_cache(filename: str, macros: Dict[str, str]) -> QtWidgets.QWidget:
+    return utils.load_ui_file(filename, macros=macros)
+
+
+def measure_load_time(
+    load: Callable[[str, Dict[str, str]], QtWidgets.QWidget],
+    filename: str,
+    count: int = 100,
+) -> float:
+    """
+    Measure the average time in seconds to load ``filename`` with ``load``.
+
+    Each load gets distinct macros, as it would for different devices.
+    """
+    elapsed = 0.0
+    for idx in range(count):
+        macros = {"name": f"device{idx}", "prefix": f"PREFIX{idx}:"}
+        t0 = time.perf_counter()
+        widget = load(str(filename), macros)
+        elapsed += time.perf_counter() - t0
+        widget.deleteLater()
+    QtWidgets.QApplication.processEvents()
+    return elapsed / count
+
+
+def template_load_report(
+    count: int = 100,
+    templates: Optional[list] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Report the average template load time with and without the cache.
+
+    The template cache is warmed with a single load before measuring, as it
+    would be after the first device of a suite loads its template.
+
+    Parameters
+    ----------
+    count : int, optional
+        The number of loads per template and method.
+
+    templates : list of path-like, optional
+        Templates to load. Defaults to the built-in typhos templates.
+
+    Returns
+    -------
+    report : dict
+        With the form ``{template: {"pydm": seconds, "cached": seconds}}``.
+    """
+    report = {}
+    for filename in templates or DEFAULT_TEMPLATES:
+        get_global_template_cache().get(filename)
+        report[str(filename)] = {
+            "pydm": measure_load_time(_load_with_pydm, filename, count),
+            "cached": measure_load_time(_load_with_cache, filename, count),
+        }
+    return report
+
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+    """Print a report from :func:`template_load_report`."""
+    print(f"{'template':<28} {'pydm (ms)':>10} {'cached (ms)':>12} {'speedup':>8}")
+    for filename, result in report.items():
+        name = filename.rsplit("/", 1)[-1]
+        print(
+            f"{name:<28} {result['pydm'] * 1e3:>10.2f} "
+            f"{result['cached'] * 1e3:>12.2f} "
+            f"{result['pydm'] / result['cached']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    print_report(template_load_report(int(sys.argv[1]) if len(sys.argv) > 1 else 100))
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
+import itertools
 import logging
 import pkgutil
 import typing
@@ -40,23 +41,37 @@ def caproto_context(
     prefix: str,
     full_test_name: str,
     request: Optional[pytest.FixtureRequest] = None,
+    pv_to_check: str = "",
+    rate: Optional[float] = None,
 ):
     """
     Yields a caproto process with all elements of the input device.
 
     The caproto IOC will be run in a background process, making it suitable for
-    testing devices in the main process.
+    testing devices in the main process.  If ``pv_to_check`` is given, this
+    waits for the IOC to serve it prior to yielding.  Without a pytest
+    ``request`` to tie the IOC to, it is stopped on exiting the context.
+    With ``rate``, the IOC updates all PVs at that rate in Hz.
     """
     if not has_caproto:
         raise ImportError(_optional_err)
 
-    run_example_ioc(
+    args = [prefix, full_test_name]
+    if rate:
+        args += ["--rate", str(rate)]
+
+    process = run_example_ioc(
         "typhos.benchmark.ioc",
-        args=[prefix, full_test_name],
-        pv_to_check="",
+        args=args,
+        pv_to_check=pv_to_check,
         request=request,
     )
-    yield
+    try:
+        yield
+    finally:
+        if request is None:
+            process.terminate()
+            process.wait()
 
 
 def random_prefix():
@@ -64,6 +79,15 @@ def random_prefix():
     return str(uuid.uuid4())[:8] + ":"
 
 
+# Device names must be unique for the sig:// plugin
+_device_counter = itertools.count()
+
+
+def unique_device_name(prefix: str) -> str:
+    """Returns a device name starting with ``prefix``, unique to this process."""
+    return f"{prefix}{next(_device_counter)}"
+
+
 def is_native(obj, module):
     """
     Determines if obj was defined in module.
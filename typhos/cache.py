@@ -1,11 +1,18 @@
+import atexit
+import copy
 import fnmatch
 import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
 import re
+import string
+import threading
 import time
 
+import qtpy
 from qtpy import QtCore
 
 from . import utils
@@ -19,6 +26,8 @@ logger = logging.getLogger(__name__)
 _GLOBAL_WIDGET_TYPE_CACHE = None
 _GLOBAL_DESCRIBE_CACHE = None
 _GLOBAL_DISPLAY_PATH_CACHE = None
+_GLOBAL_TEMPLATE_CACHE = None
+_GLOBAL_HAPPI_ITEM_CACHE = None
 
 
 def get_global_describe_cache():
@@ -45,6 +54,23 @@ def get_global_display_path_cache():
     return _GLOBAL_DISPLAY_PATH_CACHE
 
 
+def get_global_template_cache():
+    """Get the _GlobalTemplateCache singleton."""
+    global _GLOBAL_TEMPLATE_CACHE
+    if _GLOBAL_TEMPLATE_CACHE is None:
+        _GLOBAL_TEMPLATE_CACHE = _GlobalTemplateCache()
+    return _GLOBAL_TEMPLATE_CACHE
+
+
+def get_global_happi_item_cache():
+    """Get the _GlobalHappiItemCache singleton."""
+    global _GLOBAL_HAPPI_ITEM_CACHE
+    if _GLOBAL_HAPPI_ITEM_CACHE is None:
+        _GLOBAL_HAPPI_ITEM_CACHE = _GlobalHappiItemCache()
+        atexit.register(_GLOBAL_HAPPI_ITEM_CACHE.flush)
+    return _GLOBAL_HAPPI_ITEM_CACHE
+
+
 class _GlobalDescribeCache(QtCore.QObject):
     """
     Cache of ophyd object descriptions.
@@ -344,3 +370,415 @@ class _GlobalDisplayPathCache:
         path = _CachedPath(path, stale_threshold=TYPHOS_DISPLAY_PATH_CACHE_TIME)
         if path not in self.paths:
             self.paths.append(path)
+
+
+def _get_cache_dir(cache_dir, name):
+    """
+    The on-disk cache directory, defaulting to ``name`` in the per-user cache
+    directory if ``cache_dir`` is None, or None if disabled.
+    """
+    if cache_dir is None:
+        # platformdirs is only needed if the default is used
+        import platformdirs
+
+        cache_dir = platformdirs.user_cache_path("typhos") / name
+    return pathlib.Path(cache_dir).expanduser() if str(cache_dir).strip() else None
+
+
+# The on-disk directory for precompiled templates, by default in the per-user
+# cache directory.  Set to an empty string to disable reading from and writing
+# to disk.
+TYPHOS_TEMPLATE_CACHE_DIR = os.environ.get("TYPHOS_TEMPLATE_CACHE_DIR")
+
+
+class _CompiledTemplate:
+    """
+    A .ui template compiled to Python source, prior to macro substitution.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The resolved template path.
+    stamp : tuple
+        The file modification time (ns) and size at compile time.
+    code : str
+        The Python source generated by ``uic``.
+    class_name : str
+        The name of the generated class, e.g. ``Ui_Form``.
+    """
+
+    def __init__(self, path, stamp, code, class_name):
+        self.path = path
+        self.stamp = tuple(stamp)
+        self.code = code
+        self.class_name = class_name
+        # ``safe_substitute`` also un-escapes ``$$``, so treat that as a macro
+        self.has_macros = bool(string.Template(code).get_identifiers()) or "$$" in code
+        self._ui_class = None
+
+    def _exec(self, code):
+        """Execute the generated code and return the generated class."""
+        ui_globals = {}
+        exec(compile(code, str(self.path), "exec"), ui_globals)
+        return ui_globals[self.class_name]
+
+    def get_ui_class(self, macros=None):
+        """
+        Get the generated class, substituting ``macros`` as necessary.
+
+        Templates without macros are executed only once and shared between
+        all instances.
+        """
+        if macros and self.has_macros:
+            import pydm.utilities.macro as pydm_macro
+
+            code = pydm_macro.replace_macros_in_template(string.Template(self.code), macros).getvalue()
+            return self._exec(code)
+
+        if self._ui_class is None:
+            self._ui_class = self._exec(self.code)
+        return self._ui_class
+
+    def to_json(self):
+        """Serialize the template for the on-disk cache."""
+        return json.dumps(
+            dict(
+                path=str(self.path),
+                stamp=list(self.stamp),
+                code=self.code,
+                class_name=self.class_name,
+            )
+        )
+
+
+class _GlobalTemplateCache:
+    """
+    A cache of compiled .ui templates, keyed on path and modification time.
+
+    Compiling a .ui file with ``uic`` parses the entire XML document.  This
+    cache performs that step once per file and modification time, leaving
+    only macro substitution (if necessary) and widget creation for each
+    instance.  Templates precompiled with :meth:`precompile` are stored on
+    disk in ``TYPHOS_TEMPLATE_CACHE_DIR`` and shared between processes.
+
+    Attributes
+    ----------
+    cache : dict
+        The cache of :class:`_CompiledTemplate`, keyed on resolved path.
+    cache_dir : pathlib.Path or None
+        The on-disk cache directory, if enabled.
+    """
+
+    def __init__(self, cache_dir=TYPHOS_TEMPLATE_CACHE_DIR):
+        self.cache = {}
+        self.cache_dir = _get_cache_dir(cache_dir, "templates")
+
+    def clear(self):
+        """Clear the in-memory cache."""
+        self.cache.clear()
+
+    @staticmethod
+    def _get_stamp(path):
+        """Get the (modification time, size) stamp of ``path``."""
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_disk_filename(self, path):
+        """The on-disk cache filename for the template at ``path``."""
+        import pydm
+
+        # uic output may vary between versions; keep them separate
+        key = "|".join((str(path), pydm.__version__, qtpy.API_NAME, qtpy.QT_VERSION or ""))
+        return self.cache_dir / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _load_from_disk(self, path, stamp):
+        """Load a precompiled template from disk, if available and current."""
+        if self.cache_dir is None:
+            return None
+
+        try:
+            with open(self._get_disk_filename(path)) as fp:
+                info = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Failed to load precompiled template for %s", path, exc_info=True)
+            return None
+
+        if tuple(info["stamp"]) != stamp or info["path"] != str(path):
+            logger.debug("Precompiled template for %s is out of date", path)
+            return None
+
+        return _CompiledTemplate(path, stamp, info["code"], info["class_name"])
+
+    @staticmethod
+    def _compile(path, stamp, reuse=True):
+        """
+        Compile the template at ``path`` with pydm's loader.
+
+        pydm caches the compiled code per path for the whole process, so it
+        is bypassed unless ``reuse`` is set, as when the file has changed.
+        """
+        from pydm.display import _compile_ui_file
+
+        if not reuse:
+            _compile_ui_file = _compile_ui_file.__wrapped__
+        code, class_name = _compile_ui_file(str(path))
+        return _CompiledTemplate(path, stamp, code, class_name)
+
+    def get(self, filename):
+        """
+        Get the compiled template for ``filename``.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The .ui file.
+
+        Returns
+        -------
+        template : _CompiledTemplate
+        """
+        path = pathlib.Path(filename).resolve()
+        stamp = self._get_stamp(path)
+        template = self.cache.get(path)
+        if template is not None and template.stamp == stamp:
+            return template
+
+        template = self._load_from_disk(path, stamp) or self._compile(path, stamp, reuse=template is None)
+        self.cache[path] = template
+        return template
+
+    def precompile(self, filename):
+        """
+        Compile ``filename`` and store it in the on-disk cache.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The .ui file.
+
+        Returns
+        -------
+        cache_filename : pathlib.Path
+            The on-disk cache file.
+        """
+        if self.cache_dir is None:
+            raise RuntimeError("The on-disk template cache is disabled (TYPHOS_TEMPLATE_CACHE_DIR)")
+
+        path = pathlib.Path(filename).resolve()
+        template = self._compile(path, self._get_stamp(path), reuse=False)
+        self.cache[path] = template
+
+        cache_filename = self._get_disk_filename(path)
+        cache_filename.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically, as other processes may be reading the cache
+        temp_filename = cache_filename.with_suffix(f".{os.getpid()}.tmp")
+        temp_filename.write_text(template.to_json())
+        os.replace(temp_filename, cache_filename)
+        return cache_filename
+
+
+# The on-disk directory for resolved happi items, by default in the per-user
+# cache directory.  Set to an empty string to disable reading from and writing
+# to disk.
+TYPHOS_HAPPI_CACHE_DIR = os.environ.get("TYPHOS_HAPPI_CACHE_DIR")
+
+
+class _GlobalHappiItemCache:
+    """
+    A cache of happi item documents, keyed on database path and modification time.
+
+    Finding an item in a happi JSON database parses the entire database.  This
+    cache keeps the documents of items that have been looked up by name - the
+    container class, arguments and metadata - both in memory and on disk in
+    ``TYPHOS_HAPPI_CACHE_DIR``, such that later lookups and later processes
+    skip the parse entirely until the database file is modified.  Databases
+    without a backing file are always queried directly.
+
+    Documents found in the meantime are written to disk together, once no
+    more have been found for ``save_delay`` seconds, on :meth:`flush` or -
+    for the global cache - at exit.
+
+    Attributes
+    ----------
+    cache : dict
+        The cached documents, keyed on resolved database path, of the form
+        ``{path: (stamp, {name: document})}``.
+    cache_dir : pathlib.Path or None
+        The on-disk cache directory, if enabled.
+    save_delay : float
+        The time to wait for further documents prior to writing to disk, in
+        seconds.
+    """
+
+    save_delay = 1.0
+
+    def __init__(self, cache_dir=TYPHOS_HAPPI_CACHE_DIR):
+        self.cache = {}
+        self.cache_dir = _get_cache_dir(cache_dir, "happi")
+        self._lock = threading.Lock()
+        self._unsaved = set()
+        self._save_timer = None
+
+    def clear(self):
+        """Clear the in-memory cache, discarding any unsaved documents."""
+        with self._lock:
+            self.cache.clear()
+            self._unsaved.clear()
+
+    def flush(self):
+        """Write documents found since the last write to disk."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            unsaved, self._unsaved = self._unsaved, set()
+            for path in unsaved:
+                if path in self.cache:
+                    stamp, documents = self.cache[path]
+                    self._save_to_disk(path, stamp, documents)
+
+    def _schedule_save(self, path):
+        """Write the documents of ``path`` to disk after ``save_delay``."""
+        if self.cache_dir is None:
+            return
+        self._unsaved.add(path)
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    @staticmethod
+    def _get_database_path(client):
+        """The resolved path of the database file for ``client``, if any."""
+        path = getattr(getattr(client, "backend", None), "path", None)
+        if not isinstance(path, (str, os.PathLike)) or not os.path.isfile(path):
+            return None
+        return pathlib.Path(path).resolve()
+
+    @staticmethod
+    def _get_stamp(path):
+        """Get the (modification time, size) stamp of ``path``."""
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_disk_filename(self, path):
+        """The on-disk cache filename for the database at ``path``."""
+        return self.cache_dir / (hashlib.sha1(str(path).encode("utf-8")).hexdigest() + ".json")
+
+    def _load_from_disk(self, path, stamp):
+        """Load cached documents from disk, if available and current."""
+        if self.cache_dir is None:
+            return {}
+
+        try:
+            with open(self._get_disk_filename(path)) as fp:
+                info = json.load(fp)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.debug("Failed to load cached happi items for %s", path, exc_info=True)
+            return {}
+
+        if tuple(info["stamp"]) != stamp or info["path"] != str(path):
+            logger.debug("Cached happi items for %s are out of date", path)
+            return {}
+        return info["documents"]
+
+    def _save_to_disk(self, path, stamp, documents):
+        """Store the cached documents on disk."""
+        if self.cache_dir is None:
+            return
+
+        cache_filename = self._get_disk_filename(path)
+        try:
+            cache_filename.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically, as other processes may be reading the cache
+            temp_filename = cache_filename.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_filename.write_text(json.dumps(dict(path=str(path), stamp=list(stamp), documents=documents)))
+            os.replace(temp_filename, cache_filename)
+        except Exception:
+            logger.debug("Failed to store cached happi items for %s", path, exc_info=True)
+
+    def _get_documents(self, path, stamp):
+        """The cached documents for the database at ``path``, if current."""
+        cached_stamp, documents = self.cache.get(path, (None, None))
+        if cached_stamp != stamp:
+            documents = self._load_from_disk(path, stamp)
+            self.cache[path] = (stamp, documents)
+        return documents
+
+    def find_document(self, client, name):
+        """
+        Find the document for the happi item ``name``.
+
+        Parameters
+        ----------
+        client : happi.Client
+            The happi client.
+        name : str
+            The item name.
+
+        Returns
+        -------
+        document : dict
+
+        Raises
+        ------
+        happi.errors.SearchError
+            If no item of the given name is found.
+        """
+        path = self._get_database_path(client)
+        if path is None:
+            return client.find_document(name=name)
+
+        stamp = self._get_stamp(path)
+        with self._lock:
+            document = self._get_documents(path, stamp).get(name)
+        if document is not None:
+            # Callers may modify the document
+            return copy.deepcopy(document)
+
+        document = client.find_document(name=name)
+        with self._lock:
+            self._get_documents(path, stamp)[name] = copy.deepcopy(document)
+            self._schedule_save(path)
+        return document
+
+    def find_item(self, client, name):
+        """
+        Find the happi item ``name``.  See :meth:`find_document`.
+
+        Returns
+        -------
+        item : happi.HappiItem
+        """
+        if self._get_database_path(client) is None:
+            # Only items from database files are cached
+            return client.find_item(name=name)
+
+        # As the client does, such that saving the item updates its entry
+        return client._get_item_from_document(self.find_document(client, name))
+
+    def load_device(self, client, name, use_cache=True):
+        """
+        Find the happi item ``name`` and instantiate it.
+
+        Parameters
+        ----------
+        client : happi.Client
+            The happi client.
+        name : str
+            The item name.
+        use_cache : bool, optional
+            Re-use a previously instantiated device.  See
+            :func:`happi.loader.from_container`.
+
+        Returns
+        -------
+        device : object
+        """
+        from happi.loader import from_container
+
+        return from_container(self.find_item(client, name), use_cache=use_cache)
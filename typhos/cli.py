@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import argparse
 import ast
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import inspect
+import json
 import logging
+import multiprocessing
+import os
+import pathlib
 import re
 import signal
 import sys
+import time
 import types
-from typing import Optional
+from typing import Callable, Optional
 
 import coloredlogs
 import pcdsutils
@@ -19,17 +28,34 @@ from pydm.widgets.template_repeater import FlowLayout
 from qtpy import QtCore, QtWidgets
 
 from . import __version__ as typhos_version
-from . import utils
-from .app import get_qapp, launch_suite
+from . import server, utils
+from .app import create_window, get_qapp, launch_suite
+from .benchmark import phases
 from .benchmark.cases import run_benchmarks
 from .benchmark.profile import profiler_context
+from .benchmark.sampler import install_signal_handler, sampler_context
+from .cache import get_global_happi_item_cache, get_global_template_cache
 from .display import DisplayTypes, ScrollOptions, TyphosDeviceDisplay
-from .export import export_as_ui
+from .export import export_as_ui, export_device_as_ui
 from .suite import TyphosSuite
-from .utils import apply_standard_stylesheets, compose_stylesheets, nullcontext
+from .utils import apply_standard_stylesheets, compose_stylesheets, nullcontext, preconnect_device
 
 logger = logging.getLogger(__name__)
 
+# Default maximum number of devices instantiated at once
+DEFAULT_LOAD_WORKERS = 16
+# Manifest written alongside bulk-exported .ui files
+EXPORT_MANIFEST = "manifest.json"
+# Index written alongside batch screenshots
+SCREENSHOT_INDEX = "index.json"
+# Default time to wait for a display to load prior to a batch screenshot, in seconds
+DEFAULT_SCREENSHOT_TIMEOUT = 30.0
+# Interval at which the Qt event loop yields to Python signal handlers, in ms
+SIGNAL_WAKEUP_INTERVAL = 500
+
+# Timer letting Python signal handlers run while the Qt event loop is idle
+_signal_wakeup_timer = None
+
 
 class TyphosArguments(types.SimpleNamespace):
     """Type hints for ``typhos`` CLI entrypoint arguments."""
@@ -43,16 +69,38 @@ class TyphosArguments(types.SimpleNamespace):
     hide_displays: bool
     happi_cfg: Optional[str]
     fake_device: bool
+    load_workers: Optional[int]
+    preconnect: bool
     version: bool
     verbose: bool
     dark: bool
     stylesheet_override: Optional[list[str]]
     stylesheet_add: Optional[list[str]]
+    stylesheet_scope: str
     profile_modules: Optional[list[str]]
     profile_output: Optional[str]
+    profile_sampler: Optional[str]
+    profile_signal: bool
     benchmark: Optional[list[str]]
+    benchmark_report: Optional[str]
+    benchmark_count: int
+    benchmark_compare: Optional[list[str]]
     exit_after: Optional[float]
     screenshot_filename: Optional[str]
+    screenshot_batch: Optional[str]
+    screenshot_query: Optional[list[str]]
+    screenshot_workers: Optional[int]
+    screenshot_timeout: float
+    export: str
+    export_backend: str
+    export_dir: Optional[str]
+    export_query: Optional[list[str]]
+    export_workers: Optional[int]
+    export_force: bool
+    precompile_templates: Optional[list[str]]
+    server: bool
+    attach: bool
+    socket: Optional[str]
 
 
 # Argument Parser Setup
@@ -133,6 +181,23 @@ parser.add_argument(
         "typhos --fake-device ophyd.EpicsMotor[]"
     ),
 )
+parser.add_argument(
+    "--load-workers",
+    type=int,
+    help=(
+        "The maximum number of devices to instantiate at once. "
+        f"Defaults to one per device, up to {DEFAULT_LOAD_WORKERS}."
+    ),
+)
+parser.add_argument(
+    "--preconnect",
+    action="store_true",
+    help=(
+        "Start connecting the device signals shown by default in the "
+        "background as soon as each device is instantiated, such that values "
+        "and metadata are available by the time the displays subscribe to them."
+    ),
+)
 parser.add_argument(
     "--version",
     "-V",
@@ -165,6 +230,17 @@ parser.add_argument(
         "but not over a template or widget's styleSheet property."
     ),
 )
+parser.add_argument(
+    "--stylesheet-scope",
+    choices=["application", "suite"],
+    default="application",
+    help=(
+        "Apply the stylesheets to the whole application (default) or only to "
+        "the suite window. Scoping to the suite makes creating widgets "
+        "elsewhere in the application faster, but leaves other windows "
+        "unstyled."
+    ),
+)
 parser.add_argument(
     "--profile-modules",
     nargs="*",
@@ -179,6 +255,25 @@ parser.add_argument(
     "--profile-output",
     help=("Filename to output the profile results to. If omitted, prints results to stdout. Turns on line profiling."),
 )
+parser.add_argument(
+    "--profile-sampler",
+    metavar="FILENAME",
+    help=(
+        "Sample the Python stacks of all threads during the execution, "
+        "saving them to FILENAME on exit: as a speedscope profile if it "
+        "ends in .json, or as collapsed stacks for flame graphs otherwise."
+    ),
+)
+parser.add_argument(
+    "--profile-signal",
+    action="store_true",
+    help=(
+        "Start the sampling profiler when the suite or server process "
+        "receives SIGUSR2, and stop it and save the results on the next "
+        "SIGUSR2: to the --profile-sampler FILENAME if given, or to "
+        "typhos-profile-PID.json in the temporary directory."
+    ),
+)
 parser.add_argument(
     "--benchmark",
     nargs="*",
@@ -190,6 +285,27 @@ parser.add_argument(
         "Turns on line profiling."
     ),
 )
+parser.add_argument(
+    "--benchmark-report",
+    metavar="FILENAME",
+    help=(
+        "Record the wall-clock time to reach each loading phase of the "
+        "--benchmark tests, or all of them, to this JSON file instead of "
+        "profiling them."
+    ),
+)
+parser.add_argument(
+    "--benchmark-count",
+    type=int,
+    default=5,
+    help="The number of timed runs of each test for --benchmark-report. Defaults to 5.",
+)
+parser.add_argument(
+    "--benchmark-compare",
+    nargs=2,
+    metavar=("OLD", "NEW"),
+    help=("Compare two --benchmark-report files and flag the phases which are significantly slower in the new one."),
+)
 parser.add_argument(
     "--exit-after",
     type=float,
@@ -205,9 +321,114 @@ parser.add_argument(
         "device, and name."
     ),
 )
+parser.add_argument(
+    "--screenshot-batch",
+    metavar="DIR",
+    help=(
+        "Instead of loading a suite, save a screenshot of each device's "
+        "display to this directory, spread over offscreen worker processes. "
+        "Each screenshot is taken once all widgets have loaded and received "
+        "values, and an index of the results and timings is written to "
+        "index.json."
+    ),
+)
+parser.add_argument(
+    "--screenshot-query",
+    nargs="*",
+    metavar="KEY=VALUE",
+    help="Also take screenshots of the happi items matching this search with --screenshot-batch. See --export-query.",
+)
+parser.add_argument(
+    "--screenshot-workers",
+    type=int,
+    help="The number of processes used with --screenshot-batch. Defaults to one per CPU.",
+)
+parser.add_argument(
+    "--screenshot-timeout",
+    type=float,
+    default=DEFAULT_SCREENSHOT_TIMEOUT,
+    help=(
+        "The time to wait for each display to load with --screenshot-batch, "
+        "in seconds. Displays still loading are captured as they are."
+    ),
+)
 parser.add_argument(
     "--export", default="", help="Instead of loading a suite, export the first device as a pure pydm ui file."
 )
+parser.add_argument(
+    "--export-backend",
+    choices=("display", "device"),
+    default="display",
+    help=(
+        "How to export with --export and --export-dir: from a typhos display "
+        "(the default), or straight from the device class and signal "
+        "descriptions without creating any widgets."
+    ),
+)
+parser.add_argument(
+    "--export-dir",
+    help=(
+        "Instead of loading a suite, export all devices as pure pydm ui "
+        "files in this directory, in parallel. Devices unchanged since the "
+        "last export to the directory are skipped, and a manifest of the "
+        "results is written to manifest.json."
+    ),
+)
+parser.add_argument(
+    "--export-query",
+    nargs="*",
+    metavar="KEY=VALUE",
+    help=(
+        "Also export the happi items matching this search with --export-dir, "
+        "e.g. device_class=pcdsdevices.* (values are regular expressions). "
+        "If no search terms are specified, exports all items."
+    ),
+)
+parser.add_argument(
+    "--export-workers",
+    type=int,
+    help="The number of processes used with --export-dir. Defaults to one per CPU.",
+)
+parser.add_argument(
+    "--export-force",
+    action="store_true",
+    help="Export all devices with --export-dir, including those unchanged since the last export.",
+)
+parser.add_argument(
+    "--precompile-templates",
+    nargs="*",
+    metavar="PATH",
+    help=(
+        "Instead of loading a suite, compile the .ui templates in the given "
+        "directories (or files) into the on-disk template cache. "
+        "If no paths are specified, uses all display paths."
+    ),
+)
+parser.add_argument(
+    "--server",
+    action="store_true",
+    help=(
+        "Instead of loading a suite, keep a warmed-up typhos process "
+        "running which opens suites in new windows on request from "
+        "typhos --attach."
+    ),
+)
+parser.add_argument(
+    "--attach",
+    action="store_true",
+    help=(
+        "Ask a running typhos --server to open the suite in a new window, "
+        "rather than starting a new process. The remaining arguments are "
+        "interpreted by the server, sharing its happi database and caches."
+    ),
+)
+parser.add_argument(
+    "--socket",
+    help=(
+        "The socket used by --server and --attach. Defaults to "
+        "$TYPHOS_SERVER_SOCKET, or a socket in the user's runtime directory."
+    ),
+)
 
 
 # Append to module docs
@@ -229,21 +450,49 @@ def typhos_cli_setup(args):
     logger.debug("Set logging level of %r to %r", shown_logger.name, level)
 
     qapp = get_qapp()
+    if args.stylesheet_scope == "suite":
+        # The stylesheet is applied to the suite by way of typhos_run
+        qapp.setStyle(QtWidgets.QStyleFactory.create("Fusion"))
+        return
+
+    typhos_cli_apply_stylesheets(args, qapp)
+
+
+def typhos_cli_setup_sampler(args):
+    """
+    Toggle the sampling profiler on SIGUSR2, saving to ``--profile-sampler``.
+
+    This replaces any previous handler of the signal for the rest of the
+    process, along with waking up the event loop periodically such that the
+    handler runs while the application is idle.  As such, it is only set up
+    for suite and server sessions with ``--profile-signal``.
+    """
+    global _signal_wakeup_timer
+    if not install_signal_handler(args.profile_sampler):
+        return
+    if _signal_wakeup_timer is None:
+        _signal_wakeup_timer = QtCore.QTimer(get_qapp())
+        _signal_wakeup_timer.timeout.connect(lambda: None)
+        _signal_wakeup_timer.start(SIGNAL_WAKEUP_INTERVAL)
+
+
+def typhos_cli_apply_stylesheets(args, widget):
+    """Apply the stylesheets specified by the command-line arguments to ``widget``."""
     logger.debug("Applying stylesheet ...")
     if args.stylesheet_override:
         # Includes some non-stylesheet style settings
         apply_standard_stylesheets(
             include_pydm=False,
-            widget=qapp,
+            widget=widget,
         )
         for filename in args.stylesheet_override:
             logger.info("Loading QSS file %r ...", filename)
-        qapp.setStyleSheet(compose_stylesheets(args.stylesheet_override))
+        widget.setStyleSheet(compose_stylesheets(args.stylesheet_override))
     else:
         apply_standard_stylesheets(
             dark=args.dark,
             paths=args.stylesheet_add,
-            widget=qapp,
+            widget=widget,
         )
 
 
@@ -270,6 +519,8 @@ def create_suite(
     display_type: str = "detailed",
     scroll_option: str = "auto",
     show_displays: bool = True,
+    load_workers: Optional[int] = None,
+    preconnect: bool = False,
 ) -> TyphosSuite:
     """
     Create a TyphosSuite from a list of device names.
@@ -300,21 +551,44 @@ def create_suite(
     show_displays : bool, optional
         If True (default), open all the included device displays.
         If False, do not open any of the displays.
+    load_workers : int, optional
+        The maximum number of devices to instantiate at once.
+    preconnect : bool, optional
+        Start connecting the device signals shown by default in the
+        background as soon as each device is instantiated.  See
+        :func:`typhos.utils.preconnect_device`.
 
     Returns
     -------
     suite : TyphosSuite
-        A suite that has been populated with devices.
+        A suite with the first device that could be instantiated.  The
+        remaining devices are added from the event loop as they are
+        instantiated, such that the suite may be shown in the meantime.
+        ``None`` if no device could be instantiated.
     """
+    futures = collections.deque()
     if device_names:
-        devices = create_devices(device_names, cfg=cfg, fake_devices=fake_devices)
-    else:
-        devices = []
+        futures.extend(
+            submit_devices(
+                device_names,
+                cfg=cfg,
+                fake_devices=fake_devices,
+                max_workers=load_workers,
+                preconnect=preconnect,
+            )
+        )
+
+    devices = []
+    while futures and not devices:
+        device = futures.popleft().result()
+        if device is not None:
+            devices.append(device)
+
     if devices or not device_names:
         layout_obj = get_layout_from_cli(layout, cols)
         display_type_enum = get_display_type_from_cli(display_type)
         scroll_enum = get_scrollable_from_cli(scroll_option)
-        return TyphosSuite.from_devices(
+        suite = TyphosSuite.from_devices(
             devices,
             content_layout=layout_obj,
             default_display_type=display_type_enum,
@@ -322,6 +596,9 @@ def create_suite(
             show_displays=show_displays,
             pin=not show_displays,
         )
+        if futures:
+            SuiteDeviceLoader(suite, futures, show_displays=show_displays)
+        return suite
 
 
 def get_layout_from_cli(
@@ -389,6 +666,18 @@ class FixedColGrid(QtWidgets.QGridLayout):
         self._widget_index += 1
 
 
+def get_size_from_cli(size: Optional[str]) -> Optional[QtCore.QSize]:
+    """Get the window size from a ``width,height`` specification, if any."""
+    if size is None:
+        return None
+    try:
+        return QtCore.QSize(*(int(opt) for opt in size.split(",")))
+    except TypeError as exc:
+        raise ValueError(
+            "Invalid --size argument. Expected a two-element pair of comma-separated integers, e.g. --size 1000,1000"
+        ) from exc
+
+
 def get_display_type_from_cli(display_type: str) -> DisplayTypes:
     """Convert the cli string to the appropriate DisplayTypes enum."""
     display_type = display_type.lower()
@@ -415,8 +704,108 @@ def get_scrollable_from_cli(scrollable: str) -> ScrollOptions:
     raise ValueError(f'{scrollable} is not a valid scroll option. The allowed values are "auto", "true", and "false".')
 
 
-def create_devices(device_names, cfg=None, fake_devices=False):
-    """Returns a list of devices to be included in the typhos suite."""
+# Matches class specifications such as ophyd.sim.SynAxis[{'name': 'foo'}]
+_klass_regex = re.compile(
+    r"([a-zA-Z][a-zA-Z0-9\.\_]*)\[(\{.*})*[\,]*\]"  # noqa
+)
+
+
+def _create_device(device_name, happi_client=None, fake_devices=False):
+    """
+    Instantiate a single device from a happi name or class specification.
+
+    Failures are logged and result in ``None``.
+    """
+    logger.info("Loading %r ...", device_name)
+    result = _klass_regex.findall(device_name)
+    if len(result) > 0:
+        klass, args = result[0]
+        try:
+            klass = pcdsutils.utils.import_helper(klass)
+
+            default_kwargs = {"name": klass.__name__}
+            if args:
+                kwargs = ast.literal_eval(args)
+                default_kwargs.update(kwargs)
+
+            if fake_devices:
+                klass = make_fake_device(klass)
+                # Give default value to missing positional args
+                # This might fail, but is best effort
+                for arg in inspect.getfullargspec(klass).args:
+                    if arg not in default_kwargs and arg != "self":
+                        if arg == "prefix":
+                            default_kwargs[arg] = "FAKE_PREFIX:"
+                        else:
+                            default_kwargs[arg] = "FAKE"
+
+            device = klass(**default_kwargs)
+        except Exception:
+            logger.exception("Unable to load class entry: %s with args %s", klass, args)
+            return None
+
+        if fake_devices:
+            clear_fake_device(device)
+        return device
+
+    if not happi_client:
+        logger.error(
+            "Happi not available. Unable to load entry: %r",
+            device_name,
+        )
+        return None
+    if fake_devices:
+        raise NotImplementedError("Fake devices from happi not supported yet")
+    try:
+        return get_global_happi_item_cache().load_device(happi_client, device_name)
+    except Exception:
+        logger.exception("Unable to load Happi entry: %r", device_name)
+        return None
+
+
+def _create_device_timed(device_name, happi_client=None, fake_devices=False, preconnect=False):
+    """Instantiate a single device, logging the time it took."""
+    t0 = time.monotonic()
+    device = _create_device(device_name, happi_client=happi_client, fake_devices=fake_devices)
+    logger.debug("Loaded %r in %.2f s", device_name, time.monotonic() - t0)
+    if preconnect and device is not None:
+        try:
+            preconnect_device(device)
+        except Exception:
+            logger.exception("Failed to pre-connect %r", device_name)
+    return device
+
+
+def submit_devices(device_names, cfg=None, fake_devices=False, max_workers=None, preconnect=False):
+    """
+    Start instantiating devices in a thread pool.
+
+    Parameters
+    ----------
+    device_names : list of str
+        The happi names associated with the devices to instantiate,
+        or the full class specifications from the cli. These two
+        styles can be mixed.
+    cfg : str, optional
+        The happi configuration file to use. If omitted, uses
+        the environment variables specified by happi.
+    fake_devices : bool, optional
+        If True, use fake devices behind the screen instead of
+        making real connections.
+    max_workers : int, optional
+        The maximum number of devices to instantiate at once. Defaults to
+        one per device, up to :data:`DEFAULT_LOAD_WORKERS`.
+    preconnect : bool, optional
+        Start connecting the signals of each device in the background once
+        instantiated.  See :func:`typhos.utils.preconnect_device`.
+
+    Returns
+    -------
+    futures : list of concurrent.futures.Future
+        One per device name, in order, resulting in the device or ``None``
+        if it failed to load.
+    """
+    device_names = list(device_names)
     logger.debug("Accessing Happi Client ...")
 
     try:
@@ -425,60 +814,155 @@ def create_devices(device_names, cfg=None, fake_devices=False):
         logger.debug("Unable to create a happi client.", exc_info=True)
         happi_client = None
 
-    # Load and add each device
-    devices = list()
+    if max_workers is None:
+        max_workers = min(len(device_names), DEFAULT_LOAD_WORKERS)
 
-    klass_regex = re.compile(
-        r"([a-zA-Z][a-zA-Z0-9\.\_]*)\[(\{.*})*[\,]*\]"  # noqa
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(max_workers, 1),
+        thread_name_prefix="typhos_device_load",
     )
+    futures = [
+        executor.submit(
+            _create_device_timed,
+            device_name,
+            happi_client=happi_client,
+            fake_devices=fake_devices,
+            preconnect=preconnect,
+        )
+        for device_name in device_names
+    ]
+    # The threads exit once the submitted devices are loaded
+    executor.shutdown(wait=False)
+    return futures
 
-    for device_name in device_names:
-        logger.info("Loading %r ...", device_name)
-        result = klass_regex.findall(device_name)
-        if len(result) > 0:
-            try:
-                klass, args = result[0]
-                klass = pcdsutils.utils.import_helper(klass)
-
-                default_kwargs = {"name": klass.__name__}
-                if args:
-                    kwargs = ast.literal_eval(args)
-                    default_kwargs.update(kwargs)
-
-                if fake_devices:
-                    klass = make_fake_device(klass)
-                    # Give default value to missing positional args
-                    # This might fail, but is best effort
-                    for arg in inspect.getfullargspec(klass).args:
-                        if arg not in default_kwargs and arg != "self":
-                            if arg == "prefix":
-                                default_kwargs[arg] = "FAKE_PREFIX:"
-                            else:
-                                default_kwargs[arg] = "FAKE"
-
-                device = klass(**default_kwargs)
-                devices.append(device)
 
-            except Exception:
-                logger.exception("Unable to load class entry: %s with args %s", klass, args)
-                continue
-        else:
-            if not happi_client:
-                logger.error(
-                    "Happi not available. Unable to load entry: %r",
-                    device_name,
-                )
-                continue
-            if fake_devices:
-                raise NotImplementedError("Fake devices from happi not supported yet")
-            try:
-                device = happi_client.load_device(name=device_name)
-                devices.append(device)
-            except Exception:
-                logger.exception("Unable to load Happi entry: %r", device_name)
-        if fake_devices:
-            clear_fake_device(device)
-    return devices
+def _cancel_futures(futures, *args):
+    """Cancel all futures not yet started."""
+    for future in futures:
+        future.cancel()
+
+
+def iter_devices(device_names, cfg=None, fake_devices=False, max_workers=None, preconnect=False):
+    """
+    Instantiate devices in a thread pool, yielding them as they are ready.
+
+    Devices are yielded in the order of ``device_names``, each as soon as it
+    and its predecessors have been instantiated.  Devices which fail to load
+    are logged and skipped.  See :func:`submit_devices` for the parameters.
+
+    Yields
+    ------
+    device : ophyd.Device
+    """
+    device_names = list(device_names)
+    if not device_names:
+        return
+
+    t0 = time.monotonic()
+    futures = submit_devices(
+        device_names,
+        cfg=cfg,
+        fake_devices=fake_devices,
+        max_workers=max_workers,
+        preconnect=preconnect,
+    )
+    try:
+        for future in futures:
+            device = future.result()
+            if device is not None:
+                yield device
+    finally:
+        # Stop loading if the caller stops iterating or on failure
+        _cancel_futures(futures)
+
+    logger.debug("Loaded %d device(s) in %.2f s", len(device_names), time.monotonic() - t0)
+
+
+class SuiteDeviceLoader(QtCore.QObject):
+    """
+    Add devices to a suite as they are instantiated in the background.
+
+    Devices are added from the event loop, in order, each as soon as it and
+    its predecessors have been instantiated, such that the suite may be
+    shown while the remainder are still loading.  The loader is owned by the
+    suite, and devices not yet being loaded are cancelled if it is closed.
+
+    Parameters
+    ----------
+    suite : TyphosSuite
+        The suite to add devices to.
+    futures : list of concurrent.futures.Future
+        Futures resulting in the devices, as from :func:`submit_devices`.
+    show_displays : bool, optional
+        Open the display of each device once added.
+    """
+
+    _future_done = QtCore.Signal()
+
+    def __init__(self, suite, futures, show_displays=True):
+        super().__init__(parent=suite)
+        self.suite = suite
+        self.show_displays = show_displays
+        self._futures = collections.deque(futures)
+        self._t0 = time.monotonic()
+        self._future_done.connect(self._add_loaded_devices, QtCore.Qt.QueuedConnection)
+        self.destroyed.connect(functools.partial(_cancel_futures, list(futures)))
+        for future in futures:
+            future.add_done_callback(self._emit_future_done)
+
+    @property
+    def pending(self) -> int:
+        """The number of devices yet to be added."""
+        return len(self._futures)
+
+    def _emit_future_done(self, future):
+        """Callback in the loading thread: a device finished loading."""
+        try:
+            self._future_done.emit()
+        except RuntimeError:
+            # The suite was closed in the meantime
+            ...
+
+    @QtCore.Slot()
+    def _add_loaded_devices(self):
+        """Add each device loaded so far whose predecessors are added."""
+        with utils.no_device_lazy_load():
+            while self._futures and self._futures[0].done():
+                future = self._futures.popleft()
+                if future.cancelled() or future.result() is None:
+                    continue
+
+                device = future.result()
+                t0 = time.monotonic()
+                try:
+                    self.suite.add_device(device)
+                    if self.show_displays:
+                        self.suite.show_subdisplay(device)
+                except Exception:
+                    logger.exception("Unable to add %r to TyphosSuite", device.name)
+                else:
+                    logger.debug("Added %r to TyphosSuite in %.2f s", device.name, time.monotonic() - t0)
+
+        if not self._futures:
+            logger.debug("Loaded the remaining devices in %.2f s", time.monotonic() - self._t0)
+            self.deleteLater()
+
+
+def create_devices(device_names, cfg=None, fake_devices=False, max_workers=None, preconnect=False):
+    """
+    Returns a list of devices to be included in the typhos suite.
+
+    Devices are instantiated in a thread pool.  See :func:`iter_devices`.
+    """
+    return list(
+        iter_devices(
+            device_names,
+            cfg=cfg,
+            fake_devices=fake_devices,
+            max_workers=max_workers,
+            preconnect=preconnect,
+        )
+    )
 
 
 def typhos_run(
@@ -493,6 +977,9 @@ def typhos_run(
     show_displays: bool = True,
     exit_after: Optional[float] = None,
     screenshot_filename: Optional[str] = None,
+    apply_style: Optional[Callable[[QtWidgets.QWidget], None]] = None,
+    load_workers: Optional[int] = None,
+    preconnect: bool = False,
 ) -> Optional[QtWidgets.QMainWindow]:
     """
     Run the central typhos part of typhos.
@@ -530,6 +1017,15 @@ def typhos_run(
         this filename pattern prior to exiting early. This name may contain
         f-string style variables,  including: suite_title, widget_title,
         device, and name.
+    apply_style : callable, optional
+        Called with the suite prior to showing it, to apply a stylesheet
+        scoped to the suite rather than the whole application.
+    load_workers : int, optional
+        The maximum number of devices to instantiate at once.
+    preconnect : bool, optional
+        Start connecting the device signals shown by default in the
+        background as soon as each device is instantiated.  See
+        :func:`typhos.utils.preconnect_device`.
 
     Returns
     -------
@@ -547,20 +1043,18 @@ def typhos_run(
             display_type=display_type,
             scroll_option=scroll_option,
             show_displays=show_displays,
+            load_workers=load_workers,
+            preconnect=preconnect,
         )
 
     if suite is None:
         logger.debug("Suite creation failure")
         return None
 
-    if initial_size is not None:
-        try:
-            initial_size = QtCore.QSize(*(int(opt) for opt in initial_size.split(",")))
-        except TypeError as exc:
-            raise ValueError(
-                "Invalid --size argument. Expected a two-element pair "
-                "of comma-separated integers, e.g. --size 1000,1000"
-            ) from exc
+    if apply_style is not None:
+        apply_style(suite)
+
+    initial_size = get_size_from_cli(initial_size)
 
     def exit_early():
         logger.warning("Exiting typhos early due to --exit-after=%s CLI argument.", exit_after)
@@ -576,6 +1070,137 @@ def typhos_run(
     return launch_suite(suite, initial_size=initial_size)
 
 
+def typhos_open_window(argv: list[str], cwd: Optional[str] = None) -> QtWidgets.QMainWindow:
+    """
+    Create and show a suite window from ``typhos`` command-line arguments.
+
+    This serves ``typhos --attach`` requests in a ``typhos --server`` process.
+    Options which only apply to a whole process, such as profiling, are
+    ignored.  Stylesheets given in ``argv`` are applied to the new window
+    alone, as the application stylesheet is shared by all windows.
+
+    Parameters
+    ----------
+    argv : list of str
+        The command-line arguments.
+    cwd : str, optional
+        The working directory of the client, to resolve relative paths.
+
+    Returns
+    -------
+    window : QMainWindow
+
+    Raises
+    ------
+    ValueError
+        If the arguments are invalid or no suite could be created.
+    """
+    try:
+        args = parser.parse_args(argv, TyphosArguments())
+    except SystemExit as ex:
+        # Bad arguments must not take down the server with them
+        raise ValueError(f"Invalid typhos arguments: {argv}") from ex
+    if cwd is not None:
+        if args.happi_cfg:
+            args.happi_cfg = os.path.join(cwd, args.happi_cfg)
+        for attr in ("stylesheet_override", "stylesheet_add"):
+            filenames = getattr(args, attr)
+            if filenames:
+                setattr(args, attr, [os.path.join(cwd, filename) for filename in filenames])
+
+    with utils.no_device_lazy_load():
+        suite = create_suite(
+            args.devices,
+            cfg=args.happi_cfg,
+            fake_devices=args.fake_device,
+            layout=args.layout,
+            cols=int(args.cols),
+            display_type=args.display_type,
+            scroll_option=args.scrollable,
+            show_displays=not args.hide_displays,
+            load_workers=args.load_workers,
+            preconnect=args.preconnect,
+        )
+
+    if suite is None:
+        raise ValueError(f"Unable to create a suite for {args.devices}")
+
+    if args.dark or args.stylesheet_override or args.stylesheet_add:
+        typhos_cli_apply_stylesheets(args, suite)
+
+    window = create_window(suite, initial_size=get_size_from_cli(args.size))
+    window.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+    window.show()
+    window.raise_()
+    window.activateWindow()
+    return window
+
+
+def warm_caches(cfg: Optional[str] = None) -> None:
+    """
+    Populate the caches used by every suite, ahead of the first suite.
+
+    Parameters
+    ----------
+    cfg : str, optional
+        The happi configuration file to use. If omitted, uses
+        the environment variables specified by happi.
+    """
+    from .plugins.happi import register_client
+
+    t0 = time.monotonic()
+    try:
+        register_client(_create_happi_client(cfg))
+    except Exception:
+        logger.debug("Unable to create a happi client.", exc_info=True)
+
+    template_cache = get_global_template_cache()
+    for filename in sorted(utils.ui_core_dir.glob("*.ui")):
+        try:
+            template_cache.get(filename)
+        except Exception:
+            logger.exception("Failed to load template %s", filename)
+    logger.debug("Warmed up caches in %.2f s", time.monotonic() - t0)
+
+
+def typhos_serve(
+    cfg: Optional[str] = None,
+    socket_path: Optional[str] = None,
+    exit_after: Optional[float] = None,
+) -> server.TyphosServer:
+    """
+    Run a typhos server, opening suites for ``typhos --attach`` clients.
+
+    Parameters
+    ----------
+    cfg : str, optional
+        The happi configuration file to use. If omitted, uses
+        the environment variables specified by happi.
+    socket_path : str, optional
+        The server socket.  See :func:`typhos.server.get_socket_path`.
+    exit_after : float, optional
+        Exit after this number of seconds.
+
+    Returns
+    -------
+    server : TyphosServer
+        The server.  This is returned after the application is done running.
+    """
+    app = get_qapp()
+    warm_caches(cfg)
+    typhos_server = server.TyphosServer(typhos_open_window, path=socket_path)
+    typhos_server.listen()
+    # Keep serving once all windows are closed
+    app.setQuitOnLastWindowClosed(False)
+    if exit_after is not None and exit_after >= 0:
+        QtCore.QTimer.singleShot(int(exit_after * 1000.0), app.quit)
+    try:
+        app.exec_()
+    finally:
+        typhos_server.close()
+    return typhos_server
+
+
 def typhos_export(
     device_name: str,
     export_filename: str,
@@ -583,6 +1208,7 @@ def typhos_export(
     fake_devices: bool = False,
     display_type: str = "detailed",
     scroll_option: str = "auto",
+    backend: str = "display",
 ):
     """
     Export a device display as a pydm-compatible ui file.
@@ -605,31 +1231,627 @@ def typhos_export(
         cli help for valid options.
     scroll_option : str, optional
         Options for the scrollbar. See the cli help for valid options.
+    backend : {"display", "device"}, optional
+        Export from a :class:`TyphosDeviceDisplay`, or straight from the
+        device without creating any widgets.  See
+        :func:`typhos.export.from_device`.
     """
+    if backend == "device":
+        devices = create_devices([device_name], cfg=cfg, fake_devices=fake_devices)
+        if not devices:
+            raise ValueError(f"Unable to load device {device_name!r}")
+        return export_device_as_ui(
+            devices[0],
+            export_filename=export_filename,
+            display_type=get_display_type_from_cli(display_type),
+        )
+
     with utils.no_device_lazy_load():
         devices = create_devices([device_name], cfg=cfg, fake_devices=fake_devices)
+        if not devices:
+            raise ValueError(f"Unable to load device {device_name!r}")
         display = TyphosDeviceDisplay.from_device(
             device=devices[0],
             scroll_option=get_scrollable_from_cli(scroll_option),
             display_type=get_display_type_from_cli(display_type),
+            threaded_template_search=False,
         )
         return export_as_ui(display, export_filename=export_filename)
 
 
+def find_happi_names(query: Optional[list[str]] = None, cfg: Optional[str] = None) -> list[str]:
+    """
+    Find the names of happi items matching a search.
+
+    Parameters
+    ----------
+    query : list of str, optional
+        Search terms of the form ``key=value``, where ``value`` is a regular
+        expression.  If omitted, finds all items.
+    cfg : str, optional
+        The happi configuration file to use. If omitted, uses
+        the environment variables specified by happi.
+
+    Returns
+    -------
+    names : list of str
+        The sorted item names.
+    """
+    criteria = {}
+    for term in query or []:
+        key, sep, value = term.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid happi search term {term!r}; expected key=value")
+        criteria[key] = value
+
+    client = _create_happi_client(cfg)
+    if criteria:
+        results = client.search_regex(**criteria)
+    else:
+        results = client.search()
+    return sorted(result.item.name for result in results)
+
+
+def _get_batch_filename(device_name: str, extension: str) -> str:
+    """A filename for ``device_name`` in a batch export or screenshot."""
+    return re.sub(r"[^\w.-]+", "_", device_name).strip("_") + extension
+
+
+def _hash_file(path, hashes: dict) -> str:
+    """Hash the contents of ``path``, caching the result in ``hashes``."""
+    path = str(path)
+    if path not in hashes:
+        with open(path, "rb") as fp:
+            hashes[path] = hashlib.sha256(fp.read()).hexdigest()
+    return hashes[path]
+
+
+def get_export_fingerprint(
+    device_name: str,
+    happi_client=None,
+    display_type: str = "detailed",
+    scroll_option: str = "auto",
+    backend: str = "display",
+    file_hashes: Optional[dict] = None,
+) -> str:
+    """
+    Fingerprint the inputs to an export of ``device_name``.
+
+    This covers the device class specification or happi document, the
+    source of each class in the device class hierarchy, and the templates
+    the display would pick from, such that an unchanged fingerprint means an
+    unchanged export.  The device itself is not instantiated.
+
+    Parameters
+    ----------
+    device_name : str
+        The happi name associated with the device, or the full class
+        specification from the cli.
+    happi_client : happi.Client, optional
+        The happi client, required for happi names.
+    display_type : str, optional
+        The type of display exported.
+    scroll_option : str, optional
+        Options for the scrollbar.
+    backend : str, optional
+        The export backend.  See :func:`typhos_export`.
+    file_hashes : dict, optional
+        Hashes of files already read, shared between calls.
+
+    Returns
+    -------
+    fingerprint : str
+    """
+    if file_hashes is None:
+        file_hashes = {}
+
+    result = _klass_regex.findall(device_name)
+    if result:
+        klass, _ = result[0]
+        spec = device_name
+    elif happi_client is not None:
+        spec = get_global_happi_item_cache().find_document(happi_client, device_name)
+        klass = spec["device_class"]
+    else:
+        raise ValueError(f"Happi not available to look up {device_name!r}")
+
+    device_cls = pcdsutils.utils.import_helper(klass)
+    sources = set()
+    for cls in device_cls.mro():
+        try:
+            sources.add(inspect.getsourcefile(cls))
+        except TypeError:
+            # Built-in classes
+            continue
+
+    display_type = get_display_type_from_cli(display_type)
+    templates = TyphosDeviceDisplay._find_templates(device_cls, {}, nested=False)[display_type.name]
+    inputs = {
+        "typhos": str(typhos_version),
+        "spec": spec,
+        "display_type": display_type.name,
+        "scroll_option": scroll_option,
+        "backend": backend,
+        "sources": {source: _hash_file(source, file_hashes) for source in sorted(filter(None, sources))},
+        "templates": [(str(template), _hash_file(template, file_hashes)) for template in templates],
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _offscreen_worker_init():
+    """Set up a batch worker process, without a display."""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    get_qapp()
+
+
+def _iter_offscreen_pool(func: Callable, jobs: dict, max_workers: Optional[int] = None):
+    """
+    Run ``func(**kwargs)`` for each of ``{key: kwargs}`` in worker processes.
+
+    Each worker uses the Qt offscreen platform.  Yields ``(key, future)``
+    as each job completes.
+    """
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+    # Qt does not survive a fork; start each process from scratch
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max(max_workers, 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_offscreen_worker_init,
+    ) as executor:
+        futures = {executor.submit(func, **kwargs): key for key, kwargs in jobs.items()}
+        for future in concurrent.futures.as_completed(futures):
+            yield futures[future], future
+
+
+def _export_in_worker(device_name: str, export_filename: str, **kwargs) -> float:
+    """Export ``device_name`` in a worker process, returning the time taken."""
+    t0 = time.monotonic()
+    typhos_export(device_name, export_filename, **kwargs)
+    return time.monotonic() - t0
+
+
+def _load_export_manifest(filename: pathlib.Path) -> dict:
+    """Load a previous bulk export manifest, if any."""
+    try:
+        with open(filename) as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.warning("Ignoring unreadable export manifest %s", filename, exc_info=True)
+        return {}
+
+
+def typhos_export_bulk(
+    device_names: list[str],
+    output_dir: str,
+    cfg: Optional[str] = None,
+    query: Optional[list[str]] = None,
+    fake_devices: bool = False,
+    display_type: str = "detailed",
+    scroll_option: str = "auto",
+    backend: str = "display",
+    max_workers: Optional[int] = None,
+    force: bool = False,
+) -> dict:
+    """
+    Export many device displays as pydm-compatible ui files in parallel.
+
+    Each device is exported by :func:`typhos_export` in a pool of processes
+    using the Qt offscreen platform.  Devices whose fingerprint (see
+    :func:`get_export_fingerprint`) matches that of their last successful
+    export to ``output_dir`` are skipped.
+
+    A manifest of the results is written to ``manifest.json`` in
+    ``output_dir``, with an entry per device of the form ``{"filename": str,
+    "fingerprint": str, "status": "exported" | "skipped" | "failed",
+    "elapsed": seconds, "error": str}``.  Entries for devices not included
+    in this export are retained.
+
+    Parameters
+    ----------
+    device_names : list of str
+        The happi names associated with the devices to export,
+        or the full class specifications from the cli.
+    output_dir : str
+        The directory to export to.
+    cfg : str, optional
+        The happi configuration file to use. If omitted, uses
+        the environment variables specified by happi.
+    query : list of str, optional
+        Also export the happi items matching these search terms.  See
+        :func:`find_happi_names`.
+    fake_devices : bool, optional
+        If True, use fake devices behind the screen instead of
+        making real connections.
+    display_type : str, optional
+        The type of display to export. See the cli help for valid options.
+    scroll_option : str, optional
+        Options for the scrollbar. See the cli help for valid options.
+    backend : {"display", "device"}, optional
+        The export backend.  See :func:`typhos_export`.
+    max_workers : int, optional
+        The number of export processes.  Defaults to one per CPU.
+    force : bool, optional
+        Export all devices, including those which are unchanged.
+
+    Returns
+    -------
+    manifest : dict
+        The manifest written.
+    """
+    t0 = time.monotonic()
+    device_names = list(device_names)
+    if query is not None:
+        device_names.extend(name for name in find_happi_names(query, cfg=cfg) if name not in device_names)
+
+    output_dir = pathlib.Path(output_dir).expanduser()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_filename = output_dir / EXPORT_MANIFEST
+    previous = _load_export_manifest(manifest_filename).get("devices", {})
+
+    try:
+        happi_client = _create_happi_client(cfg)
+    except Exception:
+        logger.debug("Unable to create a happi client.", exc_info=True)
+        happi_client = None
+
+    entries = {}
+    pending = []
+    file_hashes = {}
+    for device_name in device_names:
+        entry = entries[device_name] = {
+            "filename": _get_batch_filename(device_name, ".ui"),
+            "fingerprint": None,
+            "status": "failed",
+            "elapsed": 0.0,
+            "error": None,
+        }
+        try:
+            entry["fingerprint"] = get_export_fingerprint(
+                device_name,
+                happi_client=happi_client,
+                display_type=display_type,
+                scroll_option=scroll_option,
+                backend=backend,
+                file_hashes=file_hashes,
+            )
+        except Exception as ex:
+            logger.exception("Unable to fingerprint %r", device_name)
+            entry["error"] = str(ex) or type(ex).__name__
+            continue
+
+        last = previous.get(device_name, {})
+        if (
+            not force
+            and last.get("status") in ("exported", "skipped")
+            and last.get("fingerprint") == entry["fingerprint"]
+            and (output_dir / entry["filename"]).exists()
+        ):
+            logger.debug("Skipping unchanged %r", device_name)
+            entry["status"] = "skipped"
+        else:
+            pending.append(device_name)
+
+    if pending:
+        logger.info("Exporting %d of %d device(s) to %s ...", len(pending), len(device_names), output_dir)
+        jobs = {
+            device_name: dict(
+                device_name=device_name,
+                export_filename=str(output_dir / entries[device_name]["filename"]),
+                cfg=cfg,
+                fake_devices=fake_devices,
+                display_type=display_type,
+                scroll_option=scroll_option,
+                backend=backend,
+            )
+            for device_name in pending
+        }
+        for device_name, future in _iter_offscreen_pool(_export_in_worker, jobs, max_workers=max_workers):
+            entry = entries[device_name]
+            try:
+                entry["elapsed"] = future.result()
+            except Exception as ex:
+                logger.error("Failed to export %r: %s", device_name, ex)
+                entry["error"] = str(ex) or type(ex).__name__
+            else:
+                entry["status"] = "exported"
+                logger.info("Exported %r in %.2f s", device_name, entry["elapsed"])
+
+    manifest = {
+        "typhos": str(typhos_version),
+        "elapsed": time.monotonic() - t0,
+        "devices": {**previous, **entries},
+    }
+    with open(manifest_filename, "w") as fp:
+        json.dump(manifest, fp, indent=2)
+
+    counts = collections.Counter(entry["status"] for entry in entries.values())
+    logger.info(
+        "Exported %d, skipped %d and failed %d device(s) in %.2f s; see %s",
+        counts["exported"],
+        counts["skipped"],
+        counts["failed"],
+        manifest["elapsed"],
+        manifest_filename,
+    )
+    return manifest
+
+
+def _screenshot_in_worker(
+    device_name: str,
+    filename: str,
+    cfg: Optional[str] = None,
+    fake_devices: bool = False,
+    display_type: str = "detailed",
+    scroll_option: str = "auto",
+    timeout: float = DEFAULT_SCREENSHOT_TIMEOUT,
+) -> dict:
+    """Save a screenshot of ``device_name`` in a worker process, returning its timings."""
+    app = get_qapp()
+    t0 = time.monotonic()
+    devices = create_devices([device_name], cfg=cfg, fake_devices=fake_devices)
+    if not devices:
+        raise ValueError(f"Unable to load device {device_name!r}")
+
+    t1 = time.monotonic()
+    display = TyphosDeviceDisplay.from_device(
+        device=devices[0],
+        scroll_option=get_scrollable_from_cli(scroll_option),
+        display_type=get_display_type_from_cli(display_type),
+        threaded_template_search=False,
+    )
+    try:
+        display.show()
+        loaded = utils.wait_for_widgets_loaded(display, timeout=timeout)
+        t2 = time.monotonic()
+        # Rows may have been added since the display was first shown
+        display.adjustSize()
+        app.processEvents()
+        image = display.to_image()
+        if image is None or not image.save(filename):
+            raise RuntimeError(f"Unable to save a screenshot to {filename}")
+    finally:
+        display.close()
+        display.deleteLater()
+        app.processEvents()
+
+    return {
+        "status": "complete" if loaded else "timeout",
+        "load_time": t1 - t0,
+        "ready_time": t2 - t1,
+        "elapsed": time.monotonic() - t0,
+    }
+
+
+def typhos_screenshot_batch(
+    device_names: list[str],
+    output_dir: str,
+    cfg: Optional[str] = None,
+    query: Optional[list[str]] = None,
+    fake_devices: bool = False,
+    display_type: str = "detailed",
+    scroll_option: str = "auto",
+    max_workers: Optional[int] = None,
+    timeout: float = DEFAULT_SCREENSHOT_TIMEOUT,
+) -> dict:
+    """
+    Save screenshots of many device displays using offscreen worker processes.
+
+    Rather than waiting a fixed time, each screenshot is taken once all of
+    the widgets of the display have loaded and received their values (see
+    :func:`typhos.utils.widgets_loaded`), or after ``timeout``.
+
+    An index of the results is written to ``index.json`` in ``output_dir``,
+    with an entry per device of the form ``{"filename": str, "status":
+    "complete" | "timeout" | "failed", "load_time": seconds, "ready_time":
+    seconds, "elapsed": seconds, "error": str}``.  ``load_time`` is the
+    time to instantiate the device, and ``ready_time`` the time from then
+    until the display was loaded.
+
+    Parameters
+    ----------
+    device_names : list of str
+        The happi names associated with the devices,
+        or the full class specifications from the cli.
+    output_dir : str
+        The directory for the screenshots.
+    cfg : str, optional
+        The happi configuration file to use. If omitted, uses
+        the environment variables specified by happi.
+    query : list of str, optional
+        Also take screenshots of the happi items matching these search
+        terms.  See :func:`find_happi_names`.
+    fake_devices : bool, optional
+        If True, use fake devices behind the screen instead of
+        making real connections.
+    display_type : str, optional
+        The type of display to use. See the cli help for valid options.
+    scroll_option : str, optional
+        Options for the scrollbar. See the cli help for valid options.
+    max_workers : int, optional
+        The number of worker processes.  Defaults to one per CPU.
+    timeout : float, optional
+        The time to wait for each display to load, in seconds.
+
+    Returns
+    -------
+    index : dict
+        The index written.
+    """
+    t0 = time.monotonic()
+    device_names = list(device_names)
+    if query is not None:
+        device_names.extend(name for name in find_happi_names(query, cfg=cfg) if name not in device_names)
+
+    output_dir = pathlib.Path(output_dir).expanduser()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = {
+        device_name: {
+            "filename": _get_batch_filename(device_name, ".png"),
+            "status": "failed",
+            "load_time": None,
+            "ready_time": None,
+            "elapsed": None,
+            "error": None,
+        }
+        for device_name in device_names
+    }
+    jobs = {
+        device_name: dict(
+            device_name=device_name,
+            filename=str(output_dir / entry["filename"]),
+            cfg=cfg,
+            fake_devices=fake_devices,
+            display_type=display_type,
+            scroll_option=scroll_option,
+            timeout=timeout,
+        )
+        for device_name, entry in entries.items()
+    }
+    if jobs:
+        logger.info("Taking screenshots of %d device(s) in %s ...", len(jobs), output_dir)
+    for device_name, future in _iter_offscreen_pool(_screenshot_in_worker, jobs, max_workers=max_workers):
+        entry = entries[device_name]
+        try:
+            entry.update(future.result())
+        except Exception as ex:
+            logger.error("Failed to take a screenshot of %r: %s", device_name, ex)
+            entry["error"] = str(ex) or type(ex).__name__
+            continue
+        if entry["status"] == "timeout":
+            logger.warning("%r did not finish loading within %.1f s", device_name, timeout)
+        logger.info("Saved a screenshot of %r in %.2f s", device_name, entry["elapsed"])
+
+    index = {
+        "typhos": str(typhos_version),
+        "elapsed": time.monotonic() - t0,
+        "devices": entries,
+    }
+    index_filename = output_dir / SCREENSHOT_INDEX
+    with open(index_filename, "w") as fp:
+        json.dump(index, fp, indent=2)
+
+    counts = collections.Counter(entry["status"] for entry in entries.values())
+    logger.info(
+        "Took %d complete, %d timed out and %d failed screenshot(s) in %.2f s; see %s",
+        counts["complete"],
+        counts["timeout"],
+        counts["failed"],
+        index["elapsed"],
+        index_filename,
+    )
+    return index
+
+
+def precompile_templates(paths: Optional[list[str]] = None) -> list[pathlib.Path]:
+    """
+    Compile .ui templates into the on-disk template cache.
+
+    Parameters
+    ----------
+    paths : list of str, optional
+        Directories or .ui files to compile.  Defaults to all display paths.
+
+    Returns
+    -------
+    cache_filenames : list of pathlib.Path
+        The on-disk cache files written.
+    """
+    template_cache = get_global_template_cache()
+    cache_filenames = []
+    for path in paths or utils.DISPLAY_PATHS:
+        path = pathlib.Path(path).expanduser()
+        filenames = [path] if path.is_file() else sorted(path.glob("*.ui"))
+        for filename in filenames:
+            try:
+                cache_filenames.append(template_cache.precompile(filename))
+            except Exception:
+                logger.exception("Failed to precompile template %s", filename)
+                continue
+            logger.info("Precompiled template %s", filename)
+    return cache_filenames
+
+
+def typhos_benchmark_report(
+    filename: str,
+    test_names: Optional[list[str]] = None,
+    count: int = 5,
+) -> dict:
+    """
+    Record the phase timings of benchmark tests to a JSON file.
+
+    See :mod:`typhos.benchmark.phases`.
+
+    Parameters
+    ----------
+    filename : str
+        The report file to write.
+    test_names : list of str, optional
+        The benchmark tests.  Defaults to all of them.
+    count : int, optional
+        The number of timed runs of each test.
+
+    Returns
+    -------
+    report : dict
+    """
+    report = phases.phase_report(test_names or None, count=count)
+    phases.save_report(report, filename)
+    phases.print_report(report)
+    return report
+
+
+def typhos_benchmark_compare(old_filename: str, new_filename: str) -> list[phases.PhaseComparison]:
+    """
+    Compare two benchmark phase timing reports and flag regressions.
+
+    Parameters
+    ----------
+    old_filename : str
+        The baseline report, from :func:`typhos_benchmark_report`.
+    new_filename : str
+        The report to check for regressions.
+
+    Returns
+    -------
+    comparisons : list of PhaseComparison
+    """
+    comparisons = phases.compare_reports(phases.load_report(old_filename), phases.load_report(new_filename))
+    phases.print_comparison(comparisons)
+    return comparisons
+
+
 def typhos_cli(args):
-    """Command Line Application for Typhos."""
-    args = parser.parse_args(args, TyphosArguments())
+    """
+    Command Line Application for Typhos.
+
+    Parameters
+    ----------
+    args : list of str
+        The command-line arguments.
+    """
+    args_list = list(args)
+    args = parser.parse_args(args_list, TyphosArguments())
 
     if args.version:
         typhos_file = sys.modules["typhos"].__file__
         print(f"Typhos: Version {typhos_version} from {typhos_file}")
         return
 
+    if args.attach:
+        return server.attach(args_list, path=args.socket)
+
+    if args.benchmark_compare:
+        return typhos_benchmark_compare(*args.benchmark_compare)
+
     if any(
         (
             args.profile_modules is not None,
             args.profile_output,
-            args.benchmark is not None,
+            args.benchmark is not None and not args.benchmark_report,
         )
     ):
         if args.profile_modules:
@@ -642,11 +1864,57 @@ def typhos_cli(args):
     else:
         context = nullcontext()
 
-    with context:
+    if args.profile_sampler:
+        sampler = sampler_context(args.profile_sampler)
+    else:
+        sampler = nullcontext()
+
+    with context, sampler:
         typhos_cli_setup(args)
-        if args.benchmark is not None:
+        if args.benchmark_report:
+            suite = typhos_benchmark_report(
+                args.benchmark_report,
+                test_names=args.benchmark,
+                count=args.benchmark_count,
+            )
+        elif args.benchmark is not None:
             # Note: actually a list of suites
             suite = run_benchmarks(args.benchmark)
+        elif args.server:
+            if args.profile_signal:
+                typhos_cli_setup_sampler(args)
+            suite = typhos_serve(
+                cfg=args.happi_cfg,
+                socket_path=args.socket,
+                exit_after=args.exit_after,
+            )
+        elif args.precompile_templates is not None:
+            suite = precompile_templates(args.precompile_templates)
+        elif args.screenshot_batch:
+            suite = typhos_screenshot_batch(
+                args.devices,
+                output_dir=args.screenshot_batch,
+                cfg=args.happi_cfg,
+                query=args.screenshot_query,
+                fake_devices=args.fake_device,
+                display_type=args.display_type,
+                scroll_option=args.scrollable,
+                max_workers=args.screenshot_workers,
+                timeout=args.screenshot_timeout,
+            )
+        elif args.export_dir:
+            suite = typhos_export_bulk(
+                args.devices,
+                output_dir=args.export_dir,
+                cfg=args.happi_cfg,
+                query=args.export_query,
+                fake_devices=args.fake_device,
+                display_type=args.display_type,
+                scroll_option=args.scrollable,
+                backend=args.export_backend,
+                max_workers=args.export_workers,
+                force=args.export_force,
+            )
         elif args.export:
             suite = typhos_export(
                 device_name=args.devices[0],
@@ -655,8 +1923,11 @@ def typhos_cli(args):
                 fake_devices=args.fake_device,
                 display_type=args.display_type,
                 scroll_option=args.scrollable,
+                backend=args.export_backend,
             )
         else:
+            if args.profile_signal:
+                typhos_cli_setup_sampler(args)
             suite = typhos_run(
                 args.devices,
                 cfg=args.happi_cfg,
@@ -669,6 +1940,11 @@ def typhos_cli(args):
                 show_displays=not args.hide_displays,
                 exit_after=args.exit_after,
                 screenshot_filename=args.screenshot_filename,
+                apply_style=(
+                    functools.partial(typhos_cli_apply_stylesheets, args) if args.stylesheet_scope == "suite" else None
+                ),
+                load_workers=args.load_workers,
+                preconnect=args.preconnect,
             )
 
         return suite
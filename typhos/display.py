@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import collections
 import copy
 import enum
+import functools
 import inspect
 import logging
 import os
 import pathlib
 import webbrowser
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
 import ophyd
 import pcdsutils
@@ -22,12 +24,13 @@ from pcdsutils.qt import forward_property
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import Q_ENUMS, Property, Qt, Slot
 
-from . import cache, utils, web, widgets
+from . import cache, utils, widgets
 from . import panel as typhos_panel
-from .jira import TyphosJiraIssueWidget
-from .notes import TyphosNotesEdit
 from .plugins.core import register_signal
 
+if TYPE_CHECKING:
+    from .jira import TyphosJiraIssueWidget
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,6 +74,13 @@ DEFAULT_TEMPLATES["detailed_screen"].append(DETAILED_TREE_TEMPLATE)
 
 DEFAULT_TEMPLATES_FLATTEN = [f for _, files in DEFAULT_TEMPLATES.items() for f in files]
 
+# Search for device-specific templates in a background thread by default:
+TYPHOS_THREADED_TEMPLATE_SEARCH = os.environ.get("TYPHOS_THREADED_TEMPLATE_SEARCH", "1").strip() not in ("", "0")
+
+# Number of previously-shown template widgets kept alive per display, such
+# that switching back to them is instant.  0 disables the cache.
+TYPHOS_TEMPLATE_WIDGET_CACHE_SIZE = int(os.environ.get("TYPHOS_TEMPLATE_WIDGET_CACHE_SIZE", "2"))
+
 
 def normalize_display_type(display_type: Union[DisplayTypes, str, int]) -> DisplayTypes:
     """
@@ -247,7 +257,7 @@ class TyphosDisplayConfigButton(TyphosToolButton):
                     # Toggle visibility of the specific kind for all panels
                     for panel in panels:
                         setattr(panel, prop, new_value)
-                self.hide_empty()
+                self.hide_empty(panels=panels)
 
             title = f"Show only &{kind}" if only else f"Show &{kind}"
             action = base_menu.addAction(title)
@@ -273,7 +283,7 @@ class TyphosDisplayConfigButton(TyphosToolButton):
             text = line_edit.text().strip()
             for panel in panels:
                 panel.nameFilter = text
-            self.hide_empty()
+            self.hide_empty(panels=panels)
 
         line_edit = QtWidgets.QLineEdit()
 
@@ -293,7 +303,7 @@ class TyphosDisplayConfigButton(TyphosToolButton):
         action.setDefaultWidget(line_edit)
         base_menu.addAction(action)
 
-    def hide_empty(self, search=True):
+    def hide_empty(self, search=True, *, panels=None):
         """
         Wrap hide_empty calls for use with search functions and action clicks.
 
@@ -302,8 +312,15 @@ class TyphosDisplayConfigButton(TyphosToolButton):
         search : bool
             Whether or not this method is being called from a search/filter
             method.
+
+        panels : list of TyphosSignalPanel, optional
+            The panels whose filters changed.  If given, only these panels
+            and their ancestors are updated.
         """
         if self.device_display.hideEmpty:
+            if panels is not None:
+                hide_empty(self.device_display, process_widget=False, panels=panels)
+                return
             if search:
                 show_empty(self.device_display)
             hide_empty(self.device_display, process_widget=False)
@@ -462,6 +479,8 @@ class TyphosDisplaySwitcher(QtWidgets.QFrame, widgets.TyphosDesignerMixin):
         if self.device_display is None:
             logger.warning("set_device_display not called on %s", self)
             return
+        from .jira import TyphosJiraIssueWidget
+
         devices = self.device_display.devices
         device = devices[0] if devices else None
         self._jira_widget = TyphosJiraIssueWidget(device=device)
@@ -635,6 +654,8 @@ class TyphosHelpFrame(QtWidgets.QFrame, widgets.TyphosDesignerMixin):
 
     def new_jira_widget(self):
         """Open a new Jira issue reporting widget."""
+        from .jira import TyphosJiraIssueWidget
+
         device = self.devices[0] if self.devices else None
         self._jira_widget = TyphosJiraIssueWidget(device=device)
         self._jira_widget.show()
@@ -722,6 +743,9 @@ class TyphosHelpFrame(QtWidgets.QFrame, widgets.TyphosDesignerMixin):
 
     def show_help(self):
         """Show the help information in a QWebEngineView."""
+        # QtWebEngine is slow to import, so only do so when first needed
+        from . import web
+
         if web.TyphosWebEngineView is None:
             logger.error("Failed to import QWebEngineView; help view is unavailable.")
             return
@@ -812,6 +836,8 @@ class TyphosDisplayTitle(QtWidgets.QFrame, widgets.TyphosDesignerMixin):
         self.underline.setFrameShadow(self.underline.Plain)
         self.underline.setLineWidth(10)
 
+        from .notes import TyphosNotesEdit
+
         self.notes_edit = TyphosNotesEdit()
 
         self.grid_layout = QtWidgets.QGridLayout()
@@ -925,6 +951,35 @@ class TyphosDisplayTitle(QtWidgets.QFrame, widgets.TyphosDesignerMixin):
     underline_midLineWidth = forward_property("underline", QtWidgets.QFrame, "midLineWidth")
 
 
+class _TemplateSearchSignals(QtCore.QObject):
+    """
+    Signals for reporting background template search results.
+
+    Background workers hold on to this rather than the display itself, such
+    that the last reference to the display is never dropped outside of the
+    GUI thread.
+    """
+
+    finished = QtCore.Signal(int, object)
+
+
+def _search_for_templates_in_thread(
+    signals: _TemplateSearchSignals,
+    search_id: int,
+    find_templates: Callable[..., Dict[str, List[pathlib.Path]]],
+    device_cls: type,
+    macros: dict,
+    nested: bool,
+):
+    """Thread pool worker: search for templates and report back."""
+    templates = find_templates(device_cls, macros, nested=nested)
+    try:
+        signals.finished.emit(search_id, templates)
+    except RuntimeError:
+        # The display was deleted prior to the search finishing
+        ...
+
+
 class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _DisplayTypes):
     """
     Main display for a single ophyd Device.
@@ -964,6 +1019,19 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
 
     nested : bool, optional
         An optional annotation for a display that may be nested inside another.
+
+    threaded_template_search : bool, optional
+        Search for device-specific templates in a background thread, showing
+        a default template in the meantime.  Defaults to the class attribute
+        of the same name, configurable by way of the environment variable
+        ``TYPHOS_THREADED_TEMPLATE_SEARCH``.
+
+    template_widget_cache_size : int, optional
+        The number of previously shown template widgets to keep alive, least
+        recently used first out.  Switching back to a cached template reuses
+        its widget as-is, without reloading or reconnecting anything.
+        Defaults to the class attribute of the same name, configurable by way
+        of the environment variable ``TYPHOS_TEMPLATE_WIDGET_CACHE_SIZE``.
     """
 
     # Template types and defaults
@@ -972,6 +1040,8 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
     template_changed = QtCore.Signal(object)
     templates_loaded = QtCore.Signal(object)
     templates: Dict[str, List[pathlib.Path]]
+    threaded_template_search: bool = TYPHOS_THREADED_TEMPLATE_SEARCH
+    template_widget_cache_size: int = TYPHOS_TEMPLATE_WIDGET_CACHE_SIZE
 
     def __init__(
         self,
@@ -984,6 +1054,8 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         display_type: Union[DisplayTypes, str, int] = "embedded_screen",
         scroll_option: Union[ScrollOptions, str, int] = ScrollOptions.auto,
         nested: bool = False,
+        threaded_template_search: Optional[bool] = None,
+        template_widget_cache_size: Optional[int] = None,
     ):
         self._current_template = None
         self._forced_template = ""
@@ -991,8 +1063,14 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         self._display_widget = None
         self._scroll_option = scroll_option
         self._searched = False
+        self._template_search_id = 0
         self._hide_empty = False
         self._nested = nested
+        if threaded_template_search is not None:
+            self.threaded_template_search = threaded_template_search
+        if template_widget_cache_size is not None:
+            self.template_widget_cache_size = template_widget_cache_size
+        self._template_widgets = collections.OrderedDict()
 
         self.templates = {name: [] for name in DisplayTypes.names}
         self._display_type = normalize_display_type(display_type)
@@ -1026,6 +1104,11 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self._scroll_area)
 
+        self._template_search_signals = _TemplateSearchSignals(self)
+        self._template_search_signals.finished.connect(self._threaded_search_finished, Qt.QueuedConnection)
+        # Cached widgets are not children of the display, delete them with it
+        self.destroyed.connect(functools.partial(_delete_cached_widgets, self._template_widgets))
+
         if scrollable is None:
             self.scroll_option = scroll_option
         else:
@@ -1162,7 +1245,7 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
     def _refresh_templates(self):
         """Force an update of the display cache and look for new ui files."""
         cache.get_global_display_path_cache().update()
-        self.search_for_templates()
+        self.search_for_templates(threaded=False)
 
     @property
     def current_template(self):
@@ -1179,7 +1262,7 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         value = normalize_display_type(value)
         if self._display_type != value:
             self._display_type = value
-            self.load_best_template()
+            self.load_best_template(reload=False)
 
     @property
     def effective_display_type(self) -> DisplayTypes:
@@ -1212,6 +1295,8 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
     def macros(self, macros):
         self._macros.clear()
         self._macros.update(**(macros or {}))
+        # Cached template widgets were loaded with the previous macros
+        self.clear_template_widget_cache()
 
         # If any display macros are specified, re-search for templates:
         if any(view in self._macros for view in DisplayTypes.names):
@@ -1259,19 +1344,51 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
 
         logger.warning("No templates available for display type: %s", self._display_type)
 
-    def _remove_display(self):
+    def _remove_display(self, cache: bool = True):
         """Remove the display widget, readying for a new template."""
         display_widget = self._display_widget
         if display_widget:
             if self._scroll_area.widget():
                 self._scroll_area.takeWidget()
             self.layout().removeWidget(display_widget)
-            display_widget.deleteLater()
+            if cache and self._current_template is not None and self.template_widget_cache_size > 0:
+                self._cache_template_widget(self._current_template, display_widget)
+            else:
+                display_widget.deleteLater()
 
         self._display_widget = None
 
-    def load_best_template(self):
-        """Load the best available template for the current display type."""
+    def _cache_template_widget(self, template: pathlib.Path, widget: QtWidgets.QWidget):
+        """Keep ``widget`` alive for later reuse, evicting the oldest."""
+        # Keep it out of the display's children, such that findChildren
+        # callers (filter menus, hide_empty, ...) only see the current widget
+        widget.hide()
+        widget.setParent(None)
+        self._template_widgets.pop(template, None)
+        self._template_widgets[template] = widget
+        while len(self._template_widgets) > self.template_widget_cache_size:
+            _, evicted = self._template_widgets.popitem(last=False)
+            evicted.deleteLater()
+
+    def clear_template_widget_cache(self):
+        """Delete all cached, currently-hidden template widgets."""
+        _delete_cached_widgets(self._template_widgets)
+
+    @property
+    def cached_templates(self) -> List[pathlib.Path]:
+        """Templates with cached widgets, least recently used first."""
+        return list(self._template_widgets)
+
+    def load_best_template(self, *, reload: bool = True):
+        """
+        Load the best available template for the current display type.
+
+        Parameters
+        ----------
+        reload : bool, optional
+            Rebuild the display widget even if the best template is the one
+            already shown.  Otherwise, the current widget is kept as-is.
+        """
         if self.layout() is None:
             # If we are not fully initialized yet do not try and add anything
             # to the layout. This will happen if the QApplication has a
@@ -1282,15 +1399,36 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         if not self._searched:
             self.search_for_templates()
 
-        self._remove_display()
         template = self._forced_template or self.get_best_template(self._display_type, self.macros)
+        if (
+            not reload
+            and template
+            and self._display_widget is not None
+            and pathlib.Path(template) == self._current_template
+        ):
+            logger.debug("Keeping the current widget for template %s", template)
+            # Listeners, such as the suite, size themselves to the display
+            self.updateGeometry()
+            self.template_changed.emit(self._current_template)
+            return
 
-        if not template:
+        template = pathlib.Path(template) if template else None
+        reloading = template == self._current_template
+        # Take the widget out of the cache before the current one goes in,
+        # which may otherwise evict it
+        cached_widget = None
+        if template is not None and not reloading:
+            cached_widget = self._template_widgets.pop(template, None)
+        # Explicitly reloading the current template starts fresh
+        self._remove_display(cache=not reloading)
+
+        if template is None:
             widget = QtWidgets.QWidget()
             widget.setObjectName("no_template_standin")
-            template = None
+        elif cached_widget is not None:
+            logger.debug("Reusing cached widget for template %s", template)
+            widget = cached_widget
         else:
-            template = pathlib.Path(template)
             try:
                 widget = self._load_template(template)
             except Exception as ex:
@@ -1298,8 +1436,10 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
                 # If we have a previously defined template
                 if self._current_template is not None:
                     # Fallback to it so users have a choice
+                    cached_widget = self._template_widgets.pop(self._current_template, None)
+                    template = self._current_template
                     try:
-                        widget = self._load_template(self._current_template)
+                        widget = cached_widget or self._load_template(self._current_template)
                     except Exception:
                         logger.exception("Failed to fall back to previous template: %s", self._current_template)
                         template = None
@@ -1311,6 +1451,20 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
                     widget.setObjectName("errored_load_standin")
                     template = None
 
+        if cached_widget is not None:
+            self._display_widget = widget
+            self._current_template = template
+            self._move_display_to_layout(widget)
+            widget.show()
+            # Empty panels may have changed, or hideEmpty toggled, since
+            # the widget was cached
+            show_empty(widget)
+            if self.hideEmpty:
+                hide_empty(self, process_widget=False)
+            self.updateGeometry()
+            self.template_changed.emit(template)
+            return
+
         if widget:
             if widget.objectName():
                 widget.setObjectName(f"{widget.objectName()}_display_widget")
@@ -1337,7 +1491,7 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         self._move_display_to_layout(self._display_widget)
 
         self._update_children()
-        utils.reload_widget_stylesheet(self)
+        utils.schedule_widget_stylesheet_reload(self)
         self.updateGeometry()
         self.template_changed.emit(template)
 
@@ -1355,9 +1509,10 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         return self._display_widget
 
     @staticmethod
-    def _get_templates_from_macros(macros):
+    def _get_templates_from_macros(macros, *, paths=None):
         ret = {}
-        paths = cache.get_global_display_path_cache().paths
+        if paths is None:
+            paths = cache.get_global_display_path_cache().paths
         for display_type in DisplayTypes.names:
             ret[display_type] = None
             try:
@@ -1415,7 +1570,7 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
     def force_template(self, value):
         if value != self._forced_template:
             self._forced_template = value
-            self.load_best_template()
+            self.load_best_template(reload=False)
 
     @staticmethod
     def _build_macros_from_device(device, macros=None):
@@ -1474,27 +1629,110 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
         if not self.windowTitle():
             self.setWindowTitle(getattr(device, "name", ""))
 
-    def search_for_templates(self):
-        """Search the filesystem for device-specific templates."""
+    def search_for_templates(self, *, threaded: Optional[bool] = None):
+        """
+        Search the filesystem for device-specific templates.
+
+        Parameters
+        ----------
+        threaded : bool, optional
+            Search in a background thread.  Until the search completes, only
+            the typhos default templates are available; once it completes,
+            ``templates_loaded`` is emitted and the best template is reloaded
+            if it changed.  Defaults to :attr:`threaded_template_search`.
+        """
         device = self.device
         if not device:
             logger.debug("Cannot search for templates without device")
             return
 
         self._searched = True
+        self._template_search_id += 1
         cls = device.__class__
+        if threaded is None:
+            threaded = self.threaded_template_search
 
-        logger.debug("Searching for templates for %s", cls.__name__)
-        macro_templates = self._get_templates_from_macros(self._macros)
+        if not threaded:
+            logger.debug("Searching for templates for %s", cls.__name__)
+            self._set_templates(self._find_templates(cls, self._macros, nested=self._nested))
+            return
 
-        paths = cache.get_global_display_path_cache().paths
+        logger.debug("Searching for templates for %s in the background", cls.__name__)
+        # The defaults require no filesystem access and are usable immediately
+        self._set_templates(self._find_templates(cls, {}, nested=self._nested, paths=[]))
+        worker = utils.ThreadPoolWorker(
+            _search_for_templates_in_thread,
+            self._template_search_signals,
+            self._template_search_id,
+            type(self)._find_templates,
+            cls,
+            dict(self._macros),
+            self._nested,
+        )
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    @QtCore.Slot(int, object)
+    def _threaded_search_finished(self, search_id: int, templates: Dict[str, List[pathlib.Path]]):
+        """Background search finished: update templates and maybe reload."""
+        if search_id != self._template_search_id:
+            logger.debug("Discarding stale template search results for %s", self.device_name)
+            return
+
+        self._set_templates(templates)
+        if self._forced_template or self._display_widget is None:
+            return
+
+        if self.get_best_template(self._display_type, self.macros) != self._current_template:
+            self.load_best_template(reload=False)
+
+    def _set_templates(self, templates: Dict[str, List[pathlib.Path]]):
+        """Update the available templates and emit ``templates_loaded``."""
+        for display_type, template_list in templates.items():
+            self.templates[display_type].clear()
+            self.templates[display_type].extend(template_list)
+
+        self.templates_loaded.emit(copy.deepcopy(self.templates))
+
+    @classmethod
+    def _find_templates(
+        cls,
+        device_cls: type,
+        macros: dict,
+        *,
+        nested: bool,
+        paths: Optional[list] = None,
+    ) -> Dict[str, List[pathlib.Path]]:
+        """
+        Find all templates for ``device_cls``, in order of priority.
+
+        This does not touch any widgets and is safe to call from a thread.
+
+        Parameters
+        ----------
+        device_cls : type
+            The device class.
+
+        macros : dict
+            Display macros, which may include template overrides.
+
+        nested : bool
+            Whether the display is nested in another.
+
+        paths : list, optional
+            Paths to search.  Defaults to the global display path cache.
+        """
+        if paths is None:
+            paths = cache.get_global_display_path_cache().paths
+
+        macro_templates = cls._get_templates_from_macros(macros, paths=paths)
+
+        templates = {}
         for display_type in DisplayTypes.names:
             view = display_type
             if view.endswith("_screen"):
                 view = view.split("_screen")[0]
 
-            template_list = self.templates[display_type]
-            template_list.clear()
+            template_list = templates[display_type] = []
 
             # 1. Highest priority: macros
             for template in set(macro_templates[display_type] or []):
@@ -1502,7 +1740,7 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
                 logger.debug("Adding macro template %s: %s (total=%d)", display_type, template, len(template_list))
 
             # 2. Templates based on class hierarchy names
-            filenames = utils.find_templates_for_class(cls, view, paths)
+            filenames = utils.find_templates_for_class(device_cls, view, paths)
             for filename in filenames:
                 if filename not in template_list:
                     template_list.append(filename)
@@ -1510,12 +1748,12 @@ class TyphosDeviceDisplay(utils.TyphosBase, widgets.TyphosDesignerMixin, _Displa
             # 3. Ensure that the detailed tree template makes its way in for
             #    embedded and detailed screens, if no class-specific screen exists
             if display_type != DisplayTypes.engineering_screen.name and DETAILED_TREE_TEMPLATE not in template_list:
-                if not self._nested or self.suggest_composite_screen(cls):
+                if not nested or cls.suggest_composite_screen(device_cls):
                     template_list.append(DETAILED_TREE_TEMPLATE)
             # 4. Default templates
             template_list.extend([templ for templ in DEFAULT_TEMPLATES[display_type] if templ not in template_list])
 
-        self.templates_loaded.emit(copy.deepcopy(self.templates))
+        return templates
 
     @classmethod
     def suggest_composite_screen(cls, device_cls):
@@ -1668,63 +1906,164 @@ def toggle_display(widget, force_state=None):
         panel.setVisible(state)
 
 
+def _delete_cached_widgets(template_widgets, *args):
+    """Delete all widgets of a template widget cache, emptying it."""
+    while template_widgets:
+        _, widget = template_widgets.popitem()
+        try:
+            widget.deleteLater()
+        except RuntimeError:
+            # Already deleted
+            ...
+
+
 def show_empty(widget):
     """
-    Recursively shows all panels and widgets, empty or not.
+    Shows all panels and widgets, empty or not.
 
     Parameters
     ----------
     widget : QWidget
     """
-    children = widget.findChildren(TyphosDeviceDisplay) or []
-    for ch in children:
-        show_empty(ch)
+    for display in widget.findChildren(TyphosDeviceDisplay) or []:
+        display.setVisible(True)
     widget.setVisible(True)
     toggle_display(widget, force_state=True)
 
 
-def hide_empty(widget, process_widget=True):
+def _is_empty_node(widget) -> bool:
+    """Is ``widget`` considered in hide_empty?"""
+    return isinstance(widget, (TyphosDeviceDisplay, typhos_panel.TyphosSignalPanel))
+
+
+def _typhos_children(widget):
+    """Get the nearest TyphosBase descendants of ``widget``, not recursing into them."""
+    result = []
+    pending = list(widget.children())
+    while pending:
+        child = pending.pop()
+        if isinstance(child, utils.TyphosBase):
+            result.append(child)
+        elif isinstance(child, QtWidgets.QWidget):
+            pending.extend(child.children())
+    return result
+
+
+def _update_empty_visibility(widget, children) -> bool:
+    """
+    Update the visibility of a display or panel, given its TyphosBase children.
+
+    Children must have been processed prior to this.
+
+    Returns
+    -------
+    changed : bool
+        Whether the visibility of ``widget`` changed.
+    """
+    if isinstance(widget, TyphosDeviceDisplay):
+        if widget.current_template not in DEFAULT_TEMPLATES_FLATTEN:
+            # Not sure if we can safely change non built-in templates
+            return False
+        visible = any(child.isVisibleTo(widget) for child in children)
+    elif isinstance(widget, typhos_panel.TyphosSignalPanel):
+        visible = bool(widget._panel_layout.visible_elements)
+    else:
+        return False
+
+    changed = visible == widget.isHidden()
+    widget.setVisible(visible)
+    return changed
+
+
+def hide_empty(widget, process_widget=True, *, panels=None):
     """
-    Recursively hide empty panels and widgets.
+    Hide empty panels and widgets.
+
+    The visibility of the whole tree is computed bottom-up in a single pass:
+    panels are hidden if they have no visible elements, and displays are
+    hidden if none of their child displays, panels and other typhos widgets
+    are visible.
 
     Parameters
     ----------
     widget : QWidget
-        The widget in which to start the recursive search.
+        The widget in which to start the search.
 
     process_widget : bool
         Whether or not to process the visibility for the widget.
         This is useful since we don't want to hide the top-most
         widget otherwise users can't change the visibility back on.
-    """
-
-    def process(item, recursive=True):
-        if isinstance(item, TyphosDeviceDisplay) and recursive:
-            hide_empty(item)
-        elif isinstance(item, typhos_panel.TyphosSignalPanel):
-            if recursive:
-                hide_empty(item)
-            visible = bool(item._panel_layout.visible_elements)
-            item.setVisible(visible)
 
+    panels : list of TyphosSignalPanel, optional
+        Incremental mode: only update these panels and, for those whose
+        visibility changed, their ancestors up to ``widget``.  Use this
+        when only the filters of ``panels`` changed since the last call.
+    """
     if isinstance(widget, TyphosDeviceDisplay):
         # Check if the template at this display is one of the defaults
         # otherwise we are not sure if we can safely change it.
-
         if widget.current_template not in DEFAULT_TEMPLATES_FLATTEN:
             logger.info("Can't hide empty entries in non built-in templates")
             return
 
-    children = widget.findChildren(utils.TyphosBase) or []
-    for w in children:
-        process(w)
+    if panels is not None:
+        _hide_empty_incremental(widget, panels, process_widget=process_widget)
+        return
+
+    nodes = widget.findChildren(utils.TyphosBase) or []
+    # Map each node to its nearest TyphosBase ancestor under ``widget``:
+    nearest = {widget: widget}
+    children = {widget: []}
+    for node in nodes:
+        children.setdefault(node, [])
+        path = []
+        parent = node.parentWidget()
+        while parent is not None and parent not in nearest:
+            path.append(parent)
+            parent = parent.parentWidget()
+        if parent is None:
+            continue
+        ancestor = nearest[parent]
+        for item in path:
+            nearest[item] = ancestor
+        nearest[node] = node
+        children[ancestor].append(node)
+
+    # findChildren is pre-order, so in reverse all descendants of a node are
+    # processed prior to the node itself:
+    for node in reversed(nodes):
+        if _is_empty_node(node):
+            _update_empty_visibility(node, children[node])
 
     if process_widget:
-        if isinstance(widget, TyphosDeviceDisplay):
-            overall_status = any(w.isVisible() for w in children)
-        elif isinstance(widget, typhos_panel.TyphosSignalPanel):
-            overall_status = bool(widget._panel_layout.visible_elements)
-        widget.setVisible(overall_status)
+        _update_empty_visibility(widget, children[widget])
+
+
+def _hide_empty_incremental(widget, panels, *, process_widget=True):
+    """Incremental mode of :func:`hide_empty`."""
+    for panel in panels:
+        ancestors = []
+        parent = panel.parentWidget()
+        while parent is not None and parent is not widget:
+            if _is_empty_node(parent):
+                ancestors.append(parent)
+            parent = parent.parentWidget()
+
+        if panel is widget:
+            if not process_widget:
+                continue
+        elif parent is None:
+            # Not a descendant of ``widget``
+            continue
+        elif process_widget:
+            ancestors.append(widget)
+
+        if not _update_empty_visibility(panel, _typhos_children(panel)):
+            continue
+
+        for ancestor in ancestors:
+            if not _update_empty_visibility(ancestor, _typhos_children(ancestor)):
+                break
 
 
 def get_template_display_type(template: Path) -> DisplayTypes:
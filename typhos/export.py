@@ -2,18 +2,29 @@
 Export a typhos screen as a PyDM Screen
 """
 
+import functools
 import json
 import logging
+from typing import Dict, Optional, Union
 
+import ophyd
 from lxml import etree
 from ophyd.device import Device
 from ophyd.signal import EpicsSignalBase
 from qtpy.QtWidgets import QWidget
 
-from .display import TyphosDeviceDisplay, TyphosDisplayTitle
-from .panel import TyphosCompositeSignalPanel, TyphosSignalPanel
-from .utils import get_variety_metadata, is_signal_ro
-from .widgets import determine_widget_type
+from . import cache
+from .display import DisplayTypes, TyphosDeviceDisplay, TyphosDisplayTitle, normalize_display_type
+from .panel import (
+    SignalOrder,
+    SignalPanel,
+    SignalRow,
+    TyphosCompositeSignalPanel,
+    TyphosSignalPanel,
+    _get_component_sorter,
+)
+from .utils import _get_top_level_components, get_variety_metadata
+from .widgets import SignalWidgetInfo
 
 logger = logging.getLogger(__name__)
 
@@ -34,20 +45,63 @@ def export_as_ui(display: TyphosDeviceDisplay, export_filename: str):
     """
     device: Device = display.devices[0]
 
-    tree = from_display(display)
-    etree.indent(tree, space=" ", level=0)
-    text = etree.tostring(tree, pretty_print=True, encoding="unicode")
-
     if display.macros:
-        all_macros = {
-            key: value
-            for key, value in display.macros.items()
-            if isinstance(key, str) and isinstance(value, str) and not key.startswith("_")
-        }
+        all_macros = get_string_macros(display.macros)
     else:
         all_macros = {"prefix": device.prefix, "name": device.name}
 
-    un_macros = {value: f"${{{key}}}" for key, value in all_macros.items()}
+    write_ui_file(from_display(display), export_filename, all_macros)
+
+
+def export_device_as_ui(
+    device: Device,
+    export_filename: str,
+    display_type: Union[DisplayTypes, str, int] = DisplayTypes.detailed_screen,
+    macros: Optional[Dict[str, str]] = None,
+):
+    """
+    Export a device as a .ui file without creating any widgets.
+
+    This is the counterpart of :func:`export_as_ui` using :func:`from_device`,
+    and does not require a display server.
+
+    Parameters
+    ----------
+    device : ophyd.Device
+        The device to export.
+    export_filename : str
+        The destination filepath to save the .ui file.
+    display_type : DisplayTypes, str, or int, optional
+        The type of display to export.
+    macros : dict, optional
+        Additional macros, as with :meth:`TyphosDeviceDisplay.add_device`.
+        These are used to pick the template and substituted back into the
+        .ui file.
+    """
+    macros = TyphosDeviceDisplay._build_macros_from_device(device, macros=macros)
+    tree = from_device(device, display_type=display_type, macros=macros)
+    write_ui_file(tree, export_filename, get_string_macros(macros))
+
+
+def get_string_macros(macros: Dict[str, object]) -> Dict[str, str]:
+    """
+    Get the macros which may be substituted into an exported .ui file.
+    """
+    return {
+        key: value
+        for key, value in macros.items()
+        if isinstance(key, str) and isinstance(value, str) and not key.startswith("_")
+    }
+
+
+def write_ui_file(tree: etree._ElementTree, export_filename: str, all_macros: Dict[str, str]):
+    """
+    Write an exported .ui file, replacing macro values with the macros.
+    """
+    etree.indent(tree, space=" ", level=0)
+    text = etree.tostring(tree, pretty_print=True, encoding="unicode")
+
+    un_macros = {value: f"${{{key}}}" for key, value in all_macros.items() if value}
 
     for unm, macro in un_macros.items():
         text = text.replace(unm, macro)
@@ -57,7 +111,7 @@ def export_as_ui(display: TyphosDeviceDisplay, export_filename: str):
 
     logger.info(f"Wrote file {export_filename}")
 
-    used_macros = {key: value for key, value in all_macros.items() if un_macros[value] in text}
+    used_macros = {key: value for key, value in all_macros.items() if value and un_macros[value] in text}
 
     logger.info("File must be opened and re-saved in designer before it can be run!")
     logger.info(f"After re-save, run as pydm --macro '{json.dumps(used_macros)}' {export_filename}")
@@ -222,17 +276,17 @@ def from_typhos_composite_signal_panel(
             # A signal row
             signal_info = None
             for info in signal_info_list:
-                if info["row"] == row_count:
+                if info.row == row_count:
                     # We found it
                     signal_info = info
             if signal_info is None:
                 raise RuntimeError(f"No signal info for row {row_count}")
-            if signal_info["signal"] is None:
+            if signal_info.signal is None:
                 logger.debug(f"Skipping signal info {signal_info}, no signal created")
                 continue
             logger.debug(f"Using signal info {signal_info}")
 
-            signal = signal_info["signal"]
+            signal = signal_info.signal
             signal_name = signal.name
             if not isinstance(signal, EpicsSignalBase):
                 logger.debug("Not an epics signal, skipping")
@@ -246,16 +300,221 @@ def from_typhos_composite_signal_panel(
     return widget
 
 
-def add_signal_row_to_grid(signal_name: str, signal_info: dict, device_name: str, grid: etree._Element, row: int):
-    signal = signal_info["signal"]
-    if is_signal_ro(signal):
-        logger.debug("Picking read-only widgets")
-        read_cls, _ = determine_widget_type(signal=signal, read_only=True)
-        write_cls = None
+def from_device(
+    device: Device,
+    display_type: Union[DisplayTypes, str, int] = DisplayTypes.detailed_screen,
+    macros: Optional[Dict[str, str]] = None,
+    nested: bool = False,
+) -> etree._ElementTree:
+    """
+    Generate a ui file xml tree for a device without creating any widgets.
+
+    This picks the template that a :class:`TyphosDeviceDisplay` would and
+    fills in its typhos widgets from the component walk of the device and
+    the cached signal descriptions, in the same way as :func:`from_display`.
+
+    Parameters
+    ----------
+    device : ophyd.Device
+        The device to export.
+    display_type : DisplayTypes, str, or int, optional
+        The type of display to export.
+    macros : dict, optional
+        Additional macros used to pick the template, as with
+        :meth:`TyphosDeviceDisplay.add_device`.
+    nested : bool, optional
+        Whether the display is nested in another, as with sub-devices.
+    """
+    display_type = normalize_display_type(display_type)
+    macros = TyphosDeviceDisplay._build_macros_from_device(device, macros=macros)
+    templates = TyphosDeviceDisplay._find_templates(type(device), macros, nested=nested)
+    try:
+        template = next(str(template) for template in templates[display_type.name] if str(template).endswith(".ui"))
+    except StopIteration:
+        raise ValueError(f"No .ui template found for {device.name} ({display_type.name})") from None
+
+    tree = etree.parse(template)
+    root = tree.getroot()
+
+    logger.debug(f"Parsing device {device.name}: searching for widgets in template {template}")
+
+    for elem in root.findall(".//widget"):
+        name = str(elem.get("name"))
+        try:
+            new_elem = convert_element_from_device(elem, device, name)
+        except TypeError:
+            logger.debug(f"Widget {name} was not a replaceable widget type, skipping")
+            continue
+        parent_elem = elem.getparent()
+        if parent_elem is None:
+            continue
+        parent_elem.replace(elem, new_elem)
+
+    return tree
+
+
+def convert_element_from_device(elem: etree._Element, device: Device, name: str) -> etree._Element:
+    """
+    Choose how to replace a typhos widget element, given the device it shows.
+    """
+    type_name = str(elem.get("class"))
+    match type_name:
+        case "TyphosSignalPanel":
+            return from_signal_panel_element(elem=elem, device=device, name=name, composite=False)
+        case "TyphosCompositeSignalPanel":
+            return from_signal_panel_element(elem=elem, device=device, name=name, composite=True)
+        case "TyphosDisplayTitle":
+            logger.debug(f"Replace {name} with title QLabel")
+            widget = create_widget_named(name=name, cls="QLabel")
+            add_string_property(widget=widget, prop_name="text", prop_value=device.name)
+            return widget
+        case (
+            "TyphosAlarmCircle"
+            | "TyphosAlarmEllipse"
+            | "TyphosAlarmPolygon"
+            | "TyphosAlarmRectangle"
+            | "TyphosAlarmTriangle"
+            | "TyphosDisplaySwitcher"
+            | "TyphosHelpFrame"
+            | "TyphosMethodButton"
+            | "TyphosNotesEdit"
+            | "TyphosPositionerWidget"
+            | "TyphosPositionerRowWidget"
+            | "TyphosRelatedSuiteButton"
+        ):
+            # Without a widget there is no size hint; keep any size from the template
+            logger.debug(f"Replace {name} with generic QWidget")
+            widget = create_widget_named(name=name, cls="QWidget")
+            for prop in elem.findall("property"):
+                if prop.get("name") in ("geometry", "minimumSize", "maximumSize"):
+                    widget.append(prop)
+            return widget
+        case _:
+            err = f"Unhandled type for {name} of type {type_name}"
+            logger.debug(err)
+            raise TypeError(err)
+
+
+def get_panel_settings(elem: etree._Element) -> dict:
+    """
+    Get the filter settings and signal order of a signal panel element.
+
+    Properties not set in the template take the defaults of
+    :class:`TyphosSignalPanel`.
+    """
+    kinds = {kind: True for kind in TyphosSignalPanel._kind_to_property}
+    settings = {"name_filter": "", "show_names": [], "omit_names": [], "sort_by": SignalOrder.byKind}
+    for prop in elem.findall("property"):
+        prop_name = prop.get("name")
+        value = prop[0] if len(prop) else None
+        if value is None:
+            continue
+        for kind, kind_property in TyphosSignalPanel._kind_to_property.items():
+            if prop_name == kind_property:
+                kinds[kind] = (value.text or "").strip() == "true"
+        if prop_name == "nameFilter":
+            settings["name_filter"] = (value.text or "").strip()
+        elif prop_name in ("showNames", "omitNames"):
+            names = [(item.text or "").strip() for item in value.findall("string")]
+            settings["show_names" if prop_name == "showNames" else "omit_names"] = names
+        elif prop_name == "sortBy":
+            settings["sort_by"] = getattr(SignalOrder, (value.text or "").split("::")[-1].strip(), SignalOrder.byKind)
+    settings["kinds"] = [ophyd.Kind[kind] for kind, show in kinds.items() if show]
+    return settings
+
+
+def from_signal_panel_element(elem: etree._Element, device: Device, name: str, composite: bool) -> etree._Element:
+    """
+    Replace a signal panel element with rows for the signals of the device.
+
+    This mirrors :class:`TyphosSignalPanel` (a flat, sorted walk of all
+    signals) and :class:`TyphosCompositeSignalPanel` (top-level signals and
+    nested sub-device displays), with lazy signals only instantiated if
+    shown.
+    """
+    logger.debug(f"Exploring contents of signal panel {name} for {device.name}")
+    settings = get_panel_settings(elem)
+    sort_by = settings.pop("sort_by")
+    should_show = functools.partial(SignalPanel._should_show, **settings)
+
+    widget = create_widget_named(name=name, cls="QWidget")
+    grid = add_grid_layout(widget=widget, layout_name=f"{name}_grid_layout")
+
+    if composite:
+        entries = [(attr, attr, component) for attr, component in _get_top_level_components(type(device))]
     else:
-        logger.debug("Picking read-write widgets")
-        read_cls, _ = determine_widget_type(signal=signal, read_only=True)
-        write_cls, _ = determine_widget_type(signal=signal, read_only=False)
+        entries = [
+            (walk.item.attr, walk.dotted_name, walk.item)
+            for walk in sorted(device.walk_components(), key=_get_component_sorter(sort_by))
+            if not issubclass(walk.item.cls, ophyd.Device)
+        ]
+
+    output_row = -1
+    for attr, dotted_name, component in entries:
+        if composite and issubclass(component.cls, ophyd.Device):
+            output_row += 1
+            sub_tree = from_device(getattr(device, attr), display_type=DisplayTypes.embedded_screen, nested=True)
+            top_widget = sub_tree.getroot().find("widget")
+            if top_widget is None:
+                raise RuntimeError("Template had no top-level widget?")
+            subdisplay_item = add_item_to_grid(grid=grid, row=output_row, col=0, colspan=3)
+            subdisplay_item.append(top_widget)
+            continue
+
+        try:
+            if component.lazy:
+                kind = component.kind
+            else:
+                kind = getattr(device, dotted_name).kind
+            if not should_show(kind, dotted_name):
+                continue
+            with ophyd.do_not_wait_for_lazy_connection(device):
+                signal = getattr(device, dotted_name)
+        except Exception as ex:
+            logger.warning("Failed to get signal %r from device %s: %s", dotted_name, device.name, ex)
+            continue
+
+        if not isinstance(signal, EpicsSignalBase):
+            logger.debug(f"{signal.name} is not an epics signal, skipping")
+            continue
+        output_row += 1
+        add_signal_widgets_to_grid(
+            signal_name=signal.name,
+            signal=signal,
+            widget_info=get_signal_widget_info(signal),
+            device_name=device.name,
+            grid=grid,
+            row=output_row,
+        )
+
+    return widget
+
+
+def add_signal_row_to_grid(signal_name: str, signal_info: SignalRow, device_name: str, grid: etree._Element, row: int):
+    signal = signal_info.signal
+    add_signal_widgets_to_grid(
+        signal_name=signal_name,
+        signal=signal,
+        widget_info=signal_info.widget_info or get_signal_widget_info(signal),
+        device_name=device_name,
+        grid=grid,
+        row=row,
+    )
+
+
+def add_signal_widgets_to_grid(
+    signal_name: str,
+    signal: EpicsSignalBase,
+    widget_info: SignalWidgetInfo,
+    device_name: str,
+    grid: etree._Element,
+    row: int,
+):
+    """
+    Add the label, readback and setpoint widgets of a signal to a grid row.
+    """
+    read_cls = widget_info.read_cls
+    write_cls = widget_info.write_cls
 
     short_signal_name = signal_name.removeprefix(device_name + "_")
     if short_signal_name == device_name:
@@ -281,7 +540,7 @@ def add_signal_row_to_grid(signal_name: str, signal_info: dict, device_name: str
         col=1,
         colspan=colspan,
     )
-    add_string_property(widget=readback_widget, prop_name="channel", prop_value=f"ca://{signal_info['signal'].pvname}")
+    add_string_property(widget=readback_widget, prop_name="channel", prop_value=f"ca://{signal.pvname}")
     if write_cls is None:
         return
     # Third item in row: setpoint widget
@@ -292,11 +551,34 @@ def add_signal_row_to_grid(signal_name: str, signal_info: dict, device_name: str
     add_string_property(widget=setpoint_widget, prop_name="channel", prop_value=f"ca://{signal._write_pv.pvname}")  # type: ignore
     if setpoint_clsname == "PyDMPushButton":
         # Helpful to get the press value correct here in the translation so the button works as intended
-        press_value = get_variety_metadata(signal_info["signal"])["value"]
+        press_value = get_variety_metadata(signal)["value"]
         add_string_property(widget=setpoint_widget, prop_name="pressValue", prop_value=str(press_value))
         add_string_property(widget=setpoint_widget, prop_name="text", prop_value="Command")
 
 
+def get_signal_widget_info(signal: ophyd.Signal) -> SignalWidgetInfo:
+    """
+    Get the widget types for a signal, describing it only if not yet cached.
+    """
+    type_cache = cache.get_global_widget_type_cache()
+    info = type_cache.cache.get(signal)
+    if info is not None:
+        return info
+
+    desc = cache.get_global_describe_cache().cache.get(signal)
+    if desc is None:
+        try:
+            desc = signal.describe()[signal.name]
+        except Exception:
+            logger.error("Unable to connect to %r during export", signal.name)
+            desc = {}
+
+    info = SignalWidgetInfo.from_signal(signal, desc)
+    if desc:
+        type_cache.cache[signal] = info
+    return info
+
+
 def typhos_type_to_pydm_type(typhos_widget: QWidget) -> str:
     match str(typhos_widget.__name__):
         case "PyDMLabel" | "TyphosLabel" | "WaveformDialogButton" | "ImageDialogButton":
@@ -12,10 +12,11 @@ Container widgets:
 
 from __future__ import annotations
 
+import dataclasses
 import functools
 import logging
 from functools import partial
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import ophyd
 from ophyd import Kind
@@ -23,7 +24,7 @@ from ophyd.signal import EpicsSignal, EpicsSignalRO
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import Q_ENUMS, Property
 
-from . import display, utils
+from . import utils
 from .cache import get_global_widget_type_cache
 from .utils import TyphosBase
 from .widgets import SignalWidgetInfo, TyphosDesignerMixin
@@ -72,6 +73,40 @@ def _get_component_sorter(signal_order, *, kind_order=None):
     return {SignalOrder.byKind: kind_sorter, SignalOrder.byName: name_sorter}.get(signal_order, name_sorter)
 
 
+@dataclasses.dataclass(slots=True)
+class SignalRow:
+    """
+    Bookkeeping record for a single signal or component row of a panel.
+
+    Panels may hold tens of thousands of these, so the record uses
+    ``__slots__`` rather than a per-instance dictionary.
+    """
+
+    #: The grid layout row number.
+    row: int
+    #: The instantiated signal, or None if only the component is known.
+    signal: Optional[ophyd.OphydObj] = None
+    #: The component, used for lazy instantiation of the signal.
+    component: Optional[ophyd.Component] = None
+    #: Widget information, once determined from the signal description.
+    widget_info: Optional[SignalWidgetInfo] = None
+    #: Callable to instantiate ``signal`` from ``component``.
+    create_signal: Optional[Callable[[], ophyd.OphydObj]] = None
+    #: Whether the row is visible according to the current filters.
+    visible: bool = True
+
+    def __getitem__(self, key: str):
+        # Dictionary-style access, as rows were previously plain dicts
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+
 class SignalPanelRowLabel(QtWidgets.QLabel):
     """
     A row label for a signal panel.
@@ -127,7 +162,7 @@ class SignalPanel(QtWidgets.QGridLayout):
     def __init__(self, signals=None):
         super().__init__()
 
-        self.signal_name_to_info = {}
+        self.signal_name_to_info: Dict[str, SignalRow] = {}
         self._row_count = 0
         self._devices = []
 
@@ -153,9 +188,7 @@ class SignalPanel(QtWidgets.QGridLayout):
         signals : dict
             With the form: ``{signal_name: signal}``.
         """
-        return {
-            name: info["signal"] for name, info in list(self.signal_name_to_info.items()) if info["signal"] is not None
-        }
+        return {name: info.signal for name, info in list(self.signal_name_to_info.items()) if info.signal is not None}
 
     @property
     def visible_signals(self):
@@ -168,9 +201,9 @@ class SignalPanel(QtWidgets.QGridLayout):
             With the form: ``{signal_name: signal}``.
         """
         return {
-            name: info["signal"]
+            name: info.signal
             for name, info in list(self.signal_name_to_info.items())
-            if info["signal"] is not None and info["visible"]
+            if info.signal is not None and info.visible
         }
 
     visible_elements = visible_signals
@@ -198,13 +231,13 @@ class SignalPanel(QtWidgets.QGridLayout):
         except KeyError:
             return
 
-        if sig_info["widget_info"] is not None:
+        if sig_info.widget_info is not None:
             # Only add widgets on the first callback
             # TODO: debug why multiple calls happen
             return
 
-        sig_info["widget_info"] = info
-        row = sig_info["row"]
+        sig_info.widget_info = info
+        row = sig_info.row
 
         # Remove the 'loading...' animation if it's there
         item = self.itemAtPosition(row, self.COL_SETPOINT)
@@ -223,12 +256,12 @@ class SignalPanel(QtWidgets.QGridLayout):
 
         self._update_row(row, widgets)
 
-        visible = sig_info["visible"]
+        visible = sig_info.visible
         for widget in widgets[1:]:
             widget.setVisible(visible)
 
         signal_pairs = list(self.signal_name_to_info.items())
-        if all(sig_info["widget_info"] is not None for _, sig_info in signal_pairs):
+        if all(sig_info.widget_info is not None for _, sig_info in signal_pairs):
             self.loading_complete.emit([name for name, _ in signal_pairs])
 
     def _create_row_label(self, attr, dotted_name, tooltip, long_name=None):
@@ -331,14 +364,7 @@ class SignalPanel(QtWidgets.QGridLayout):
         loading.setToolTip("\n".join(loading_tooltip))
 
         row = self.add_row(label, loading)
-        self.signal_name_to_info[signal.name] = dict(
-            row=row,
-            signal=signal,
-            component=None,
-            widget_info=None,
-            create_signal=None,
-            visible=True,
-        )
+        self.signal_name_to_info[signal.name] = SignalRow(row=row, signal=signal, visible=True)
 
         self._connect_signal(signal)
         return row
@@ -380,10 +406,8 @@ class SignalPanel(QtWidgets.QGridLayout):
             attr=attr, dotted_name=dotted_name, long_name=long_name, tooltip=component.doc or ""
         )
         row = self.add_row(label, None)  # utils.TyphosLoading())
-        self.signal_name_to_info[dotted_name] = dict(
+        self.signal_name_to_info[dotted_name] = SignalRow(
             row=row,
-            signal=None,
-            widget_info=None,
             component=component,
             create_signal=functools.partial(getattr, device, dotted_name),
             visible=False,
@@ -502,8 +526,9 @@ class SignalPanel(QtWidgets.QGridLayout):
 
         return any(filter_by in item for item in items)
 
+    @classmethod
     def _should_show(
-        self,
+        cls,
         kind: ophyd.Kind,
         name: str,
         *,
@@ -549,7 +574,7 @@ class SignalPanel(QtWidgets.QGridLayout):
         for omit_name in omit_names or []:
             if omit_name and omit_name in name:
                 return False
-        return self._apply_name_filter(name_filter, name)
+        return cls._apply_name_filter(name_filter, name)
 
     def _set_visible(self, signal_name, visible):
         """
@@ -564,8 +589,8 @@ class SignalPanel(QtWidgets.QGridLayout):
             Change the visibility of the row to this.
         """
         info = self.signal_name_to_info[signal_name]
-        info["visible"] = bool(visible)
-        row = info["row"]
+        info.visible = bool(visible)
+        row = info.row
         for col in range(self.NUM_COLS):
             item = self.itemAtPosition(row, col)
             if item:
@@ -573,21 +598,21 @@ class SignalPanel(QtWidgets.QGridLayout):
                 if widget is not None:
                     widget.setVisible(visible)
 
-        if not visible or info["signal"] is not None:
+        if not visible or info.signal is not None:
             return
 
         # Create the signal if we're displaying it for the first time.
-        create_func = info["create_signal"]
+        create_func = info.create_signal
         if create_func is None:
             # A signal we shouldn't try to create again
             return
 
         try:
-            info["signal"] = signal = create_func()
+            info.signal = signal = create_func()
         except Exception as ex:
             logger.exception("Failed to create signal %s: %s", signal_name, ex)
             # Stop it from another attempt
-            info["create_signal"] = None
+            info.create_signal = None
             return
 
         logger.debug("Instantiating a not-yet-created signal from a component: %s", signal.name)
@@ -624,7 +649,7 @@ class SignalPanel(QtWidgets.QGridLayout):
             Names to explicitly omit.
         """
         for name, info in list(self.signal_name_to_info.items()):
-            item = info["signal"] or info["component"]
+            item = info.signal or info.component
             visible = self._should_show(
                 item.kind,
                 name,
@@ -986,8 +1011,11 @@ class CompositeSignalPanel(SignalPanel):
         name : str
             The name/label to go with the device.
         """
+        # typhos.display imports this module at import time
+        from .display import TyphosDeviceDisplay
+
         logger.debug("%s adding sub-device: %s (%s)", self.__class__.__name__, device.name, device.__class__.__name__)
-        container = display.TyphosDeviceDisplay(
+        container = TyphosDeviceDisplay(
             scrollable=False,
             nested=True,
         )
@@ -1015,7 +1043,7 @@ class CompositeSignalPanel(SignalPanel):
     def visible_elements(self):
         """Return all visible signals and components."""
         sigs = self.visible_signals
-        containers = {name: cont for name, cont in self._containers.items() if cont.isVisible()}
+        containers = {name: cont for name, cont in self._containers.items() if not cont.isHidden()}
         sigs.update(containers)
         return sigs
 
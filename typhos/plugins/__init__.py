@@ -6,13 +6,25 @@ __all__ = [
     "HappiConnection",
     "register_client",
 ]
+import importlib
 import logging
 
 from .core import SignalConnection, SignalPlugin, register_signal
 
 logger = logging.getLogger(__name__)
 
-try:
-    from .happi import HappiConnection, HappiPlugin, register_client
-except ImportError:
-    logger.debug("Unable to import HappiPlugin")
+# happi is slow to import, so its plugin is only imported on first use
+_happi_attributes = ("HappiConnection", "HappiPlugin", "register_client")
+
+
+def __getattr__(name):
+    if name in _happi_attributes:
+        try:
+            happi_plugin = importlib.import_module(".happi", __name__)
+        except ImportError:
+            logger.debug("Unable to import HappiPlugin", exc_info=True)
+        else:
+            value = getattr(happi_plugin, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
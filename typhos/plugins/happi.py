@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from happi import Client
 from happi.errors import SearchError
@@ -24,6 +25,81 @@ def register_client(client):
     HappiClientState.client = client
 
 
+class HappiDeviceCache:
+    """
+    Per-process cache of devices loaded by the happi:// plugin.
+
+    Devices are keyed by happi name and reference counted, such that all
+    ``happi://`` channels referring to a device - or any of its children -
+    share a single instance and its connections.  Releasing the last
+    reference only stops tracking the device: it remains in happi's own
+    device cache, such that widgets still showing its signals by way of
+    ``sig://`` and later ``happi://`` channels use the same instance.
+
+    Attributes
+    ----------
+    devices : dict
+        ``{name: (device, metadata)}``.
+    refcounts : dict
+        ``{name: reference count}``.
+    """
+
+    def __init__(self):
+        self.devices = {}
+        self.refcounts = {}
+        self._lock = threading.RLock()
+
+    def acquire(self, name):
+        """
+        Get the device ``name``, loading it if necessary.
+
+        Each call must be paired with a call to :meth:`release`.
+
+        Returns
+        -------
+        device : object
+            The device instance.
+        md : dict
+            The happi metadata of the device.
+
+        Raises
+        ------
+        SearchError
+            If the device is not found in the happi database.
+        """
+        with self._lock:
+            if name not in self.devices:
+                self.devices[name] = self._load(name)
+            self.refcounts[name] = self.refcounts.get(name, 0) + 1
+            return self.devices[name]
+
+    def _load(self, name):
+        """Load ``name`` from happi, reusing any device already loaded."""
+        # Avoid a circular import
+        from ..cache import get_global_happi_item_cache
+
+        item = get_global_happi_item_cache().find_item(HappiClientState.client, name)
+        return from_container(item), item.post()
+
+    def release(self, name):
+        """Release a reference to the device ``name``."""
+        with self._lock:
+            if self.refcounts.get(name, 0) <= 0:
+                logger.warning("Releasing happi device %r which was not acquired", name)
+                return
+
+            self.refcounts[name] -= 1
+            if self.refcounts[name] > 0:
+                return
+
+            del self.refcounts[name]
+            del self.devices[name]
+        logger.debug("Released happi device %r with no remaining listeners", name)
+
+
+device_cache = HappiDeviceCache()
+
+
 class HappiConnection(PyDMConnection):
     """A PyDMConnection to the Happi Database."""
 
@@ -31,6 +107,12 @@ class HappiConnection(PyDMConnection):
 
     def __init__(self, channel, address, protocol=None, parent=None):
         super().__init__(channel, address, protocol=protocol, parent=parent)
+        if "." in self.address:
+            self.device_name, self.child_name = self.address.split(".", 1)
+        else:
+            self.device_name, self.child_name = self.address, None
+        # References held in the device cache, one per listener
+        self._device_references = 0
         self.add_listener(channel)
 
     def add_listener(self, channel):
@@ -39,27 +121,26 @@ class HappiConnection(PyDMConnection):
         # Connect our channel to the signal
         self.tx.connect(channel.tx_slot, QtCore.Qt.QueuedConnection)
         logger.debug("Loading %r from happi Client", channel)
-        if "." in self.address:
-            device, child = self.address.split(".", 1)
-        else:
-            device, child = self.address, None
-        # Load the device from the Client
-        md = HappiClientState.client.find_item(name=device)
-        obj = from_container(md)
-        md = md.post()
+        device, child = self.device_name, self.child_name
+        # Share the device with all other channels referencing it
+        obj, md = device_cache.acquire(device)
+        self._device_references += 1
         # If we have a child grab it
         if child:
             logger.debug("Retrieving child %r from %r", child, obj.name)
             obj = getattr(obj, child)
             md = {"name": obj.name}
         # Send the device and metdata to all of our subscribers
-        self.tx.emit({"obj": obj, "md": md})
+        self.tx.emit({"obj": obj, "md": dict(md)})
 
     def remove_listener(self, channel, destroying=False, **kwargs):
         """Remove a channel from the database connection."""
         super().remove_listener(channel, destroying=destroying, **kwargs)
         if not destroying:
             self.tx.disconnect(channel.tx_slot)
+        if self._device_references > 0:
+            self._device_references -= 1
+            device_cache.release(self.device_name)
 
 
 class HappiPlugin(PyDMPlugin):
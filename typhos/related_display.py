@@ -7,11 +7,13 @@ import logging
 from pydm.utilities import establish_widget_connections, is_qt_designer
 from qtpy import QtCore, QtWidgets
 
+from .cache import get_global_happi_item_cache
 from .suite import TyphosSuite
 from .utils import TyphosObject, no_device_lazy_load, raise_window, use_stylesheet
 
 try:
     from happi.client import Client
+    from happi.errors import SearchError
     from happi.loader import load_devices
 
     happi_loaded = True
@@ -128,14 +130,14 @@ class TyphosRelatedSuiteButton(TyphosObject, QtWidgets.QPushButton):
         if self.happi_names and happi_check():
             happi_client = Client.from_config(cfg=self.happi_cfg or None)
             items = []
+            item_cache = get_global_happi_item_cache()
             for name in self.happi_names:
                 try:
-                    search_result = happi_client.search(name=name)[0]
-                except IndexError:
+                    items.append(item_cache.find_item(happi_client, name))
+                except SearchError:
                     raise ValueError(
                         f"Did not find device with name {name} in happi. Please check your spelling and your database."
                     ) from None
-                items.append(search_result.item)
 
             with no_device_lazy_load():
                 device_namespace = load_devices(*items, threaded=True)
@@ -0,0 +1,229 @@
+"""
+A persistent typhos process which opens suites on request.
+
+``typhos --server`` starts a process with the Qt application, stylesheets and
+typhos caches already warmed up, listening on a local socket.  ``typhos
+--attach`` then asks that process to open a suite in a new top-level window,
+which takes only as long as creating the suite itself.  All windows share the
+describe, template and happi caches, along with any devices already loaded
+from happi.
+
+The protocol is a single line of JSON each way: the client sends
+``{"argv": [...], "cwd": "..."}`` with its ``typhos`` command-line arguments
+and working directory, and the server replies with
+``{"ok": true, "title": "..."}`` or ``{"ok": false, "error": "..."}``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import socket
+from typing import Callable, Dict, List, Optional
+
+import platformdirs
+from qtpy import QtCore, QtNetwork, QtWidgets
+
+logger = logging.getLogger(__name__)
+
+# Time to wait for the server to open a suite, in seconds
+DEFAULT_ATTACH_TIMEOUT = 60.0
+
+
+# Client-only command-line options, which are not sent to the server, along
+# with whether they take a value
+CLIENT_OPTIONS = {"--attach": False, "--socket": True}
+
+
+def strip_client_args(argv: List[str]) -> List[str]:
+    """Remove the client-only options, such as ``--attach``, from ``argv``."""
+    stripped = []
+    args = iter(argv)
+    for arg in args:
+        option, has_value, _ = arg.partition("=")
+        if option not in CLIENT_OPTIONS:
+            stripped.append(arg)
+        elif CLIENT_OPTIONS[option] and not has_value:
+            # Skip the separate value as well
+            next(args, None)
+    return stripped
+
+
+def get_socket_path(path: Optional[str] = None) -> str:
+    """
+    Get the path of the server socket.
+
+    Defaults to ``$TYPHOS_SERVER_SOCKET``, or ``server.sock`` in the per-user
+    runtime directory.
+    """
+    if path:
+        return str(path)
+    return os.environ.get("TYPHOS_SERVER_SOCKET") or str(platformdirs.user_runtime_path("typhos") / "server.sock")
+
+
+def is_server_running(path: Optional[str] = None) -> bool:
+    """Whether a server is listening on the socket at ``path``."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(get_socket_path(path))
+        except OSError:
+            return False
+    return True
+
+
+def attach(
+    argv: List[str],
+    path: Optional[str] = None,
+    timeout: float = DEFAULT_ATTACH_TIMEOUT,
+) -> Dict[str, object]:
+    """
+    Ask a running server to open a suite.
+
+    Parameters
+    ----------
+    argv : list of str
+        The ``typhos`` command-line arguments for the suite.  Client-only
+        options such as ``--attach`` are removed before sending.
+    path : str, optional
+        The server socket.  See :func:`get_socket_path`.
+    timeout : float, optional
+        The time to wait for the suite to open, in seconds.
+
+    Returns
+    -------
+    reply : dict
+        The reply from the server.
+
+    Raises
+    ------
+    OSError
+        If the server could not be reached.
+    RuntimeError
+        If the server failed to open the suite.
+    """
+    request = {"argv": strip_client_args(argv), "cwd": os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(get_socket_path(path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as fp:
+            line = fp.readline()
+
+    if not line:
+        raise RuntimeError("The typhos server closed the connection without replying")
+
+    reply = json.loads(line)
+    if not reply.get("ok"):
+        raise RuntimeError(f"The typhos server failed to open the suite: {reply.get('error')}")
+    return reply
+
+
+class TyphosServer(QtCore.QObject):
+    """
+    Open suites on behalf of ``typhos --attach`` clients.
+
+    Requests are handled in the Qt event loop of the process, with windows
+    kept open until closed by the user.
+
+    Parameters
+    ----------
+    open_window : callable
+        Called with the client's command-line arguments and working directory
+        to create and show a window, e.g. :func:`typhos.cli.typhos_open_window`.
+    path : str, optional
+        The server socket.  See :func:`get_socket_path`.
+    parent : QObject, optional
+    """
+
+    window_opened = QtCore.Signal(object)
+
+    def __init__(
+        self,
+        open_window: Callable[[List[str], Optional[str]], QtWidgets.QMainWindow],
+        path: Optional[str] = None,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
+        self.path = get_socket_path(path)
+        self.open_window = open_window
+        self.windows: Dict[int, QtWidgets.QMainWindow] = {}
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._new_connection)
+
+    @property
+    def listening(self) -> bool:
+        """Whether the server is accepting requests."""
+        return self._server.isListening()
+
+    def listen(self):
+        """
+        Start accepting requests.
+
+        A socket left behind by a server which is no longer running is
+        replaced.
+
+        Raises
+        ------
+        RuntimeError
+            If another server is running or the socket could not be created.
+        """
+        if is_server_running(self.path):
+            raise RuntimeError(f"A typhos server is already listening on {self.path}")
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+        QtNetwork.QLocalServer.removeServer(self.path)
+        if not self._server.listen(self.path):
+            raise RuntimeError(f"Unable to listen on {self.path}: {self._server.errorString()}")
+        logger.info("typhos server listening on %s", self.path)
+
+    def close(self):
+        """Stop accepting requests, leaving open windows as they are."""
+        if self._server.isListening():
+            self._server.close()
+
+    def handle_request(self, data: bytes) -> Dict[str, object]:
+        """
+        Open a window for a request from a client.
+
+        Parameters
+        ----------
+        data : bytes
+            The JSON-encoded request.
+
+        Returns
+        -------
+        reply : dict
+        """
+        try:
+            request = json.loads(data)
+            window = self.open_window(list(request["argv"]), request.get("cwd"))
+        except Exception as ex:
+            logger.exception("Failed to handle typhos server request %r", data)
+            return {"ok": False, "error": str(ex) or type(ex).__name__}
+
+        key = id(window)
+        self.windows[key] = window
+        window.destroyed.connect(functools.partial(self.windows.pop, key, None))
+        self.window_opened.emit(window)
+        return {"ok": True, "title": window.windowTitle()}
+
+    @QtCore.Slot()
+    def _new_connection(self):
+        """Slot: accept pending client connections."""
+        while self._server.hasPendingConnections():
+            connection = self._server.nextPendingConnection()
+            connection.readyRead.connect(functools.partial(self._read_request, connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def _read_request(self, connection: QtNetwork.QLocalSocket):
+        """Reply to a request once fully received."""
+        if not connection.canReadLine():
+            return
+
+        reply = self.handle_request(bytes(connection.readLine()))
+        connection.write(json.dumps(reply).encode() + b"\n")
+        connection.flush()
+        connection.disconnectFromServer()
@@ -4,12 +4,14 @@ The high-level Typhos Suite, which bundles tools and panels.
 
 from __future__ import annotations
 
+import collections
 import logging
 import os
 import pathlib
 import textwrap
+import time
 from functools import partial
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 import ophyd
 import pcdsutils.qt
@@ -28,6 +30,23 @@ logger = logging.getLogger(__name__)
 DEFAULT_TOOLS = object()
 
 
+def _get_optional_env(name, type_):
+    value = os.environ.get(name, "").strip()
+    return type_(value) if value else None
+
+
+def _is_name_prefix(device_name: str, name: str) -> bool:
+    """Whether ``name``, maybe cleaned, is that of a sub device of ``device_name``."""
+    return name.startswith(f"{device_name}_") or clean_attr(name).startswith(f"{clean_attr(device_name)} ")
+
+
+# Maximum number of created subdisplays kept per suite, evicting those hidden
+# the longest first.  Unset for no limit.
+TYPHOS_MAX_RESIDENT_SUBDISPLAYS = _get_optional_env("TYPHOS_MAX_RESIDENT_SUBDISPLAYS", int)
+# Seconds after which hidden subdisplays are evicted.  Unset to keep them.
+TYPHOS_EVICT_HIDDEN_AFTER = _get_optional_env("TYPHOS_EVICT_HIDDEN_AFTER", float)
+
+
 class SidebarParameter(parametertree.Parameter):
     """
     Parameter to hold information for the sidebar.
@@ -45,6 +64,9 @@ class SidebarParameter(parametertree.Parameter):
 
     sigEmbed : QtCore.Signal
         A signal indicating an embed request for the parameter.
+
+    factory : functools.partial or None
+        The factory for the subdisplay, if it is created lazily.
     """
 
     itemClass = widgets.TyphosSidebarItem
@@ -58,6 +80,8 @@ class SidebarParameter(parametertree.Parameter):
         super().__init__(**opts)
         self.embeddable = embeddable
         self.devices = list(devices) if devices else []
+        # Creates the subdisplay, again after eviction if need be
+        self.factory = opts["value"] if isinstance(opts["value"], partial) else None
 
     def has_device(self, device: ophyd.Device):
         """
@@ -92,7 +116,9 @@ class LazySubdisplay(QtWidgets.QWidget):
     """
     A lazy subdisplay which only is instantiated when shown in the suite.
 
-    Supports devices by way of ``add_device``.
+    Supports devices by way of ``add_device``.  Devices are recorded until the
+    widget is first shown, and then fed to it in batches of ``batch_size``
+    per event loop iteration, such that the suite remains responsive.
 
     Parameters
     ----------
@@ -103,6 +129,7 @@ class LazySubdisplay(QtWidgets.QWidget):
     widget_cls: type[QtWidgets.QWidget]
     widget: QtWidgets.QWidget | None
     devices: list[ophyd.Device]
+    batch_size: int = 10
 
     def __init__(self, widget_cls: type[QtWidgets.QWidget]):
         super().__init__()
@@ -112,10 +139,25 @@ class LazySubdisplay(QtWidgets.QWidget):
         self.setVisible(False)
         self.setLayout(QtWidgets.QVBoxLayout())
         self.devices = []
+        self._pending_devices = collections.deque()
+        self._feed_timer = QtCore.QTimer(self)
+        self._feed_timer.setSingleShot(True)
+        self._feed_timer.setInterval(0)
+        self._feed_timer.timeout.connect(self._feed_pending_devices)
+
+    @property
+    def pending_devices(self) -> list[ophyd.Device]:
+        """Devices yet to be added to the widget."""
+        if self.widget is None:
+            return list(self.devices)
+        return list(self._pending_devices)
 
     def add_device(self, device: ophyd.Device):
         """Hook for adding a device from the suite."""
         self.devices.append(device)
+        if self.widget is not None and hasattr(self.widget, "add_device"):
+            self._pending_devices.append(device)
+            self._feed_timer.start()
 
     def hideEvent(self, event: QtGui.QHideEvent):
         """Hook for when the tool is hidden."""
@@ -131,8 +173,23 @@ class LazySubdisplay(QtWidgets.QWidget):
         self.setSizePolicy(self.widget.sizePolicy())
 
         if hasattr(self.widget, "add_device"):
-            for device in self.devices:
+            self._pending_devices.extend(self.devices)
+            self._feed_pending_devices()
+
+    def _feed_pending_devices(self):
+        """Add the next batch of pending devices to the widget."""
+        if self.widget is None:
+            return
+
+        for _ in range(min(self.batch_size, len(self._pending_devices))):
+            device = self._pending_devices.popleft()
+            try:
                 self.widget.add_device(device)
+            except Exception:
+                logger.exception("Unable to add %s to tool %s", device.name, type(self.widget))
+
+        if self._pending_devices:
+            self._feed_timer.start()
 
     def showEvent(self, event: QtGui.QShowEvent):
         """Hook for when the tool is shown in the suite."""
@@ -166,36 +223,34 @@ class DeviceParameter(SidebarParameter):
     subdevices : bool, optional
         Include child parameters for sub devices of ``device``.
 
+    lazy : bool, optional
+        Create the child parameters only when the parameter is first expanded
+        in the tree, or by way of :meth:`populate_children`.  Until then, a
+        placeholder child is shown and the sub devices of ``device`` are not
+        accessed.
+
     **opts
         Passed to super().__init__.
     """
 
     itemClass = widgets.TyphosSidebarItem
+    placeholder_name = "Loading..."
 
-    def __init__(self, device, subdevices=True, **opts):
+    def __init__(self, device, subdevices=True, lazy=False, **opts):
         # Set options for parameter
         opts["name"] = clean_name(device, strip_parent=device.root)
         self.device = device
         opts["expanded"] = False
+        opts["syncExpanded"] = True
         # Grab children from the given device
-        children = list()
-        if subdevices:
-            for child in device._sub_devices:
-                subdevice = getattr(device, child)
-                if subdevice._sub_devices:
-                    # If that device has children, make sure they are also
-                    # displayed further in the tree
-                    children.append(DeviceParameter(subdevice, subdevices=False))
-                else:
-                    # Otherwise just make a regular parameter out of it
-                    child_name = clean_name(subdevice, strip_parent=subdevice.root)
-                    param = SidebarParameter(
-                        value=partial(TyphosDeviceDisplay.from_device, subdevice),
-                        name=child_name,
-                        embeddable=True,
-                        devices=[subdevice],
-                    )
-                    children.append(param)
+        self._children_pending = bool(subdevices and lazy and device._sub_devices)
+        if self._children_pending:
+            # Placeholder such that the item may be expanded
+            children = [parametertree.Parameter(name=self.placeholder_name, value=None)]
+        elif subdevices:
+            children = self._create_children()
+        else:
+            children = []
 
         opts["children"] = children
         super().__init__(
@@ -204,6 +259,48 @@ class DeviceParameter(SidebarParameter):
             devices=[device],
             **opts,
         )
+        self.sigOptionsChanged.connect(self._options_changed)
+
+    @property
+    def children_pending(self) -> bool:
+        """Child parameters have yet to be created."""
+        return self._children_pending
+
+    def _create_children(self) -> list[SidebarParameter]:
+        """Create child parameters for the sub devices of the device."""
+        children = []
+        for child in self.device._sub_devices:
+            subdevice = getattr(self.device, child)
+            if subdevice._sub_devices:
+                # If that device has children, make sure they are also
+                # displayed further in the tree
+                children.append(DeviceParameter(subdevice, subdevices=False))
+            else:
+                # Otherwise just make a regular parameter out of it
+                child_name = clean_name(subdevice, strip_parent=subdevice.root)
+                param = SidebarParameter(
+                    value=partial(TyphosDeviceDisplay.from_device, subdevice),
+                    name=child_name,
+                    embeddable=True,
+                    devices=[subdevice],
+                )
+                children.append(param)
+        return children
+
+    def populate_children(self) -> None:
+        """Replace the placeholder with the child parameters, if pending."""
+        if not self._children_pending:
+            return
+
+        self._children_pending = False
+        placeholders = list(self.childs)
+        self.addChildren(self._create_children())
+        for placeholder in placeholders:
+            self.removeChild(placeholder)
+
+    def _options_changed(self, param, opts):
+        if opts.get("expanded"):
+            self.populate_children()
 
 
 class TyphosSuite(TyphosBase):
@@ -236,11 +333,30 @@ class TyphosSuite(TyphosBase):
         scrollbars for detailed and engineering screens but not for
         embedded displays.
 
+    max_resident_subdisplays : int, optional
+        The maximum number of created subdisplays to keep.  Past this,
+        hidden subdisplays are evicted, those hidden the longest first.
+        Defaults to the class attribute of the same name, configurable by way
+        of the environment variable ``TYPHOS_MAX_RESIDENT_SUBDISPLAYS``.
+
+    evict_hidden_after : float, optional
+        Evict subdisplays hidden for this many seconds.  Defaults to the class
+        attribute of the same name, configurable by way of the environment
+        variable ``TYPHOS_EVICT_HIDDEN_AFTER``.
+
     Attributes
     ----------
     default_tools : dict
         The default tools to use in the suite.  In the form of
         ``{'tool_name': ToolClass}``.
+
+    Notes
+    -----
+    Evicted subdisplays have their widgets - and with them, their channels -
+    torn down, and are created again the next time they are shown.  Tools
+    are never evicted, as they hold history such as logs and plots.  The
+    number of resident subdisplays and the memory in use are shown in the
+    sidebar.  See :meth:`evict_subdisplays` and :meth:`subdisplay_report`.
     """
 
     DEFAULT_TITLE = "Typhos Suite"
@@ -250,6 +366,8 @@ class TyphosSuite(TyphosBase):
         "Log": TyphosLogDisplay,
         "StripTool": TyphosTimePlot,
     }
+    max_resident_subdisplays: Optional[int] = TYPHOS_MAX_RESIDENT_SUBDISPLAYS
+    evict_hidden_after: Optional[float] = TYPHOS_EVICT_HIDDEN_AFTER
 
     def __init__(
         self,
@@ -259,6 +377,8 @@ class TyphosSuite(TyphosBase):
         content_layout: QtWidgets.QLayout | None = None,
         default_display_type: DisplayTypes = DisplayTypes.embedded_screen,
         scroll_option: ScrollOptions = ScrollOptions.auto,
+        max_resident_subdisplays: Optional[int] = None,
+        evict_hidden_after: Optional[float] = None,
     ):
         super().__init__(parent=parent)
 
@@ -269,6 +389,8 @@ class TyphosSuite(TyphosBase):
         self._save_action = ptypes.ActionParameter(name="Save Suite", value=None)
         self._tree.addParameters(self._save_action)
         self._save_action.sigActivated.connect(self.save)
+        self._report_param = ptypes.SimpleParameter(name="Resident displays", type="str", value="0", readonly=True)
+        self._tree.addParameters(self._report_param)
 
         self._bar = pcdsutils.qt.QPopBar(title="Suite", parent=self, widget=self._tree, pin=pin)
 
@@ -297,6 +419,25 @@ class TyphosSuite(TyphosBase):
         self.default_display_type = default_display_type
         self.scroll_option = scroll_option
 
+        # Sidebar parameter lookup tables, maintained by _add_to_sidebar:
+        # {device or name: [SidebarParameter, ...]}
+        self._parameters_by_device = {}
+        # {widget: SidebarParameter}
+        self._parameters_by_widget = {}
+        # {SidebarParameter: [device or name, ...]}
+        self._parameter_keys = {}
+
+        if max_resident_subdisplays is not None:
+            self.max_resident_subdisplays = max_resident_subdisplays
+        if evict_hidden_after is not None:
+            self.evict_hidden_after = evict_hidden_after
+        # {SidebarParameter: time hidden}, in the order hidden
+        self._hidden_subdisplays = collections.OrderedDict()
+        self._evicted_count = 0
+        self._eviction_timer = QtCore.QTimer(self)
+        self._eviction_timer.setSingleShot(True)
+        self._eviction_timer.timeout.connect(self.evict_subdisplays)
+
     def add_subdisplay(self, name, display, category):
         """
         Add an arbitrary widget to the tree of available widgets and tools.
@@ -398,13 +539,7 @@ class TyphosSuite(TyphosBase):
             suite.get_subdisplay('My Tool')
         """
         if not isinstance(display, SidebarParameter):
-            for group in self.top_level_groups.values():
-                tree = flatten_tree(group)
-                matches = [param for param in tree if hasattr(param, "has_device") and param.has_device(display)]
-
-                if matches:
-                    display = matches[0]
-                    break
+            display = self._find_parameter(display) or display
 
         if not isinstance(display, SidebarParameter):
             # If we got here we can't find the subdisplay
@@ -467,6 +602,7 @@ class TyphosSuite(TyphosBase):
         self._new_template()
         if isinstance(widget, TyphosDeviceDisplay):
             widget.template_changed.connect(self._new_template)
+        self._update_subdisplay_report()
         return widget
 
     def _new_template(self, template: Optional[pathlib.Path] = None) -> None:
@@ -543,13 +679,18 @@ class TyphosSuite(TyphosBase):
         else:
             widget.hide()
 
+        if sidebar and self._is_resident(sidebar):
+            self._hidden_subdisplays.setdefault(sidebar, time.monotonic())
+            self.evict_subdisplays()
+
     @QtCore.Slot()
     def hide_subdisplays(self):
         """Hide all open displays."""
         # Grab children from devices
         for group in self.top_level_groups.values():
             for param in flatten_tree(group)[1:]:
-                self.hide_subdisplay(param)
+                if isinstance(param, SidebarParameter):
+                    self.hide_subdisplay(param)
 
     @property
     def tools(self):
@@ -582,6 +723,9 @@ class TyphosSuite(TyphosBase):
 
         children: bool, optional
             Also add any ``subdevices`` of this device to the suite as well.
+            These are only added to the sidebar once the device is expanded
+            there, or once one of them is requested by way of
+            :meth:`get_subdisplay`.
 
         category: str, optional
             Category of device. By default, all devices will just be added to
@@ -590,13 +734,12 @@ class TyphosSuite(TyphosBase):
 
         super().add_device(device)
         self._update_title(device)
-        # Create DeviceParameter and add to top level category
-        dev_param = DeviceParameter(device, subdevices=children)
+        # Create DeviceParameter and add to top level category.  Children are
+        # added to the sidebar by way of sigChildAdded, when expanded.
+        dev_param = DeviceParameter(device, subdevices=children, lazy=True)
         self._add_to_sidebar(dev_param, category)
-        # Grab children
-        for child in flatten_tree(dev_param)[1:]:
-            self._add_to_sidebar(child)
-        # Add a device to all the tool displays
+        # Add a device to all the tool displays; lazy tools only record it
+        # until first shown
         for tool in self.tools:
             try:
                 tool.add_device(device)
@@ -675,7 +818,7 @@ class TyphosSuite(TyphosBase):
     @classmethod
     def from_devices(
         cls,
-        devices: list[Device],
+        devices: Iterable[Device],
         parent: QtWidgets.QWidget | None = None,
         tools: dict[str, type] | None | DEFAULT_TOOLS = DEFAULT_TOOLS,
         pin: bool = False,
@@ -690,7 +833,11 @@ class TyphosSuite(TyphosBase):
 
         Parameters
         ----------
-        device : ophyd.Device
+        devices : iterable of ophyd.Device
+            Devices are added to the suite as they are taken from the
+            iterable, which may be a generator such as
+            :func:`typhos.cli.iter_devices` that is still instantiating the
+            remainder.
 
         children : bool, optional
             Choice to include child Device components
@@ -748,14 +895,137 @@ class TyphosSuite(TyphosBase):
 
         logger.info("Adding devices ...")
         for device in devices:
+            t0 = time.monotonic()
             try:
                 suite.add_device(device, **kwargs)
                 if show_displays:
                     suite.show_subdisplay(device)
             except Exception:
                 logger.exception("Unable to add %r to TyphosSuite", device.name)
+            else:
+                logger.debug("Added %r to TyphosSuite in %.2f s", device.name, time.monotonic() - t0)
         return suite
 
+    @staticmethod
+    def _is_resident(param: SidebarParameter) -> bool:
+        """Whether ``param`` has a created subdisplay which may be evicted."""
+        return param.factory is not None and isinstance(param.value(), QtWidgets.QWidget)
+
+    @property
+    def resident_subdisplays(self) -> list[SidebarParameter]:
+        """Sidebar parameters with created subdisplays which may be evicted."""
+        return [param for param in self._parameter_keys if self._is_resident(param)]
+
+    @QtCore.Slot()
+    def evict_subdisplays(self) -> int:
+        """
+        Evict hidden subdisplays per the eviction policy.
+
+        Subdisplays hidden for longer than :attr:`evict_hidden_after` are
+        evicted, followed by those hidden the longest until no more than
+        :attr:`max_resident_subdisplays` remain.  Shown subdisplays are never
+        evicted.
+
+        Returns
+        -------
+        count : int
+            The number of subdisplays evicted.
+        """
+        now = time.monotonic()
+        to_evict = []
+        if self.evict_hidden_after is not None:
+            to_evict = [
+                param
+                for param, hidden_at in self._hidden_subdisplays.items()
+                if now - hidden_at >= self.evict_hidden_after
+            ]
+
+        if self.max_resident_subdisplays is not None:
+            excess = len(self.resident_subdisplays) - len(to_evict) - self.max_resident_subdisplays
+            for param in self._hidden_subdisplays:
+                if excess <= 0:
+                    break
+                if param not in to_evict:
+                    to_evict.append(param)
+                    excess -= 1
+
+        for param in to_evict:
+            self._evict_subdisplay(param)
+
+        if to_evict:
+            logger.debug("Evicted %d hidden subdisplay(s)", len(to_evict))
+
+        self._update_subdisplay_report()
+        self._schedule_eviction()
+        return len(to_evict)
+
+    def _evict_subdisplay(self, param: SidebarParameter) -> None:
+        """Tear down the subdisplay of ``param``, returning it to a lazy state."""
+        self._hidden_subdisplays.pop(param, None)
+        if not self._is_resident(param):
+            return
+
+        widget = param.value()
+        param.setValue(param.factory)
+        dock = widget.parent()
+        if isinstance(dock, QtWidgets.QDockWidget) and dock.isHidden():
+            # Closed docks are otherwise left behind in the content frame
+            dock.deleteLater()
+        else:
+            widget.deleteLater()
+        self._evicted_count += 1
+
+    def _schedule_eviction(self) -> None:
+        """Schedule the next eviction of subdisplays hidden too long."""
+        if self.evict_hidden_after is None or not self._hidden_subdisplays:
+            self._eviction_timer.stop()
+            return
+
+        first_hidden_at = next(iter(self._hidden_subdisplays.values()))
+        delay = first_hidden_at + self.evict_hidden_after - time.monotonic()
+        self._eviction_timer.start(max(int(delay * 1000), 0))
+
+    def subdisplay_report(self) -> dict[str, Optional[int]]:
+        """
+        Report on the subdisplays currently resident in the suite.
+
+        Returns
+        -------
+        report : dict
+            With keys ``resident`` (the number of created subdisplays, not
+            including tools), ``hidden`` (the number of those which are
+            hidden), ``evicted`` (the total number evicted), ``widgets`` (the
+            number of widgets in the resident subdisplays) and ``rss`` (the
+            resident memory of the process in bytes, if available).
+        """
+        resident = self.resident_subdisplays
+        widgets = 0
+        for param in resident:
+            widget = param.value()
+            widgets += 1 + len(widget.findChildren(QtWidgets.QWidget))
+
+        return {
+            "resident": len(resident),
+            "hidden": len(self._hidden_subdisplays),
+            "evicted": self._evicted_count,
+            "widgets": widgets,
+            "rss": utils.get_process_rss(),
+        }
+
+    def _update_subdisplay_report(self) -> None:
+        """Show the resident subdisplays and memory in the sidebar."""
+        report = self.subdisplay_report()
+        text = str(report["resident"])
+        if report["rss"] is not None:
+            text += f" ({report['rss'] / 2**20:.0f} MiB)"
+        self._report_param.setValue(text)
+        self._report_param.setOpts(
+            tip=(
+                f"{report['hidden']} hidden, {report['evicted']} evicted, "
+                f"{report['widgets']} widgets in resident subdisplays"
+            )
+        )
+
     def save(self):
         """
         Save suite settings to a file using :meth:`typhos.utils.save_suite`.
@@ -847,18 +1117,117 @@ class TyphosSuite(TyphosBase):
         return filenames
 
     def _get_sidebar(self, widget):
-        items = {}
+        return self._parameters_by_widget.get(widget)
+
+    def _find_parameter(self, display: Union[Device, str]) -> Optional[SidebarParameter]:
+        """Find the first sidebar parameter for a device or name."""
+        keys = [display]
+        if isinstance(display, str):
+            keys.append(clean_attr(display))
+
+        param = self._lookup_parameter(keys)
+        if param is not None:
+            return param
+
+        # Sidebar children are created lazily: create those of the devices
+        # which may hold it, one level at a time
+        pending = self._pending_ancestor_parameters(display)
+        while pending:
+            for param in pending:
+                param.populate_children()
+            param = self._lookup_parameter(keys)
+            if param is not None:
+                return param
+            pending = self._pending_ancestor_parameters(display)
+
+        # Devices may be added to widgets after they are put in the sidebar
         for group in self.top_level_groups.values():
-            for item in flatten_tree(group):
-                try:
-                    items[item.value()] = item
-                except ValueError:
-                    ...
-        return items.get(widget)
+            for param in flatten_tree(group):
+                if isinstance(param, SidebarParameter) and param.has_device(display):
+                    return param
+        return None
+
+    def _pending_ancestor_parameters(self, display: Union[Device, str]) -> list[DeviceParameter]:
+        """Parameters with children yet to be created which may hold ``display``."""
+        if isinstance(display, str):
+            # Sub device names are prefixed by those of their parents
+            candidates = [
+                param
+                for param in self._parameter_keys
+                if any(_is_name_prefix(device.name, display) for device in param.devices)
+            ]
+        else:
+            candidates = []
+            ancestor = getattr(display, "parent", None)
+            while ancestor is not None:
+                candidates.extend(self._parameters_by_device.get(ancestor, []))
+                ancestor = getattr(ancestor, "parent", None)
+        return [param for param in candidates if getattr(param, "children_pending", False)]
+
+    def _lookup_parameter(self, keys) -> Optional[SidebarParameter]:
+        for key in keys:
+            try:
+                return self._parameters_by_device[key][0]
+            except (KeyError, IndexError):
+                ...
+        return None
+
+    def _index_parameter(self, parameter: SidebarParameter) -> None:
+        """Add or update ``parameter`` in the device and widget lookup tables."""
+        old_keys, old_widget = self._parameter_keys.get(parameter, ((), None))
+        widget = parameter.value()
+        keys = [
+            *parameter.devices,
+            *getattr(widget, "devices", []),
+            parameter.name(),
+            # Sub device parameters are named relative to their root
+            *(device.name for device in parameter.devices if isinstance(device, Device)),
+        ]
+        self._remove_parameter_keys(parameter, [key for key in old_keys if key not in keys], old_widget)
+        for key in keys:
+            params = self._parameters_by_device.setdefault(key, [])
+            # Keep the original ordering for keys that are already indexed
+            if parameter not in params:
+                params.append(parameter)
+        self._parameter_keys[parameter] = (keys, widget)
+        if isinstance(widget, QtWidgets.QWidget):
+            self._parameters_by_widget.setdefault(widget, parameter)
+
+    def _unindex_parameter(self, parameter: SidebarParameter) -> None:
+        """Remove ``parameter`` from the device and widget lookup tables."""
+        keys, widget = self._parameter_keys.pop(parameter, ((), None))
+        self._remove_parameter_keys(parameter, keys, widget)
+        self._hidden_subdisplays.pop(parameter, None)
+
+    def _remove_parameter_keys(self, parameter: SidebarParameter, keys, widget) -> None:
+        for key in keys:
+            params = self._parameters_by_device.get(key, [])
+            if parameter in params:
+                params.remove(parameter)
+            if not params:
+                self._parameters_by_device.pop(key, None)
+        if widget is not None and self._parameters_by_widget.get(widget) is parameter:
+            del self._parameters_by_widget[widget]
+
+    def _sidebar_value_changed(self, parameter: SidebarParameter, value) -> None:
+        """A sidebar parameter value changed, e.g. a lazy display was created."""
+        if parameter in self._parameter_keys:
+            self._index_parameter(parameter)
+
+    def _sidebar_child_added(self, parent: parametertree.Parameter, child: parametertree.Parameter, index: int) -> None:
+        """A parameter was added to the sidebar, e.g. on expansion of a device."""
+        if isinstance(child, SidebarParameter):
+            self._add_to_sidebar(child)
+
+    def _sidebar_child_removed(self, parent: parametertree.Parameter, child: parametertree.Parameter) -> None:
+        """A parameter was removed from the sidebar."""
+        for param in flatten_tree(child):
+            self._unindex_parameter(param)
 
     def _show_sidebar(self, widget, dock):
         sidebar = self._get_sidebar(widget)
         if sidebar:
+            self._hidden_subdisplays.pop(sidebar, None)
             for item in sidebar.items:
                 item._mark_shown()
             # Make sure we react if the dock is closed outside of our menu
@@ -875,6 +1244,7 @@ class TyphosSuite(TyphosBase):
             else:
                 logger.debug("Creating new category %r ...", category)
                 group = ptypes.GroupParameter(name=category, value=None)
+                group.sigChildRemoved.connect(self._sidebar_child_removed)
                 self._tree.addParameters(group)
                 self._tree.sortItems(0, QtCore.Qt.AscendingOrder)
             logger.debug("Adding %r to category %r ...", parameter.name(), group.name())
@@ -886,9 +1256,20 @@ class TyphosSuite(TyphosBase):
             widget.setParent(self)
             widget.setHidden(True)
 
+        self._index_parameter(parameter)
+
         logger.debug("Connecting parameter signals ...")
+        parameter.sigValueChanged.connect(self._sidebar_value_changed)
+        parameter.sigChildAdded.connect(self._sidebar_child_added)
+        parameter.sigChildRemoved.connect(self._sidebar_child_removed)
         self._connect_partial_weakly(parameter, parameter.sigOpen, self.show_subdisplay, parameter)
         self._connect_partial_weakly(parameter, parameter.sigHide, self.hide_subdisplay, parameter)
         if parameter.embeddable:
             self._connect_partial_weakly(parameter, parameter.sigEmbed, self.embed_subdisplay, parameter)
+
+        # Children created later, e.g. on expansion, are added by way of
+        # sigChildAdded
+        for child in parameter.childs:
+            if isinstance(child, SidebarParameter):
+                self._add_to_sidebar(child)
         return parameter
@@ -61,6 +61,12 @@ def qapp(pytestconfig):
     return application
 
 
+@pytest.fixture(scope="function", autouse=True)
+def _synchronous_template_search(monkeypatch):
+    # Most tests expect device-specific templates to be loaded immediately
+    monkeypatch.setattr(typhos.display.TyphosDeviceDisplay, "threaded_template_search", False)
+
+
 @pytest.fixture(scope="function", autouse=True)
 def noapp(monkeypatch):
     monkeypatch.setattr(QtWidgets.QApplication, "exec_", lambda x: 1)
@@ -75,6 +81,26 @@ def get_top_level_widgets() -> List[weakref.ReferenceType[QtWidgets.QWidget]]:
     return [weakref.ref(widget) for widget in app.topLevelWidgets()]
 
 
+def _get_cached_template_widgets(widgets: List[QtWidgets.QWidget]) -> List[QtWidgets.QWidget]:
+    """
+    Template widgets cached by displays in ``widgets``.
+
+    These are top-level while cached, but are owned by - and deleted along
+    with - their displays.
+    """
+    cached = []
+    for widget in widgets:
+        try:
+            displays = widget.findChildren(typhos.display.TyphosDeviceDisplay)
+        except RuntimeError:
+            continue
+        if isinstance(widget, typhos.display.TyphosDeviceDisplay):
+            displays.append(widget)
+        for display in displays:
+            cached.extend(display._template_widgets.values())
+    return cached
+
+
 def _dump_widgets(widgets: List[weakref.ReferenceType[QtWidgets.QWidget]]) -> None:
     if not widgets:
         return
@@ -139,6 +165,7 @@ def pytest_runtest_call(item: pytest.Item):
         for w in set(_dereference_list(ending_widgets))
         - set(_dereference_list(starting_widgets))
         - set(_dereference_list(qtbot_widgets))
+        - set(_get_cached_template_widgets(_dereference_list(ending_widgets)))
     )
     _dump_widgets(widgets_to_check)
 
@@ -10,6 +10,7 @@ from pytestqt.qtbot import QtBot
 
 import typhos
 import typhos.plugins
+import typhos.plugins.happi
 from typhos.plugins.happi import HappiPlugin
 from typhos.widgets import HappiChannel
 
@@ -88,6 +89,48 @@ def test_connection_for_child(
     assert tx["obj"].name == "test_motor_setpoint"
 
 
+def test_connection_shared_device(
+    qtbot: QtBot,
+    client: happi.Client,
+    happi_plugin: HappiPlugin,
+):
+    device_cache = typhos.plugins.happi.device_cache
+    # Other tests may leave channels connected
+    refcount = device_cache.refcounts.get("test_motor", 0)
+    mock = Mock()
+    child_mock = Mock()
+    hc = HappiChannel(address="happi://test_motor", tx_slot=mock)
+    child_hc = HappiChannel(address="happi://test_motor.setpoint", tx_slot=child_mock)
+    hc.connect()
+    child_hc.connect()
+
+    def mocks_called():
+        assert mock.called
+        assert child_mock.called
+
+    qtbot.wait_until(mocks_called)
+    # A single device instance serves both connections
+    device = mock.call_args[0][0]["obj"]
+    assert child_mock.call_args[0][0]["obj"].parent is device
+    assert device_cache.refcounts["test_motor"] == refcount + 2
+
+    hc.disconnect()
+    assert device_cache.refcounts["test_motor"] == refcount + 1
+    child_hc.disconnect()
+    if refcount == 0:
+        # Releasing the last listener stops tracking the device
+        assert "test_motor" not in device_cache.devices
+        assert "test_motor" not in device_cache.refcounts
+
+    # Later connections get the same instance as widgets still showing it
+    mock.reset_mock()
+    hc = HappiChannel(address="happi://test_motor", tx_slot=mock)
+    hc.connect()
+    qtbot.wait_until(lambda: mock.assert_called())
+    assert mock.call_args[0][0]["obj"] is device
+    hc.disconnect()
+
+
 def test_bad_address_smoke(client: happi.Client):
     hc = HappiChannel(address="happi://not_a_device", tx_slot=lambda x: None)
     hc.connect()
@@ -2,16 +2,44 @@
 Run the benchmark test cases using pytest-benchmark
 """
 
+import collections
+import json
 import sys
+import threading
+import time
 
 import pytest
 from epics import PV
+from ophyd import EpicsSignal, Signal
 from qtpy import QtWidgets
 
+import typhos
+
 from ..benchmark import utils
-from ..benchmark.cases import unit_tests
+from ..benchmark.cases import PRODUCTION_MIX, unit_tests
+from ..benchmark.device import DTYPES, ENUM_STRINGS, IMAGE_SHAPE, get_signal_dtype, make_test_device_class
+from ..benchmark.happi import happi_lookup_report
+from ..benchmark.imports import import_time_report
+from ..benchmark.ioc import get_pvproperty_kwargs
+from ..benchmark.leaks import DEFAULT_THRESHOLDS, MEASURES, find_leaks, find_reference_holders, measure_cycles
+from ..benchmark.memory import signal_bookkeeping_report
+from ..benchmark.phases import PHASES, compare_reports, load_report, phase_report, save_report
+from ..benchmark.preconnect import measure_time_to_values
 from ..benchmark.profile import profiler_context
+from ..benchmark.sampler import StackSampler, get_sampler, sampler_context
+from ..benchmark.stress import count_dropped_frames, measure_update_load
+from ..benchmark.stylesheet import STYLESHEETS, measure_display_time
+from ..benchmark.templates import template_load_report
 from ..suite import TyphosSuite
+from ..tweakable import TyphosTweakable
+from ..widgets import (
+    ImageDialogButton,
+    TyphosComboBox,
+    TyphosLineEdit,
+    TyphosScalarRange,
+    WaveformDialogButton,
+    widget_type_from_description,
+)
 from .conftest import save_image
 
 
@@ -60,3 +88,240 @@ def test_profiler(capsys):
         utils.get_native_functions(utils)
     output = capsys.readouterr()
     assert "get_native_functions" in output.out
+
+
+def _sampled_busy_loop(duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+def test_stack_sampler(tmp_path):
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    thread = threading.Thread(target=_sampled_busy_loop, args=(0.2,), name="busy")
+    thread.start()
+    thread.join()
+    sampler.stop()
+    assert not sampler.running
+    assert any(thread_name == "busy" and stack[-1][0] == "_sampled_busy_loop" for thread_name, stack in sampler.samples)
+    # The sampler does not sample itself
+    assert all(thread_name != "typhos-stack-sampler" for thread_name, _ in sampler.samples)
+
+    collapsed = tmp_path / "profile.txt"
+    sampler.save(collapsed)
+    lines = collapsed.read_text().splitlines()
+    assert len(lines) == len(sampler.samples)
+    assert any(line.startswith("busy;") and "_sampled_busy_loop" in line for line in lines)
+
+    speedscope = tmp_path / "profile.json"
+    sampler.save(speedscope)
+    with open(speedscope) as fp:
+        data = json.load(fp)
+    num_frames = len(data["shared"]["frames"])
+    for profile in data["profiles"]:
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert all(0 <= idx < num_frames for sample in profile["samples"] for idx in sample)
+    assert "busy" in {profile["name"] for profile in data["profiles"]}
+
+
+def test_sampler_context_error(tmp_path):
+    filename = tmp_path / "profile.txt"
+    with pytest.raises(RuntimeError):
+        with sampler_context(filename):
+            _sampled_busy_loop(0.05)
+            raise RuntimeError("Failed")
+    # Saved all the same, as that is when a profile is needed the most
+    assert not get_sampler().running
+    assert filename.exists()
+
+
+def test_mixed_test_device():
+    cls = make_test_device_class(num_signals=20, **PRODUCTION_MIX)
+    components = [getattr(cls, attr) for attr in cls.component_names]
+    assert collections.Counter(cpt.kind.name for cpt in components) == {
+        "hinted": 2,
+        "normal": 6,
+        "config": 8,
+        "omitted": 4,
+    }
+    assert collections.Counter(map(get_signal_dtype, components)) == PRODUCTION_MIX["dtypes"]
+    assert sum(cpt.lazy for cpt in components) == 4
+    assert sum(bool(typhos.utils.get_variety_metadata(cpt)) for cpt in components) == 5
+    # The same arguments give the same composition
+    other = make_test_device_class(num_signals=20, **PRODUCTION_MIX)
+    assert [get_signal_dtype(getattr(other, attr)) for attr in other.component_names] == list(
+        map(get_signal_dtype, components)
+    )
+
+    # Each data type takes its own widget path
+    def get_widget_classes(**kwargs):
+        device = make_test_device_class(num_signals=6, dtypes={dtype: 1 for dtype in DTYPES}, **kwargs)(name="mixed")
+        widget_classes = {}
+        for attr in device.component_names:
+            signal = getattr(device, attr)
+            widget_cls, _ = widget_type_from_description(signal, signal.describe()[signal.name])
+            widget_classes[get_signal_dtype(getattr(type(device), attr))] = widget_cls
+        return widget_classes
+
+    assert get_widget_classes() == {
+        "float": TyphosLineEdit,
+        "int": TyphosLineEdit,
+        "enum": TyphosComboBox,
+        "string": TyphosLineEdit,
+        "waveform": WaveformDialogButton,
+        "image": ImageDialogButton,
+    }
+    assert get_widget_classes(variety_ratio=1.0)["float"] is TyphosTweakable
+
+
+def test_test_device_variety_metadata(qtbot):
+    device = make_test_device_class(num_signals=1, dtypes={"float": 1}, variety_ratio=1.0)(name="variety")
+    signal = getattr(device, device.component_names[0])
+    widget_cls, kwargs = widget_type_from_description(signal, signal.describe()[signal.name])
+    tweakable = widget_cls(**kwargs)
+    qtbot.add_widget(tweakable)
+    assert isinstance(tweakable, TyphosTweakable)
+
+    # The limits are found by the variety key handlers
+    scalar_range = TyphosScalarRange(variety_metadata=tweakable.variety_metadata)
+    qtbot.add_widget(scalar_range)
+    assert scalar_range.userDefinedLimits
+    assert (scalar_range.userMinimum, scalar_range.userMaximum) == (-10, 10)
+    assert scalar_range.delta_value == 0.5
+
+
+def test_mixed_test_device_ioc():
+    cls = make_test_device_class(
+        signal_class=EpicsSignal,
+        include_prefix=True,
+        num_signals=6,
+        dtypes={dtype: 1 for dtype in DTYPES},
+    )
+    components = {get_signal_dtype(getattr(cls, attr)): getattr(cls, attr) for attr in cls.component_names}
+    assert components["string"].kwargs["string"]
+    assert get_pvproperty_kwargs(components["enum"])["enum_strings"] == ENUM_STRINGS
+    assert len(get_pvproperty_kwargs(components["image"])["value"]) == IMAGE_SHAPE[0] * IMAGE_SHAPE[1]
+
+
+def test_signal_bookkeeping_memory():
+    report = signal_bookkeeping_report(count=1000)
+    for result in report.values():
+        assert result["after"] < result["before"]
+
+
+@pytest.mark.parametrize("kind", ["display", "positioner"])
+def test_leak_benchmark(qapp, kind):
+    result = measure_cycles(kind, test_name="flat_soft", cycles=3, warmup=1)
+    assert all(len(result["samples"][measure]) == 3 for measure in MEASURES)
+    # Closed widgets are deleted
+    assert result["growth"]["widgets"] <= DEFAULT_THRESHOLDS["widgets"]
+    holders = result["holders"]
+    # Closed widgets release their sig:// connections
+    assert holders["sig_connections"] == 0
+    # The caches only hold signals which are also registered for sig://
+    assert result["alive"] == holders["signal_registry"] + holders["other"]
+
+
+def test_find_reference_holders():
+    held = Signal(name="leak_benchmark_held")
+    typhos.plugins.register_signal(held)
+    holders = find_reference_holders([held, Signal(name="leak_benchmark_other")])
+    assert holders["signal_registry"] == 1
+    assert holders["other"] == 1
+
+    report = {"display": {"growth": dict(DEFAULT_THRESHOLDS, gc_objects=1e6)}}
+    assert find_leaks(report) == {"display": {"gc_objects": 1e6}}
+    assert find_leaks(report, {"gc_objects": 1e7}) == {}
+
+
+def test_template_load_benchmark(qapp):
+    report = template_load_report(count=2)
+    for result in report.values():
+        assert result["pydm"] > 0
+        assert result["cached"] > 0
+
+
+def test_stylesheet_benchmark(qapp):
+    stylesheet = STYLESHEETS["tiny"].read_text()
+    for batched in (False, True):
+        assert measure_display_time(stylesheet, batched=batched, count=1, subdevice_layers=1, subdevice_spread=2) > 0
+
+
+def test_happi_lookup_benchmark():
+    report = happi_lookup_report(entries=100, lookups=2, count=1)
+    assert report["uncached"] > 0
+    assert report["cached"] > 0
+
+
+@pytest.mark.skipif(not utils.has_caproto, reason="Requires caproto")
+def test_preconnect_benchmark(qapp):
+    for preconnect in (False, True):
+        assert measure_time_to_values("flat_connect", preconnect=preconnect) > 0
+
+
+@pytest.mark.skipif(not utils.has_caproto, reason="Requires caproto")
+def test_stress_benchmark(qapp):
+    result = measure_update_load("flat_connect", rate=5.0, duration=1.0)
+    assert result["pvs"] == 100
+    assert result["ioc_rate"] > 0
+    assert result["updates"] > 0
+    assert result["value_latency_p95"] >= 0
+    assert result["dropped_frames"] >= 0
+
+    with pytest.raises(ValueError):
+        measure_update_load("flat_soft")
+
+
+def test_count_dropped_frames():
+    frame = 1.0 / 60.0
+    assert count_dropped_frames([0.005, 0.01]) == 0
+    assert count_dropped_frames([0.005, 3.5 * frame, 1.5 * frame]) == 4
+
+
+def test_phase_report(qapp, tmp_path):
+    report = phase_report(["flat_soft"], count=2)
+    samples = report["cases"]["flat_soft"]
+    assert set(samples) == set(PHASES)
+    for phase in PHASES:
+        assert len(samples[phase]) == 2
+        assert all(elapsed > 0 for elapsed in samples[phase])
+
+    filename = tmp_path / "report.json"
+    save_report(report, filename)
+    assert load_report(filename) == report
+
+
+def test_compare_reports():
+    def make_report(scale, values=True):
+        samples = {phase: [scale * (1.0 + 0.01 * idx) for idx in range(5)] for phase in PHASES}
+        if not values:
+            samples["values"] = [None] * 5
+        return {"cases": {"flat_soft": samples, "deep_soft": samples}}
+
+    old = make_report(1.0)
+    assert not any(comparison.regression for comparison in compare_reports(old, make_report(1.01)))
+
+    comparisons = compare_reports(old, make_report(1.5, values=False))
+    assert len(comparisons) == 2 * len(PHASES)
+    assert all(comparison.regression for comparison in comparisons)
+    assert {comparison.new for comparison in comparisons if comparison.phase == "values"} == {float("inf")}
+
+    # Improvements are not flagged
+    assert not any(comparison.regression for comparison in compare_reports(make_report(1.5), old))
+
+
+def test_import_time_benchmark():
+    report = import_time_report(["typhos", "typhos.plugins.core"], count=1)
+    for result in report.values():
+        assert result["total"] > 0
+        # Neither the package nor the sig:// plugin pull in the GUI
+        assert "typhos.display" not in result["modules"]
+        assert "happi" not in result["modules"]
+    assert report["typhos"]["modules"][-1] == "typhos"
+
+
+def test_lazy_package_attributes():
+    assert typhos.TyphosDeviceDisplay is typhos.display.TyphosDeviceDisplay
+    assert "TyphosSuite" in dir(typhos)
+    assert not hasattr(typhos, "NotAnAttribute")
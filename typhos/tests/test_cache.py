@@ -1,10 +1,15 @@
+import pathlib
 import random
 
+import happi
 import ophyd
 import pytest
 import pytestqt
 
 import typhos.cache
+import typhos.utils
+
+from . import conftest
 
 
 def ensure_cache_clear(qtbot, signal, cache):
@@ -85,3 +90,112 @@ def test_widget_type_signal(qtbot, type_cache, sig):
 
     assert block.args[0] is sig
     assert type_cache.get(sig) is block.args[1]
+
+
+@pytest.fixture(scope="function")
+def template_cache(tmp_path, monkeypatch):
+    cache = typhos.cache._GlobalTemplateCache(cache_dir=tmp_path / "template_cache")
+    monkeypatch.setattr(typhos.cache, "_GLOBAL_TEMPLATE_CACHE", cache)
+    return cache
+
+
+@pytest.fixture(scope="function")
+def ui_file(tmp_path):
+    filename = tmp_path / "Test.detailed.ui"
+    filename.write_text((typhos.utils.ui_core_dir / "embedded_screen.ui").read_text())
+    return filename
+
+
+def test_template_cache_reuse(template_cache, ui_file):
+    template = template_cache.get(ui_file)
+    assert template_cache.get(str(ui_file)) is template
+    # No macros in the template: the class is shared
+    assert not template.has_macros
+    assert template.get_ui_class({"name": "a"}) is template.get_ui_class({"name": "b"})
+
+
+def test_template_cache_modified(template_cache, ui_file):
+    template = template_cache.get(ui_file)
+    ui_file.write_text(ui_file.read_text().replace("<string>", "<string>${name}", 1))
+    modified = template_cache.get(ui_file)
+    assert modified is not template
+    assert modified.has_macros
+    assert modified.get_ui_class({"name": "a"}) is not modified.get_ui_class({"name": "a"})
+
+
+def test_template_cache_precompile(template_cache, ui_file):
+    cache_filename = template_cache.precompile(ui_file)
+    assert cache_filename.exists()
+
+    template_cache.clear()
+    template = template_cache._load_from_disk(ui_file.resolve(), template_cache._get_stamp(ui_file))
+    assert template is not None
+    assert template.code == template_cache.get(ui_file).code
+
+    # Out of date precompiled templates are ignored
+    ui_file.write_text(ui_file.read_text() + "\n")
+    assert template_cache._load_from_disk(ui_file.resolve(), template_cache._get_stamp(ui_file)) is None
+
+
+def test_template_cache_dir(tmp_path):
+    assert typhos.cache._GlobalTemplateCache(cache_dir="").cache_dir is None
+    assert typhos.cache._GlobalTemplateCache(cache_dir=tmp_path).cache_dir == tmp_path
+    # Defaults to the per-user cache directory
+    assert typhos.cache._GlobalTemplateCache(cache_dir=None).cache_dir.name == "templates"
+
+
+def test_load_ui_file_cached(qtbot, template_cache, ui_file):
+    display = typhos.utils.load_ui_file(str(ui_file), macros={"name": "test"})
+    qtbot.add_widget(display)
+    assert display.loaded_file() == str(ui_file)
+    assert template_cache.get(ui_file).path == ui_file.resolve()
+
+
+@pytest.fixture(scope="function")
+def happi_client(tmp_path):
+    path = tmp_path / "happi.json"
+    path.write_text((conftest.MODULE_PATH / "happi.json").read_text())
+    return happi.Client(path=str(path))
+
+
+def test_happi_item_cache(tmp_path, happi_client, monkeypatch):
+    cache_dir = tmp_path / "happi_cache"
+    cache = typhos.cache._GlobalHappiItemCache(cache_dir=cache_dir)
+    item = cache.find_item(happi_client, "test_motor")
+    assert item.device_class == happi_client.find_item(name="test_motor").device_class
+
+    with pytest.raises(happi.errors.SearchError):
+        cache.find_item(happi_client, "no_motor")
+
+    # Later lookups, including from other processes, skip the database
+    def find_document(**kwargs):
+        raise RuntimeError("Database searched")
+
+    monkeypatch.setattr(happi_client, "find_document", find_document)
+    assert cache.find_item(happi_client, "test_motor").name == "test_motor"
+    # Written to disk in batches
+    assert not list(cache_dir.glob("*.json"))
+    cache.flush()
+    cache = typhos.cache._GlobalHappiItemCache(cache_dir=cache_dir)
+    assert cache.find_item(happi_client, "test_motor").name == "test_motor"
+
+    # Until the database is modified
+    path = pathlib.Path(happi_client.backend.path)
+    path.write_text(path.read_text() + "\n")
+    with pytest.raises(RuntimeError):
+        cache.find_item(happi_client, "test_motor")
+
+
+def test_happi_item_cache_save(tmp_path, happi_client):
+    # Key the entry on its name
+    happi_client.find_item(name="test_motor").save()
+    cache = typhos.cache._GlobalHappiItemCache(cache_dir=tmp_path / "happi_cache")
+    cache.find_item(happi_client, "test_motor")
+    item = cache.find_item(happi_client, "test_motor")
+    # Cached documents are not shared with callers
+    item.kwargs["name"] = "modified"
+    assert cache.find_item(happi_client, "test_motor").kwargs["name"] != "modified"
+
+    # Saving updates the existing entry, rather than adding another
+    item.save()
+    assert happi_client.find_item(name="test_motor").kwargs["name"] == "modified"
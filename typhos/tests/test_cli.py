@@ -1,9 +1,18 @@
+import concurrent.futures
+import json
 import os
+import signal
+import threading
 
 import pytest
 from qtpy.QtWidgets import QLabel
 
 import typhos
+import typhos.cache
+import typhos.cli
+import typhos.server
+import typhos.utils
+from typhos.benchmark.sampler import get_sampler
 from typhos.cli import typhos_cli
 
 from . import conftest
@@ -50,6 +59,26 @@ def test_cli_stylesheet(qapp, qtbot, happi_cfg):
         os.remove("test.qss")
 
 
+def test_cli_stylesheet_suite_scope(qapp, qtbot, happi_cfg):
+    with open("test.qss", "w+") as handle:
+        handle.write("QLabel {color: red}")
+    try:
+        style = qapp.styleSheet()
+        window = typhos_cli(
+            ["test_motor", "--stylesheet", "test.qss", "--stylesheet-scope", "suite", "--happi-cfg", happi_cfg]
+        )
+        qtbot.addWidget(window)
+        suite = window.centralWidget()
+        assert qapp.styleSheet() == style
+        assert "QLabel {color: red}" in suite.styleSheet()
+        some_label = suite.findChild(QLabel)
+        color = some_label.palette().color(some_label.foregroundRole())
+        assert color.red() == 255
+    finally:
+        qapp.setStyleSheet(style)
+        os.remove("test.qss")
+
+
 @pytest.mark.parametrize(
     "klass, name", [("ophyd.sim.SynAxis[]", "SynAxis"), ("ophyd.sim.SynAxis[{'name':'foo'}]", "foo")]
 )
@@ -92,3 +121,237 @@ def test_cli_profile_output(capsys, qtbot):
     output = capsys.readouterr()
     assert "add_device" not in output.out
     assert path_obj.exists()
+
+
+def test_cli_profile_sampler(qtbot, tmp_path):
+    path = tmp_path / "profile.json"
+    handler = signal.getsignal(signal.SIGUSR2) if hasattr(signal, "SIGUSR2") else None
+    window = typhos_cli(["ophyd.sim.SynAxis[]", "--profile-sampler", str(path)])
+    qtbot.addWidget(window)
+    with open(path) as fp:
+        assert json.load(fp)["profiles"]
+    # Signal handlers are left alone without --profile-signal
+    if hasattr(signal, "SIGUSR2"):
+        assert signal.getsignal(signal.SIGUSR2) is handler
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="Requires SIGUSR2")
+def test_cli_profile_sampler_signal(qtbot, tmp_path, monkeypatch):
+    path = tmp_path / "profile.json"
+    handler = signal.getsignal(signal.SIGUSR2)
+    monkeypatch.setattr(typhos.cli, "_signal_wakeup_timer", None)
+    try:
+        window = typhos_cli(["ophyd.sim.SynAxis[]", "--profile-sampler", str(path), "--profile-signal"])
+        qtbot.addWidget(window)
+        path.unlink()
+
+        # Toggled at runtime by signal, saving on stop
+        os.kill(os.getpid(), signal.SIGUSR2)
+        assert get_sampler().running
+        os.kill(os.getpid(), signal.SIGUSR2)
+        assert not get_sampler().running
+        assert path.exists()
+    finally:
+        signal.signal(signal.SIGUSR2, handler)
+        if typhos.cli._signal_wakeup_timer is not None:
+            typhos.cli._signal_wakeup_timer.stop()
+
+
+def test_cli_precompile_templates(tmp_path, monkeypatch):
+    cache = typhos.cache._GlobalTemplateCache(cache_dir=tmp_path)
+    monkeypatch.setattr(typhos.cache, "_GLOBAL_TEMPLATE_CACHE", cache)
+    cache_filenames = typhos_cli(["--precompile-templates", str(typhos.utils.ui_core_dir)])
+    assert len(cache_filenames) == len(list(typhos.utils.ui_core_dir.glob("*.ui")))
+    assert all(filename.parent == tmp_path for filename in cache_filenames)
+
+
+def test_create_devices_order_and_failures():
+    devices = typhos.cli.create_devices(
+        [
+            "ophyd.sim.SynAxis[{'name':'first'}]",
+            "non.Valid.ClassName[]",
+            "ophyd.sim.SynAxis[{'name':'second'}]",
+        ]
+    )
+    assert [device.name for device in devices] == ["first", "second"]
+    for device in devices:
+        conftest.clear_handlers(device)
+
+
+def test_create_devices_concurrent(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def create_device(device_name, happi_client=None, fake_devices=False):
+        # Both loads must be in progress at once to get past the barrier
+        barrier.wait()
+        return device_name
+
+    monkeypatch.setattr(typhos.cli, "_create_device", create_device)
+    assert typhos.cli.create_devices(["a", "b"]) == ["a", "b"]
+
+
+def test_create_suite_streams_devices(qtbot, monkeypatch):
+    loading = threading.Event()
+    create_device = typhos.cli._create_device
+
+    def slow_create_device(device_name, **kwargs):
+        if "second" in device_name:
+            loading.wait(timeout=5)
+        return create_device(device_name, **kwargs)
+
+    monkeypatch.setattr(typhos.cli, "_create_device", slow_create_device)
+    suite = typhos.cli.create_suite(
+        [
+            "ophyd.sim.SynAxis[{'name':'first'}]",
+            "ophyd.sim.SynAxis[{'name':'second'}]",
+        ],
+        show_displays=False,
+    )
+    qtbot.add_widget(suite)
+    # Returned with the first device, while the second is still loading
+    assert [device.name for device in suite.devices] == ["first"]
+
+    loading.set()
+
+    def second_added():
+        assert [device.name for device in suite.devices] == ["first", "second"]
+
+    qtbot.wait_until(second_added)
+    for device in suite.devices:
+        conftest.clear_handlers(device)
+
+
+def test_create_devices_preconnect(monkeypatch):
+    preconnected = []
+    monkeypatch.setattr(typhos.cli, "preconnect_device", preconnected.append)
+    devices = typhos.cli.create_devices(
+        [
+            "ophyd.sim.SynAxis[{'name':'first'}]",
+            "ophyd.sim.SynAxis[{'name':'second'}]",
+        ],
+        preconnect=True,
+    )
+    assert sorted(preconnected, key=devices.index) == devices
+    for device in devices:
+        conftest.clear_handlers(device)
+
+
+def test_cli_server_attach(qtbot, tmp_path):
+    path = str(tmp_path / "typhos.sock")
+    server = typhos.server.TyphosServer(typhos.cli.typhos_open_window, path=path)
+    server.listen()
+    assert typhos.server.is_server_running(path)
+    with pytest.raises(RuntimeError):
+        typhos.server.TyphosServer(typhos.cli.typhos_open_window, path=path).listen()
+
+    def attach(*devices):
+        # The client blocks, so it must not share the server's thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(typhos_cli, ["--attach", "--socket", path, *devices])
+            qtbot.wait_until(future.done, timeout=10000)
+            return future.result()
+
+    try:
+        reply = attach("ophyd.sim.SynAxis[{'name':'attached'}]")
+        assert reply["ok"]
+        (window,) = server.windows.values()
+        qtbot.add_widget(window)
+        assert window.centralWidget().devices[0].name == "attached"
+
+        with pytest.raises(RuntimeError):
+            attach("non.Valid.ClassName[]")
+    finally:
+        server.close()
+    assert not typhos.server.is_server_running(path)
+    conftest.clear_handlers(window.centralWidget().devices[0])
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["--attach", "--socket", "/tmp/typhos.sock", "dev"], ["dev"]),
+        (["dev", "--socket=/tmp/typhos.sock", "--attach", "--dark"], ["dev", "--dark"]),
+        (["dev", "--layout", "grid"], ["dev", "--layout", "grid"]),
+    ],
+)
+def test_cli_server_strip_client_args(argv, expected):
+    assert typhos.server.strip_client_args(argv) == expected
+
+
+def test_cli_server_invalid_request(tmp_path):
+    server = typhos.server.TyphosServer(typhos.cli.typhos_open_window, path=str(tmp_path / "typhos.sock"))
+    reply = server.handle_request(json.dumps({"argv": ["--bogus-flag"]}).encode())
+    assert reply["ok"] is False
+    assert "--bogus-flag" in reply["error"]
+    assert server.windows == {}
+
+
+def test_cli_benchmark_report(qapp, tmp_path, capsys):
+    old = tmp_path / "old.json"
+    report = typhos_cli(["--benchmark", "flat_soft", "--benchmark-report", str(old), "--benchmark-count", "2"])
+    assert list(report["cases"]) == ["flat_soft"]
+    with open(old) as fp:
+        assert json.load(fp) == report
+
+    # Every phase twice as slow
+    new = tmp_path / "new.json"
+    for samples in report["cases"]["flat_soft"].values():
+        samples[:] = [elapsed * 2 for elapsed in samples] * 3
+    report["cases"]["flat_soft"]["device"] = [0.0] * 6
+    with open(new, "w") as fp:
+        json.dump(report, fp)
+
+    comparisons = typhos_cli(["--benchmark-compare", str(old), str(new)])
+    assert {comparison.phase for comparison in comparisons if comparison.regression} == {
+        "suite",
+        "templates",
+        "paint",
+        "widgets",
+        "values",
+    }
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_cli_export_bulk(tmp_path, happi_cfg):
+    output_dir = tmp_path / "export"
+    device = "ophyd.sim.SynAxis[{'name':'bulk_motor'}]"
+    assert typhos.cli.find_happi_names(["device_class=ophyd.sim.*"], cfg=happi_cfg) == ["test_device", "test_motor"]
+
+    manifest = typhos_cli(
+        [device, "non.Valid.ClassName[]", "--happi-cfg", happi_cfg, "--export-dir", str(output_dir), "--export-query"]
+        + ["name=test_motor", "--export-workers", "2"]
+    )
+    entries = manifest["devices"]
+    assert [entries[name]["status"] for name in (device, "test_motor")] == ["exported", "exported"]
+    assert entries["non.Valid.ClassName[]"]["status"] == "failed"
+    for name in (device, "test_motor"):
+        assert (output_dir / entries[name]["filename"]).exists()
+
+    # Unchanged devices are skipped, with other entries retained
+    manifest = typhos.cli.typhos_export_bulk([device], output_dir, display_type="embedded")
+    assert manifest["devices"][device]["status"] == "skipped"
+    assert manifest["devices"]["test_motor"]["status"] == "exported"
+    with open(output_dir / typhos.cli.EXPORT_MANIFEST) as fp:
+        assert json.load(fp) == manifest
+
+    # Unless the export itself differs
+    fingerprint = manifest["devices"][device]["fingerprint"]
+    assert typhos.cli.get_export_fingerprint(device, display_type="detailed") != fingerprint
+    assert typhos.cli.get_export_fingerprint(device, display_type="embedded", backend="device") != fingerprint
+
+
+def test_cli_screenshot_batch(tmp_path, happi_cfg):
+    output_dir = tmp_path / "screenshots"
+    device = "ophyd.sim.SynAxis[{'name':'batch_motor'}]"
+    index = typhos_cli(
+        [device, "non.Valid.ClassName[]", "--happi-cfg", happi_cfg, "--screenshot-batch", str(output_dir)]
+        + ["--screenshot-query", "name=test_motor", "--screenshot-workers", "2", "--screenshot-timeout", "10"]
+    )
+    entries = index["devices"]
+    for name in (device, "test_motor"):
+        assert entries[name]["status"] == "complete"
+        assert entries[name]["ready_time"] >= 0
+        assert (output_dir / entries[name]["filename"]).stat().st_size > 0
+    assert entries["non.Valid.ClassName[]"]["status"] == "failed"
+    with open(output_dir / typhos.cli.SCREENSHOT_INDEX) as fp:
+        assert json.load(fp) == index
@@ -7,6 +7,7 @@ import pytest
 from pydm import Display
 
 import typhos.display
+import typhos.panel
 from typhos import utils
 from typhos.display import DisplayTypes, get_template_display_type
 
@@ -99,6 +100,24 @@ def test_display_with_md(motor, display):
     assert display.templates["detailed_screen"][0].name == screen
 
 
+def test_display_threaded_template_search(motor, qtbot):
+    display = typhos.display.TyphosDeviceDisplay(
+        display_type=DisplayTypes.detailed_screen,
+        threaded_template_search=True,
+    )
+    qtbot.addWidget(display)
+    screen = "engineering_screen.ui"
+    display.add_device(motor, macros={"detailed_screen": screen})
+    # A default template is shown prior to the search completing
+    assert display.current_template == typhos.display.DETAILED_TREE_TEMPLATE
+
+    def found_macro_template():
+        assert display.current_template.name == screen
+        assert display.templates["detailed_screen"][0].name == screen
+
+    qtbot.wait_until(found_macro_template)
+
+
 def test_display_type_change(motor, display):
     # Changing template type changes template
     display.add_device(motor)
@@ -106,6 +125,122 @@ def test_display_type_change(motor, display):
     assert display.current_template == display.templates["embedded_screen"][0]
 
 
+def test_display_template_widget_cache(motor, display):
+    display.template_widget_cache_size = 1
+    display.display_type = display.detailed_screen
+    # A distinct template for each display type
+    display.add_device(motor, macros={"embedded_screen": "embedded_screen.ui"})
+    detailed = display.display_widget
+    detailed_template = display.current_template
+    assert detailed_template.name == "detailed_tree.ui"
+
+    display.display_type = display.embedded_screen
+    embedded = display.display_widget
+    embedded_template = display.current_template
+    assert embedded_template.name == "embedded_screen.ui"
+    assert display.cached_templates == [detailed_template]
+
+    # Switching back reuses the widget
+    display.display_type = display.detailed_screen
+    assert display.display_widget is detailed
+    assert display.current_template == detailed_template
+    assert display.cached_templates == [embedded_template]
+
+    # Only a single widget is kept, least recently used evicted
+    display.display_type = display.engineering_screen
+    assert display.current_template.name == "engineering_screen.ui"
+    assert display.cached_templates == [detailed_template]
+    display.display_type = display.embedded_screen
+    assert display.display_widget is not embedded
+
+    # New macros invalidate the cache
+    display.macros = {"name": "new_name"}
+    assert display.cached_templates == []
+
+
+def test_display_template_widget_cache_children(motor, display):
+    display.template_widget_cache_size = 1
+    display.display_type = display.detailed_screen
+    display.add_device(motor, macros={"embedded_screen": "embedded_screen.ui"})
+    detailed = display.display_widget
+    detailed_panels = detailed.findChildren(typhos.panel.TyphosSignalPanel)
+    assert detailed_panels
+
+    # Cached widgets are not picked up by the filter menus and hide_empty
+    display.display_type = display.embedded_screen
+    assert display.cached_templates
+    assert detailed.parent() is None
+    panels = display.findChildren(typhos.panel.TyphosSignalPanel)
+    assert not set(panels) & set(detailed_panels)
+
+    # hideEmpty is applied to the reused widget
+    for panel in detailed_panels:
+        panel.nameFilter = "no_such_signal"
+    display.hideEmpty = True
+    display.display_type = display.detailed_screen
+    assert display.display_widget is detailed
+    assert not any(panel.isVisibleTo(display) for panel in detailed_panels)
+
+    display.hideEmpty = False
+    display.display_type = display.embedded_screen
+    display.display_type = display.detailed_screen
+    assert all(panel.isVisibleTo(display) for panel in detailed_panels)
+
+
+def test_display_type_change_same_template(motor, display):
+    display.add_device(motor)
+    detailed = display.display_widget
+    # Without a template of its own, the embedded screen shows the same one
+    display.display_type = display.embedded_screen
+    assert display.current_template == display.templates["detailed_screen"][0]
+    assert display.display_widget is detailed
+    assert display.cached_templates == []
+
+
+class _NormalDevice(ophyd.Device):
+    value = ophyd.Component(ophyd.Signal, kind="normal")
+
+
+class _ConfigDevice(ophyd.Device):
+    setting = ophyd.Component(ophyd.Signal, kind="config")
+
+
+class _CompositeDevice(ophyd.Device):
+    normal = ophyd.Component(_NormalDevice)
+    config = ophyd.Component(_ConfigDevice)
+
+
+def test_hide_empty(qtbot):
+    display = typhos.display.TyphosDeviceDisplay.from_device(
+        _CompositeDevice(name="composite"),
+        display_type=DisplayTypes.detailed_screen,
+    )
+    qtbot.add_widget(display)
+    panels = display.findChildren(typhos.panel.TyphosSignalPanel)
+
+    def hidden():
+        return {(panel.objectName(), tuple(panel._panel_layout.signals)): panel.isHidden() for panel in panels}
+
+    typhos.display.hide_empty(display, process_widget=False)
+    # Only the config device's panel is empty by default
+    assert sorted(hidden().values()) == [False, False, True]
+
+    for panel in panels:
+        panel.showConfig = True
+    typhos.display.hide_empty(display, process_widget=False, panels=panels)
+    assert not any(hidden().values())
+
+    for panel in panels:
+        panel.showConfig = False
+        panel.showNormal = False
+    typhos.display.hide_empty(display, process_widget=False, panels=panels)
+    incremental = hidden()
+    typhos.display.show_empty(display)
+    assert not any(hidden().values())
+    typhos.display.hide_empty(display, process_widget=False)
+    assert hidden() == incremental
+
+
 def test_display_modified_templates(display, motor):
     display.add_device(motor)
     eng_ui = display.templates["detailed_screen"]
@@ -0,0 +1,71 @@
+import ophyd
+import pytest
+from ophyd import Component as Cpt
+from ophyd import EpicsSignal, EpicsSignalRO
+from qtpy import QtWidgets
+
+import typhos.cache
+from typhos import export
+
+
+class ExportSubDevice(ophyd.Device):
+    value = Cpt(EpicsSignal, "VAL", kind="normal")
+    gain = Cpt(EpicsSignal, "GAIN", kind="config")
+
+
+class ExportDevice(ophyd.Device):
+    setpoint = Cpt(EpicsSignal, "SET", write_pv="SET_W", kind="hinted")
+    readback = Cpt(EpicsSignalRO, "RBV", kind="normal")
+    mode = Cpt(EpicsSignal, "MODE", kind="config")
+    hidden = Cpt(EpicsSignal, "HIDDEN", kind="omitted", lazy=True)
+    sub = Cpt(ExportSubDevice, "SUB:")
+
+
+@pytest.fixture(scope="function")
+def device():
+    device = ExportDevice("EXPORT:", name="export_device")
+    # Known descriptions stand in for connected signals
+    describe_cache = typhos.cache.get_global_describe_cache()
+    for signal in (device.setpoint, device.readback, device.sub.value):
+        describe_cache.cache[signal] = {"source": f"ca://{signal.pvname}", "dtype": "number", "shape": []}
+    describe_cache.cache[device.mode] = {
+        "source": f"ca://{device.mode.pvname}",
+        "dtype": "integer",
+        "shape": [],
+        "enum_strs": ("a", "b"),
+    }
+    yield device
+    describe_cache.clear()
+    typhos.cache.get_global_widget_type_cache().clear()
+    device.destroy()
+
+
+def get_widget_classes(tree):
+    return {elem.get("name"): elem.get("class") for elem in tree.getroot().iter("widget")}
+
+
+def test_from_device(qapp, device):
+    widgets_before = len(QtWidgets.QApplication.allWidgets())
+    tree = export.from_device(device, display_type="detailed_screen")
+    assert len(QtWidgets.QApplication.allWidgets()) == widgets_before
+
+    classes = get_widget_classes(tree)
+    assert classes["TyphosDisplayTitle"] == "QLabel"
+    assert classes["setpoint_readback"] == "PyDMLabel"
+    assert classes["setpoint_setpoint"] == "PyDMLineEdit"
+    assert classes["readback_readback"] == "PyDMLabel"
+    assert "readback_setpoint" not in classes
+    assert classes["mode_setpoint"] == "PyDMEnumComboBox"
+    # The sub-device is exported from its embedded template, without config
+    assert classes["value_readback"] == "PyDMLabel"
+    assert "gain_readback" not in classes
+    # Omitted, unshown lazy signals are not instantiated
+    assert "hidden" not in device._signals
+
+
+def test_export_device_as_ui(tmp_path, device):
+    filename = tmp_path / "export_device.ui"
+    export.export_device_as_ui(device, str(filename))
+    text = filename.read_text()
+    assert "ca://${prefix}SET_W" in text
+    assert "export_device" not in text
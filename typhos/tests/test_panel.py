@@ -9,7 +9,7 @@ from pydm.widgets import PyDMEnumComboBox
 from qtpy.QtWidgets import QWidget
 
 from typhos import cache, utils
-from typhos.panel import SignalPanel, TyphosSignalPanel
+from typhos.panel import SignalPanel, SignalRow, TyphosSignalPanel
 from typhos.widgets import ImageDialogButton, WaveformDialogButton, create_signal_widget
 
 from .conftest import DeadSignal, RichSignal, show_widget
@@ -126,6 +126,25 @@ def test_add_dead_signal(qtbot, panel, panel_widget):
     assert dead_sig.name in panel.signals
 
 
+def test_panel_row_records(qtbot, panel, panel_widget):
+    sig = Signal(name="record_sig", value=0)
+    row = panel.add_signal(sig, "Record")
+    info = panel.signal_name_to_info[sig.name]
+    assert isinstance(info, SignalRow)
+    assert info.row == row
+    assert info.signal is sig
+    assert info.visible
+    # Slotted records do not carry a per-instance dictionary
+    assert not hasattr(info, "__dict__")
+    # But are still accessible as the dictionaries they replaced
+    assert info["row"] == row
+    assert info["signal"] is sig
+    info["visible"] = False
+    assert info.visible is False
+    with pytest.raises(KeyError):
+        info["no_such_key"]
+
+
 @pytest.mark.xfail(reason="PVs do not exist so widgets are not created post refactor")
 def test_add_pv(qtbot, panel, panel_widget):
     row = panel.add_pv("Tst:A", "Read Only")
@@ -10,7 +10,8 @@ from pyqtgraph.parametertree import parameterTypes as ptypes
 from qtpy import QtWidgets
 
 from ..display import DisplayTypes, TyphosDeviceDisplay
-from ..suite import DeviceParameter, TyphosSuite
+from ..suite import DeviceParameter, TyphosDisplayNotCreatedError, TyphosSuite
+from ..tools import TyphosLogDisplay
 from ..utils import save_suite
 from .conftest import MockDevice, show_widget
 
@@ -30,8 +31,16 @@ def test_suite_with_child_devices(suite: TyphosSuite, device: MockDevice):
     assert device in suite.devices
     device_group = suite.top_level_groups["Devices"]
     assert len(device_group.childs) == 1
-    child_displays = device_group.childs[0].childs
+    device_param = device_group.childs[0]
+    # Children are only created once expanded in the tree
+    assert device_param.children_pending
+    assert [child.name() for child in device_param.childs] == [DeviceParameter.placeholder_name]
+    for item in device_param.items:
+        item.setExpanded(True)
+    assert not device_param.children_pending
+    child_displays = device_param.childs
     assert len(child_displays) == len(device._sub_devices)
+    assert suite._find_parameter(device.x) in child_displays
     return suite
 
 
@@ -56,6 +65,32 @@ def test_suite_tools(
     assert len(suite.tools[0].devices) == 1
 
 
+def test_suite_tools_deferred(qtbot: pytestqt.qtbot.QtBot):
+    devices = [MockDevice(name=f"deferred{idx}") for idx in range(3)]
+    suite = TyphosSuite.from_devices(devices, tools={"Log": TyphosLogDisplay}, show_displays=False)
+    qtbot.addWidget(suite)
+    tool = suite.get_subdisplay("Log")
+    # Not populated until shown
+    assert tool.widget is None
+    assert tool.pending_devices == devices
+
+    # Fed in batches once created, as when first shown
+    tool.batch_size = 2
+    tool._create_widget()
+    assert tool.widget.devices == devices[:2]
+
+    def all_added():
+        assert tool.widget.devices == devices
+
+    qtbot.wait_until(all_added)
+    assert tool.pending_devices == []
+
+    # Later devices are added to the created tool
+    device = MockDevice(name="deferred_late")
+    suite.add_device(device)
+    qtbot.wait_until(lambda: tool.widget.devices[-1] is device)
+
+
 def test_suite_get_subdisplay_by_device(suite: TyphosSuite, device: MockDevice):
     display = suite.get_subdisplay(device)
     assert device in display.devices
@@ -126,6 +161,98 @@ def test_suite_hide_subdisplays(
         assert display.parent().isHidden()
 
 
+def test_suite_sidebar_index(suite: TyphosSuite, device: MockDevice, qtbot: pytestqt.qtbot.QtBot):
+    device_param = suite.top_level_groups["Devices"].childs[0]
+    x_param = suite._find_parameter(device.x)
+    assert x_param in device_param.childs
+    assert suite._find_parameter(device.name) is device_param
+
+    display = suite.get_subdisplay(device.x)
+    qtbot.add_widget(display)
+    assert suite._get_sidebar(display) is x_param
+
+    # Removed parameters are no longer found
+    device_param.remove()
+    assert suite._get_sidebar(display) is None
+    assert suite._find_parameter(device.x) is None
+    with pytest.raises(ValueError):
+        suite.get_subdisplay(device)
+
+
+def test_suite_find_parameter_lazy(suite: TyphosSuite, device: MockDevice):
+    device_param = suite.top_level_groups["Devices"].childs[0]
+    assert device_param.children_pending
+    # Names which cannot be those of its sub devices create no children
+    assert suite._find_parameter("typo") is None
+    assert device_param.children_pending
+
+    x_param = suite._find_parameter(device.x.name)
+    assert x_param in device_param.childs
+    assert x_param.has_device(device.x)
+
+
+def test_suite_evict_max_resident(
+    qtbot: pytestqt.qtbot.QtBot,
+    suite: TyphosSuite,
+    device: MockDevice,
+):
+    suite.max_resident_subdisplays = 2
+    x_display = suite.show_subdisplay(device.x)
+    suite.show_subdisplay(device.y)
+    assert suite.subdisplay_report()["resident"] == 3
+    # Shown subdisplays are never evicted
+    assert suite.evict_subdisplays() == 0
+
+    suite.hide_subdisplay(device.x)
+    report = suite.subdisplay_report()
+    assert report["resident"] == 2
+    assert report["evicted"] == 1
+    with pytest.raises(TyphosDisplayNotCreatedError):
+        suite.get_subdisplay(device.x, instantiate=False)
+
+    # Evicted subdisplays are created again when next shown
+    new_display = suite.show_subdisplay(device.x)
+    assert new_display is not x_display
+    assert device.x in new_display.devices
+
+
+def test_suite_evict_tools(
+    qtbot: pytestqt.qtbot.QtBot,
+    suite: TyphosSuite,
+    device: MockDevice,
+):
+    suite.max_resident_subdisplays = 0
+    suite.add_tool("Log", TyphosLogDisplay)
+    log = suite.show_subdisplay("Log")
+    suite.hide_subdisplay("Log")
+    # Tools keep their history
+    assert suite.subdisplay_report()["evicted"] == 0
+    assert suite.get_subdisplay("Log", instantiate=False) is log
+
+    suite.show_subdisplay(device.x)
+    assert suite._report_param.value().startswith("2")
+    suite.hide_subdisplay(device.x)
+    assert suite.subdisplay_report()["evicted"] == 1
+    assert suite._report_param.value().startswith("1")
+
+
+def test_suite_evict_hidden_after(
+    qtbot: pytestqt.qtbot.QtBot,
+    suite: TyphosSuite,
+    device: MockDevice,
+):
+    suite.evict_hidden_after = 0.1
+    suite.show_subdisplay(device.x)
+    suite.hide_subdisplay(device.x)
+    assert suite.subdisplay_report()["hidden"] == 1
+
+    def evicted():
+        assert suite.subdisplay_report()["evicted"] == 1
+
+    qtbot.wait_until(evicted)
+    assert suite.subdisplay_report()["hidden"] == 0
+
+
 def test_device_parameter_tree(
     motor,
     device,
@@ -143,6 +270,14 @@ def test_device_parameter_tree(
     dev_param = DeviceParameter(device, emeddable=True)
     assert len(dev_param.childs) == len(device._sub_devices)
     devices.addChild(dev_param)
+    # Lazily created children
+    lazy_devices = ptypes.GroupParameter(name="Lazy")
+    tree.addParameters(lazy_devices)
+    lazy_param = DeviceParameter(device, lazy=True)
+    assert len(lazy_param.childs) == 1
+    lazy_devices.addChild(lazy_param)
+    lazy_param.populate_children()
+    assert len(lazy_param.childs) == len(device._sub_devices)
 
 
 def test_suite_embed_device(suite: TyphosSuite, device: MockDevice):
@@ -7,8 +7,9 @@ import tempfile
 import pytest
 import pytestqt.qtbot
 from ophyd import Component as Cpt
-from ophyd import Device
-from qtpy.QtCore import QRect
+from ophyd import Device, Signal
+from pydm.widgets import PyDMLabel
+from qtpy.QtCore import QRect, Qt
 from qtpy.QtGui import QColor, QPaintEvent, QPalette
 from qtpy.QtWidgets import QLineEdit, QWidget
 
@@ -18,6 +19,7 @@ from ..utils import (
     TyphosBase,
     apply_standard_stylesheets,
     clean_name,
+    clear_stylesheet_cache,
     compose_stylesheets,
     load_suite,
     no_device_lazy_load,
@@ -84,6 +86,22 @@ def test_compose_stylesheets(qtbot: pytestqt.qtbot.QtBot, qapp):
     assert blue_widget.palette().color(QPalette.Text).name() == QColor("blue").name()
 
 
+def test_compose_stylesheets_cached(tmp_path: pathlib.Path):
+    clear_stylesheet_cache()
+    sheet = tmp_path / "cached.qss"
+    sheet.write_text("QLineEdit { color: red }")
+    composed = compose_stylesheets([sheet, "QLabel { color: blue }"])
+    assert compose_stylesheets([sheet, "QLabel { color: blue }"]) is composed
+
+    # Modified files are read again
+    sheet.write_text("QLineEdit { color: green }")
+    os.utime(sheet, ns=(0, 0))
+    recomposed = compose_stylesheets([sheet, "QLabel { color: blue }"])
+    assert "green" in recomposed
+    assert "red" not in recomposed
+    clear_stylesheet_cache()
+
+
 @pytest.mark.parametrize("dark", [True, False])
 @pytest.mark.parametrize("include_pydm", [True, False])
 @pytest.mark.parametrize("pydm_include_default", [True, False])
@@ -155,6 +173,53 @@ def test_stylesheet_legacy(qtbot: pytestqt.qtbot.QtBot):
     use_stylesheet(widget=widget, dark=True)
 
 
+def test_stylesheet_reload_scheduler(qtbot: pytestqt.qtbot.QtBot, monkeypatch):
+    reloaded = []
+    monkeypatch.setattr(
+        utils, "reload_widget_stylesheet", lambda widget, cascade=False: reloaded.append((widget, cascade))
+    )
+    scheduler = utils.StylesheetReloadScheduler()
+
+    parent = QWidget()
+    qtbot.add_widget(parent)
+    child = QLineEdit(parent)
+    sibling = QLineEdit(parent)
+    unshown = QWidget()
+    qtbot.add_widget(unshown)
+    parent.show()
+    qtbot.wait_exposed(parent)
+
+    # Batched until the next event loop iteration, each widget once
+    scheduler.schedule(child)
+    scheduler.schedule(sibling)
+    scheduler.schedule(child)
+    assert scheduler.pending == 2
+    assert reloaded == []
+    qtbot.wait_until(lambda: scheduler.pending == 0)
+    assert len(reloaded) == 2
+    assert set(reloaded) == {(child, False), (sibling, False)}
+
+    # Collapsed into the topmost scheduled ancestor, which cascades
+    reloaded.clear()
+    scheduler.schedule(child)
+    scheduler.schedule(parent)
+    scheduler.schedule(sibling)
+    scheduler.flush()
+    assert reloaded == [(parent, True)]
+
+    # Widgets Qt has not yet polished are skipped
+    reloaded.clear()
+    unshown.setAttribute(Qt.WA_WState_Polished, False)
+    scheduler.schedule(unshown)
+    scheduler.flush()
+    assert reloaded == []
+
+    reloaded.clear()
+    scheduler.enabled = False
+    scheduler.schedule(child)
+    assert reloaded == [(child, False)]
+
+
 def test_typhosbase_repaint_smoke(qtbot: pytestqt.qtbot.QtBot):
     tp = TyphosBase()
     qtbot.addWidget(tp)
@@ -206,6 +271,22 @@ def test_no_device_lazy_load():
     assert dev.c.lazy_wait_for_connection is old_val
 
 
+class _LazyDevice(Device):
+    lazy = Cpt(Signal, lazy=True)
+    omitted = Cpt(Signal, lazy=True, kind="omitted")
+    sub = Cpt(Device, lazy=True)
+
+
+def test_preconnect_device():
+    device = _LazyDevice(name="preconnect")
+    assert not device._signals
+    future = utils.preconnect_device(device, timeout=5)
+    # Only lazy signals shown by the default templates are instantiated
+    assert set(device._signals) == {"lazy"}
+    future.result(timeout=5)
+    assert device.lazy.connected
+
+
 class Class1: ...
 
 
@@ -287,3 +368,35 @@ def test_take_top_level_widget_screenshots(qtbot: pytestqt.qtbot.QtBot):
         # Remove any traces of references to those widgets:
     finally:
         screenshots.clear()
+
+
+def test_widgets_loaded(qtbot: pytestqt.qtbot.QtBot):
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    assert utils.widgets_loaded(widget, values=False)
+    # Values are not loaded until there is a channel widget with one
+    assert not utils.widgets_loaded(widget, values=True)
+
+    loading = utils.TyphosLoading("Timed out", parent=widget)
+    assert not utils.widgets_loaded(widget, values=False)
+    assert not utils.wait_for_widgets_loaded(widget, timeout=0.01, values=False)
+    loading.setParent(None)
+    assert utils.wait_for_widgets_loaded(widget, timeout=0.01, values=False)
+
+    label = PyDMLabel(parent=widget, init_channel="ca://typhos:never_connected")
+    assert not utils.widgets_loaded(widget, values=True)
+    label._connected = True
+    label.value = 1.0
+    assert utils.widgets_loaded(widget, values=True)
+
+
+def test_connection_status_monitor_initial_objects():
+    signal = Signal(name="monitored_signal")
+    updates = []
+
+    def callback(obj, connected, **kwargs):
+        updates.append((obj, connected))
+
+    with utils.connection_status_monitor(signal, callback=callback) as status:
+        assert status.objects == {signal}
+    assert updates == [(signal, True)]
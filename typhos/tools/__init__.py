@@ -1,6 +1,20 @@
 """Module for all insertable Typhos tools"""
 
+import importlib
+
 __all__ = ["TyphosLogDisplay", "TyphosTimePlot"]
 
-from .log import TyphosLogDisplay
-from .plot import TyphosTimePlot
+# Tools are imported on first use, as the plot pulls in timechart
+_lazy_attributes = {
+    "TyphosLogDisplay": "log",
+    "TyphosTimePlot": "plot",
+}
+
+
+def __getattr__(name):
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
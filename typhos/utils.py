@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import atexit
 import collections
+import concurrent.futures
 import contextlib
 import functools
 import importlib.util
@@ -19,6 +20,7 @@ import pathlib
 import random
 import re
 import threading
+import time
 import weakref
 from types import MethodType
 from typing import Dict, Generator, Iterable, Optional
@@ -33,7 +35,7 @@ from pydm.config import STYLESHEET as PYDM_USER_STYLESHEET
 from pydm.config import STYLESHEET_INCLUDE_DEFAULT as PYDM_INCLUDE_DEFAULT
 from pydm.exception import raise_to_operator  # noqa
 from pydm.utilities.stylesheet import GLOBAL_STYLESHEET as PYDM_DEFAULT_STYLESHEET
-from pydm.widgets.base import PyDMWritableWidget
+from pydm.widgets.base import PyDMWidget, PyDMWritableWidget
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import QSize
 from qtpy.QtGui import QColor, QMovie, QPainter
@@ -41,10 +43,8 @@ from qtpy.QtWidgets import QWidget
 
 from . import plugins
 
-try:
-    import happi
-except ImportError:
-    happi = None
+# happi is slow to import, so only check that it is available here
+has_happi = importlib.util.find_spec("happi") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -88,7 +88,7 @@ JIRA_EMAIL_SUFFIX = os.environ.get("TYPHOS_JIRA_EMAIL_SUFFIX", "").strip()
 if JIRA_TOKEN:
     JIRA_HEADERS["Authorization"] = f"Bearer {JIRA_TOKEN}"
 
-if happi is None:
+if not has_happi:
     logger.info("happi is not installed; some features may be unavailable")
 
 
@@ -254,9 +254,7 @@ def use_stylesheet(
     """
     # Dark Style
     if dark:
-        import qdarkstyle
-
-        style = qdarkstyle.load_stylesheet_pyqt5()
+        style = _load_dark_stylesheet()
     # Light Style
     else:
         # Load the path to the file
@@ -264,8 +262,7 @@ def use_stylesheet(
         if not os.path.exists(style_path):
             raise OSError("Unable to find Typhos stylesheet in {}".format(style_path))
         # Load the stylesheet from the file
-        with open(style_path) as handle:
-            style = handle.read()
+        style = _read_stylesheet_file(pathlib.Path(style_path))
     if widget is None:
         widget = QtWidgets.QApplication.instance()
     # We can set Fusion style if it is an application
@@ -276,6 +273,51 @@ def use_stylesheet(
     widget.setStyleSheet(style)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_dark_stylesheet() -> str:
+    """Load the QDarkStyleSheet stylesheet, once per process."""
+    import qdarkstyle
+
+    return qdarkstyle.load_stylesheet_pyqt5()
+
+
+# {path: ((st_mtime_ns, st_size), contents)}
+_stylesheet_file_cache: Dict[pathlib.Path, tuple] = {}
+# {((path, st_mtime_ns, st_size) or stylesheet, ...): composed_stylesheet}
+_composed_stylesheet_cache: collections.OrderedDict = collections.OrderedDict()
+_COMPOSED_STYLESHEET_CACHE_SIZE = 16
+
+
+def _get_stylesheet_file_stamp(path: pathlib.Path) -> tuple[int, int]:
+    """Get a key that changes when the stylesheet file does."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_stylesheet_file(path: pathlib.Path, stamp: tuple[int, int] | None = None) -> str:
+    """Read a stylesheet file, re-using the contents if it is unmodified."""
+    if stamp is None:
+        stamp = _get_stylesheet_file_stamp(path)
+    try:
+        cached_stamp, contents = _stylesheet_file_cache[path]
+    except KeyError:
+        ...
+    else:
+        if cached_stamp == stamp:
+            return contents
+
+    with path.open() as fd:
+        contents = fd.read()
+    _stylesheet_file_cache[path] = (stamp, contents)
+    return contents
+
+
+def clear_stylesheet_cache() -> None:
+    """Clear the caches of stylesheet files and composed stylesheets."""
+    _stylesheet_file_cache.clear()
+    _composed_stylesheet_cache.clear()
+
+
 def compose_stylesheets(stylesheets: Iterable[str | pathlib.Path]) -> str:
     """
     Combine multiple qss stylesheets into one qss stylesheet.
@@ -310,18 +352,42 @@ def compose_stylesheets(stylesheets: Iterable[str | pathlib.Path]) -> str:
         If any error is encountered while reading a file
     TypeError
         If the input is not a valid type
+
+    Notes
+    -----
+    Files are only read again if modified, and the composed result for
+    recently-used inputs is cached.
     """
-    style_parts = []
+    key = []
     for sheet in stylesheets:
         path = pathlib.Path(sheet)
         if isinstance(sheet, pathlib.Path) or path.suffix == ".qss":
-            with path.open() as fd:
-                style_parts.append(fd.read())
+            key.append((path, *_get_stylesheet_file_stamp(path)))
         elif isinstance(sheet, str):
-            style_parts.append(sheet)
+            key.append(sheet)
         else:
             raise TypeError(f"Invalid input {sheet} of type {type(sheet)}")
-    return "\n".join(reversed(style_parts))
+
+    key = tuple(key)
+    try:
+        _composed_stylesheet_cache.move_to_end(key)
+        return _composed_stylesheet_cache[key]
+    except KeyError:
+        ...
+
+    style_parts = []
+    for item in key:
+        if isinstance(item, tuple):
+            path, *stamp = item
+            style_parts.append(_read_stylesheet_file(path, tuple(stamp)))
+        else:
+            style_parts.append(item)
+
+    composed = "\n".join(reversed(style_parts))
+    _composed_stylesheet_cache[key] = composed
+    while len(_composed_stylesheet_cache) > _COMPOSED_STYLESHEET_CACHE_SIZE:
+        _composed_stylesheet_cache.popitem(last=False)
+    return composed
 
 
 def apply_standard_stylesheets(
@@ -372,9 +438,7 @@ def apply_standard_stylesheets(
         stylesheets.extend(PYDM_USER_STYLESHEET.split(os.pathsep))
 
     if dark:
-        import qdarkstyle
-
-        stylesheets.append(qdarkstyle.load_stylesheet_pyqt5())
+        stylesheets.append(_load_dark_stylesheet())
     else:
         stylesheets.append(ui_dir / "style.qss")
 
@@ -569,6 +633,10 @@ class WeakPartialMethodSlot:
         If reused beyond the TyphosSuite, this class may need revisiting in the
         future.
         """
+        if self.method is None:
+            # Destroyed with a queued call still pending
+            return
+
         method = self.method()
         if method is None:
             self._method_destroyed()
@@ -657,6 +725,106 @@ def reload_widget_stylesheet(widget, cascade=False):
                 reload_widget_stylesheet(child, cascade=True)
 
 
+class StylesheetReloadScheduler(QtCore.QObject):
+    """
+    Batches stylesheet reloads, applying them once per event loop iteration.
+
+    Widgets scheduled any number of times before the next event loop
+    iteration are re-polished only once.  Widgets with a scheduled ancestor
+    are collapsed into the topmost one, which is then re-polished along with
+    all of its children in a single pass.  Widgets that Qt has yet to polish,
+    or that live under such a widget, are skipped entirely: Qt polishes them
+    when they are first shown.
+
+    Use :func:`schedule_widget_stylesheet_reload` rather than instantiating
+    this directly.
+
+    Attributes
+    ----------
+    enabled : bool
+        If False, reloads are applied immediately when scheduled.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.enabled = True
+        # {widget: cascade}
+        self._pending = weakref.WeakKeyDictionary()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self, widget: QWidget, cascade: bool = False) -> None:
+        """Schedule a stylesheet reload of ``widget``."""
+        if not self.enabled:
+            reload_widget_stylesheet(widget, cascade=cascade)
+            return
+
+        self._pending[widget] = cascade or self._pending.get(widget, False)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @property
+    def pending(self) -> int:
+        """The number of widgets pending a reload."""
+        return len(self._pending)
+
+    @QtCore.Slot()
+    def flush(self) -> None:
+        """Apply all pending stylesheet reloads now."""
+        self._timer.stop()
+        pending = dict(self._pending)
+        self._pending.clear()
+
+        # Fold each widget into its topmost scheduled ancestor, which then
+        # cascades to cover it
+        roots = {}
+        for widget, cascade in pending.items():
+            root = widget
+            try:
+                parent = widget.parentWidget()
+            except RuntimeError:
+                # Deleted on the C++ side in the meantime
+                continue
+            while parent is not None:
+                if parent in pending:
+                    root = parent
+                parent = parent.parentWidget()
+            roots[root] = roots.get(root, False) or cascade or root is not widget
+
+        for root, cascade in roots.items():
+            parent = root
+            while parent is not None:
+                if not parent.testAttribute(QtCore.Qt.WA_WState_Polished):
+                    # Qt will polish this when it is shown
+                    break
+                parent = parent.parentWidget()
+            else:
+                reload_widget_stylesheet(root, cascade=cascade)
+
+
+_stylesheet_reload_scheduler = None
+
+
+def get_stylesheet_reload_scheduler() -> StylesheetReloadScheduler:
+    """Get the global :class:`StylesheetReloadScheduler`."""
+    global _stylesheet_reload_scheduler
+    if _stylesheet_reload_scheduler is None:
+        _stylesheet_reload_scheduler = StylesheetReloadScheduler()
+    return _stylesheet_reload_scheduler
+
+
+def schedule_widget_stylesheet_reload(widget, cascade=False):
+    """
+    Reload the stylesheet of the provided widget at the next opportunity.
+
+    Multiple requests prior to the next event loop iteration are batched;
+    see :class:`StylesheetReloadScheduler`.
+    """
+    get_stylesheet_reload_scheduler().schedule(widget, cascade=cascade)
+
+
 def save_suite(suite, file_or_buffer):
     """
     Create a file capable of relaunching the TyphosSuite
@@ -735,6 +903,85 @@ def no_device_lazy_load():
         Device.lazy_wait_for_connection = old_val
 
 
+# Default time to wait for pre-connected device signals, in seconds
+DEFAULT_PRECONNECT_TIMEOUT = 10.0
+# Maximum number of devices waited on for pre-connection at once
+PRECONNECT_WORKERS = 4
+_preconnect_executor = None
+
+
+def _get_preconnect_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """The thread pool shared by all pre-connections."""
+    global _preconnect_executor
+    if _preconnect_executor is None:
+        _preconnect_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=PRECONNECT_WORKERS,
+            thread_name_prefix="typhos_preconnect",
+        )
+    return _preconnect_executor
+
+
+def _instantiate_shown_signals(device: Device) -> None:
+    """
+    Instantiate the lazy signals of ``device`` shown by the default templates.
+
+    These are those of any kind but omitted, on ``device`` and its
+    sub-devices that already exist.  Lazy sub-devices are left alone.
+    """
+    for attr, cpt in device._sig_attrs.items():
+        if attr in device._signals:
+            signal = device._signals[attr]
+            if isinstance(signal, Device):
+                _instantiate_shown_signals(signal)
+        elif not issubclass(cpt.cls, Device) and cpt.kind != ophyd.Kind.omitted:
+            getattr(device, attr)
+
+
+def _wait_for_connection(device, timeout):
+    """Wait for the instantiated signals of ``device`` to connect, logging the outcome."""
+    t0 = time.monotonic()
+    try:
+        device.wait_for_connection(timeout=timeout)
+    except TimeoutError as ex:
+        logger.warning("%r did not connect within %.1f s: %s", device.name, timeout, ex)
+    except Exception:
+        logger.exception("Failed to pre-connect %r", device.name)
+    else:
+        logger.debug("Pre-connected %r in %.2f s", device.name, time.monotonic() - t0)
+
+
+def preconnect_device(device, timeout=DEFAULT_PRECONNECT_TIMEOUT) -> concurrent.futures.Future:
+    """
+    Start connecting the signals of ``device`` in the background.
+
+    Signals connect as soon as they are instantiated.  In addition to those
+    which already exist, the lazy signals shown by the default templates -
+    those not of the omitted kind - are instantiated in the calling thread.
+    This should happen before ``device`` is handed to any display, as ophyd
+    does not guard against lazy signals being instantiated from two threads
+    at once.  A shared, bounded thread pool then waits for the connections
+    to complete, logging any which do not.
+
+    By the time widgets subscribe to the signals, their values and metadata
+    are then likely to already be cached.
+
+    Parameters
+    ----------
+    device : ophyd.Device or ophyd.Signal
+        The device to connect.
+    timeout : float, optional
+        The time to wait for the signals to connect, in seconds.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Completes once the signals are connected or ``timeout`` expires.
+    """
+    if isinstance(device, Device):
+        _instantiate_shown_signals(device)
+    return _get_preconnect_executor().submit(_wait_for_connection, device, timeout)
+
+
 def pyqt_class_from_enum(enum):
     """
     Create an inheritable base class from a Python Enum, which can also be used
@@ -950,7 +1197,7 @@ def code_from_device(device):
     Generate code required to load ``device`` in another process
     """
     is_fake = is_fake_device_class(device.__class__)
-    if happi is None or not hasattr(device, "md") or is_fake:
+    if not has_happi or not hasattr(device, "md") or is_fake:
         return code_from_device_repr(device)
 
     happi_name = device.md.name
@@ -1155,10 +1402,14 @@ def connection_status_monitor(*signals, callback):
     """
 
     status = _ConnectionStatus(callback)
+    # Callbacks are only passed on for monitored objects, including those
+    # run upon subscription
+    status.objects.update(signals)
 
     with subscription_context(
         *signals, callback=status._connection_callback, event_type="meta", run=True
     ) as status.obj_to_cid:
+        status.objects.intersection_update(status.obj_to_cid)
         for sig in signals:
             status._run_callback_hack_on_object(sig)
 
@@ -1521,6 +1772,14 @@ def patch_connect_slots():
     QtCore.QMetaObject.connectSlotsByName = connect_slots_patch
 
 
+# **NOTE** We patch QtCore.QMetaObject.connectSlotsByName to catch SystemError
+# exceptions.  This happens on import of this module, which all typhos widgets
+# rely upon, rather than on ``import typhos``.
+# We know this is not a good practice to do on import.  If you have a better
+# solution, do let us know.
+patch_connect_slots()
+
+
 def link_signal_to_widget(signal, widget):
     """
     Registers the signal with PyDM, and sets the widget channel.
@@ -1672,6 +1931,20 @@ class FrameOnEditFilter(QtCore.QObject):
         object.setReadOnly(True)
 
 
+def get_process_rss() -> Optional[int]:
+    """
+    Get the resident set size of this process in bytes.
+
+    Returns ``None`` where unavailable, i.e., on platforms without ``/proc``.
+    """
+    try:
+        with open("/proc/self/statm") as fp:
+            resident_pages = int(fp.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
 def take_widget_screenshot(widget: QtWidgets.QWidget) -> Optional[QtGui.QImage]:
     """Take a screenshot of the given widget, returning a QImage."""
 
@@ -1701,6 +1974,54 @@ def take_widget_screenshot(widget: QtWidgets.QWidget) -> Optional[QtGui.QImage]:
         return None
 
 
+def widgets_loaded(widget: QtWidgets.QWidget, values: bool = True) -> bool:
+    """
+    Whether ``widget`` and its children have finished loading.
+
+    That is, all device displays have loaded a template and no signal rows
+    are waiting on their widgets.  With ``values``, there must also be at
+    least one channel widget, and all of them must be connected and have
+    received a value.
+    """
+    # typhos.display imports this module at import time
+    from .display import TyphosDeviceDisplay
+
+    if widget.findChildren(TyphosLoading):
+        return False
+
+    children = widget.findChildren(QtWidgets.QWidget)
+    displays = [child for child in [widget, *children] if isinstance(child, TyphosDeviceDisplay)]
+    if any(display.display_widget is None for display in displays):
+        return False
+
+    if not values:
+        return True
+
+    widgets = [child for child in children if isinstance(child, PyDMWidget) and child.channel]
+    return bool(widgets) and all(widget._connected and widget.value is not None for widget in widgets)
+
+
+def wait_for_widgets_loaded(widget: QtWidgets.QWidget, timeout: float, values: bool = True) -> bool:
+    """
+    Process Qt events until ``widget`` has loaded, or ``timeout`` seconds.
+
+    See :func:`widgets_loaded`.
+
+    Returns
+    -------
+    loaded : bool
+        False if the timeout elapsed first.
+    """
+    app = QtWidgets.QApplication.instance()
+    deadline = time.monotonic() + timeout
+    while not widgets_loaded(widget, values=values):
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.001)
+    return True
+
+
 def take_top_level_widget_screenshots(
     *,
     visible_only: bool = True,
@@ -1771,6 +2092,10 @@ def load_ui_file(
     """
     Load a .ui file, perform macro substitution, then return the resulting QWidget.
 
+    The compiled form of the .ui file is cached by way of the global template
+    cache, such that only macro substitution and widget creation happen on
+    repeated loads.
+
     Parameters
     ----------
     uifile : str
@@ -1782,10 +2107,16 @@ def load_ui_file(
     -------
     pydm.Display
     """
+    from .cache import get_global_template_cache
 
     display = pydm.Display(macros=macros)
     try:
-        display.load_ui_from_file(uifile, macros)
+        # Equivalent to display.load_ui_from_file(uifile, macros)
+        display._loaded_file = uifile
+        klass = get_global_template_cache().get(uifile).get_ui_class(macros)
+        display.retranslateUi = functools.partial(klass.retranslateUi, display)
+        klass.setupUi(display, display)
+        display.ui = display
     except Exception as ex:
         ex.pydm_display = display
         raise